@@ -0,0 +1 @@
+"""Performans ölçüm betikleri - `python -m benchmarks.<betik>` ile çalıştırılır"""
@@ -0,0 +1,116 @@
+"""
+Parça Parça Versiyon Düzeltme Benchmark'ı
+Büyük bir CSV'yi tamamen belleğe alan process_version_fixing ile iki geçişli process_version_fixing_chunked'ı
+ayrı süreçlerde çalıştırıp süre ve en yüksek bellek (max RSS) ölçer; iki çıktının aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_chunked_version_fix
+    python -m benchmarks.bench_chunked_version_fix --rows 2000000 --chunk-size 100000 200000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_ROWS = 2_000_000
+DEFAULT_CHUNK_SIZES = (100_000,)
+
+def write_history_csv(path, rows, chunk_rows=250_000):
+    """Yorum metinli sentetik Play Store CSV'si - üretim sırasında da bellekte tek parça tutulur"""
+    from benchmarks.bench_version_fix import make_version_history
+
+    history = make_version_history(rows).sort_values('date', kind='stable').reset_index(drop=True)
+    rng = np.random.default_rng(1)
+    words = np.array(['uygulama', 'güncelleme', 'hata', 'çok', 'güzel', 'yavaş', 'giriş', 'yapamıyorum', 'reklam'])
+    for start in range(0, rows, chunk_rows):
+        chunk = history.iloc[start:start + chunk_rows].copy()
+        chunk.insert(0, 'review_id', [f"gp:{i}" for i in range(start, start + len(chunk))])
+        chunk['content'] = [' '.join(rng.choice(words, 12)) for _ in range(len(chunk))]
+        chunk['helpful_count'] = rng.integers(0, 50, len(chunk))
+        chunk.to_csv(path, mode='w' if start == 0 else 'a', index=False, header=start == 0)
+
+def child(mode, input_path, output_path, chunk_size):
+    """Ölçülen süreç: tek modu çalıştır, süre ve max RSS'i JSON olarak yaz"""
+    from streamlit_compat import set_headless
+    set_headless(True)
+    from review_io import read_reviews_file
+    from streamlit_version_fixer import process_version_fixing, process_version_fixing_chunked
+
+    started = time.perf_counter()
+    if mode == 'bellekte':
+        df, results = process_version_fixing(read_reviews_file(input_path), show_progress=False)
+        df.to_csv(output_path, index=False)
+    else:
+        results = process_version_fixing_chunked(input_path, output_path, chunk_size=chunk_size)
+    seconds = time.perf_counter() - started
+    assert 'error' not in results, results.get('error')
+
+    print(json.dumps({
+        'seconds': seconds,
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'updated_count': int(results['updated_count']),
+    }))
+
+def measure(mode, input_path, output_path, chunk_size):
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_chunked_version_fix', '--child', mode,
+         input_path, output_path, str(chunk_size)],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{mode} başarısız:\n{completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def same_versions(expected_path, result_path, chunk_size=500_000):
+    """İki çıktının app_version sütunu birebir aynı mı - parça parça karşılaştırılır"""
+    read = dict(usecols=['app_version'], dtype=str, keep_default_na=False, chunksize=chunk_size)
+    with pd.read_csv(expected_path, **read) as expected, pd.read_csv(result_path, **read) as result:
+        for expected_chunk, result_chunk in zip(expected, result):
+            if expected_chunk['app_version'].tolist() != result_chunk['app_version'].tolist():
+                return False
+    return True
+
+def run(rows, chunk_sizes):
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'history.csv')
+        write_history_csv(input_path, rows)
+        print(f"Girdi: {rows:,} satır, {os.path.getsize(input_path) / 1024 / 1024:.0f} MB CSV")
+        print(f"{'mod':>22} {'süre (sn)':>10} {'max RSS (MB)':>13}")
+
+        expected_path = os.path.join(work_dir, 'bellekte.csv')
+        baseline = measure('bellekte', input_path, expected_path, 0)
+        print(f"{'bellekte':>22} {baseline['seconds']:>10.1f} {baseline['max_rss_mb']:>13,.0f}")
+
+        for chunk_size in chunk_sizes:
+            output_path = os.path.join(work_dir, f'parca_{chunk_size}.csv')
+            result = measure('parça', input_path, output_path, chunk_size)
+            print(f"{f'parça ({chunk_size:,})':>22} {result['seconds']:>10.1f} {result['max_rss_mb']:>13,.0f}")
+            assert result['updated_count'] == baseline['updated_count'], "Güncellenen satır sayısı farklı"
+            assert same_versions(expected_path, output_path), f"Çıktı farklı (parça {chunk_size})"
+    print("✅ Parça parça çıktı bellekte düzeltmeyle aynı")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == '--child':
+        mode, input_path, output_path, chunk_size = argv[1:5]
+        child(mode, input_path, output_path, int(chunk_size))
+        return
+
+    parser = argparse.ArgumentParser(description="Parça parça versiyon düzeltme benchmark'ı")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--chunk-size', type=int, nargs='+', default=list(DEFAULT_CHUNK_SIZES))
+    args = parser.parse_args(argv)
+    run(args.rows, args.chunk_size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Dışa Aktarma Benchmark'ı
+Eski satır satır TXT / tek parça JSON üretimini parça parça yazıcılarla karşılaştırır.
+
+Kullanım:
+    python -m benchmarks.bench_exports
+    python -m benchmarks.bench_exports --rows 10000 100000 1000000 --legacy-max-rows 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from export_utils import export_to_bytes, write_json_records, write_txt_records
+
+DEFAULT_ROWS = (10_000, 100_000, 1_000_000)
+DEFAULT_LEGACY_MAX_ROWS = 100_000
+
+TXT_FIELDS = [
+    ("Yorum", ['translated_text', 'content']),
+    ("Puan", ['rating']),
+    ("Versiyon", ['app_version']),
+    ("Yararlı", ['helpful_count']),
+    ("Tarih", ['date']),
+]
+
+def make_reviews(rows, seed=42):
+    """Versiyon düzelticinin çıktısına benzeyen sentetik yorum verisi"""
+    rng = np.random.default_rng(seed)
+    words = np.array(["uygulama", "bilet", "çok", "yavaş", "güzel", "hata", "ödeme", "giriş", "tren", "sefer"])
+    content = pd.Series([" ".join(rng.choice(words, 12)) for _ in range(rows)])
+    return pd.DataFrame({
+        'content': content,
+        'translated_text': content.str.upper(),
+        'rating': rng.integers(1, 6, rows),
+        'app_version': pd.Series(rng.integers(1, 40, rows)).map(lambda v: f"3.{v}.0"),
+        'helpful_count': rng.integers(0, 50, rows),
+        'date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365 * 24, rows), unit='h'),
+    })
+
+def legacy_txt(df):
+    """Eski create_txt_content: iterrows + string birleştirme"""
+    txt_content = ""
+    for _, row in df.iterrows():
+        txt_content += f"Yorum: {row.get('translated_text', row.get('content', 'N/A'))}\n"
+        txt_content += f"Puan: {row.get('rating', 'N/A')}\n"
+        txt_content += f"Versiyon: {row.get('app_version', 'N/A')}\n"
+        txt_content += f"Yararlı: {row.get('helpful_count', 'N/A')}\n"
+        txt_content += f"Tarih: {row.get('date', 'N/A')}\n"
+        txt_content += "---\n"
+    return txt_content.encode('utf-8')
+
+def legacy_json(df):
+    """Eski JSON: tüm çıktı tek string olarak bellekte"""
+    return df.to_json(orient='records', force_ascii=False, indent=2).encode('utf-8')
+
+def measure(func, *args, **kwargs):
+    """Süre (sn) ve tracemalloc tepe belleği (MB) ile sonucu döndür"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+def run(rows_list, legacy_max_rows):
+    print(f"{'satır':>10} {'format':>6} {'yöntem':>8} {'süre (sn)':>10} {'tepe (MB)':>10} {'boyut (MB)':>11}")
+    for rows in rows_list:
+        df = make_reviews(rows)
+        cases = [
+            ('txt', 'yeni', lambda: export_to_bytes(write_txt_records, df, fields=TXT_FIELDS)),
+            ('json', 'yeni', lambda: export_to_bytes(write_json_records, df)),
+        ]
+        if rows <= legacy_max_rows:
+            cases += [('txt', 'eski', lambda: legacy_txt(df)), ('json', 'eski', lambda: legacy_json(df))]
+
+        outputs = {}
+        for fmt, method, func in cases:
+            data, elapsed, peak = measure(func)
+            outputs[(fmt, method)] = data
+            print(f"{rows:>10,} {fmt:>6} {method:>8} {elapsed:>10.2f} {peak:>10.1f} {len(data) / 1024 / 1024:>11.1f}")
+
+        # Eski ve yeni çıktılar bayt bayt aynı olmalı
+        for fmt in ('txt', 'json'):
+            if (fmt, 'eski') in outputs:
+                assert outputs[(fmt, 'eski')] == outputs[(fmt, 'yeni')], f"{fmt} çıktısı farklı ({rows} satır)"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dışa aktarma yazıcıları benchmark'ı")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS))
+    parser.add_argument('--legacy-max-rows', type=int, default=DEFAULT_LEGACY_MAX_ROWS,
+                        help="Eski yöntem bu satır sayısına kadar ölçülür (1M satırda dakikalar sürer)")
+    args = parser.parse_args(argv)
+    run(args.rows, args.legacy_max_rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Artımlı Versiyon Düzeltme Benchmark'ı
+Günlük yenilemeyi taklit eder: her gün tüm geçmişi process_version_fixing ile yeniden düzeltmek yerine
+depoya kaydedilmiş versiyon progression'ı yüklenir ve sadece yeni satırlar doldurulur.
+Her gün için yeni satırların doldurulan versiyonları ve versiyon aralıkları tam hesapla birebir karşılaştırılır.
+
+Kullanım:
+    python -m benchmarks.bench_incremental_version_fix
+    python -m benchmarks.bench_incremental_version_fix --rows 1000000 --days 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.bench_version_fix import DEFAULT_VERSIONS, make_version_history
+from review_store import ReviewStore
+from streamlit_version_fixer import StreamingVersionFixer, process_version_fixing
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_DAYS = 5
+APP = ('Play Store', 'com.example.bench')
+
+def incremental_fix(store, batch):
+    """Kayıtlı progression ile sadece yeni satırları düzelt, güncel progression'ı geri yaz"""
+    progression = store.load_version_progression(*APP)
+    fixer = StreamingVersionFixer.from_state(progression) if progression else StreamingVersionFixer()
+    fixed = fixer.fix(batch)
+    store.save_version_progression(*APP, fixer.state())
+    return fixed, fixer.version_ranges()
+
+def full_fix(history, batch):
+    """Tüm geçmiş + yeni satırlar üzerinde baştan düzelt, yeni satırların sonucunu döndür"""
+    combined = pd.concat([history, batch], ignore_index=True)
+    fixed, results = process_version_fixing(combined, show_progress=False)
+    return fixed.iloc[len(history):].reset_index(drop=True), results['version_ranges']
+
+def check_day(name, incremental, full):
+    fixed, ranges = incremental
+    expected, expected_ranges = full
+    assert fixed['app_version'].tolist() == expected['app_version'].tolist(), f"{name}: doldurulan versiyonlar farklı"
+    assert ranges == expected_ranges, f"{name}: versiyon aralıkları farklı"
+
+def run_days(store, history, batches, label=None):
+    """İlk kayıt + günlük yenilemeler; her gün tam hesapla karşılaştırılır - süreleri döndür"""
+    incremental_fix(store, history)
+    incremental_seconds, full_seconds = [], []
+    for day, batch in enumerate(batches, start=1):
+        started = time.perf_counter()
+        incremental = incremental_fix(store, batch)
+        incremental_seconds.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        full = full_fix(history, batch)
+        full_seconds.append(time.perf_counter() - started)
+
+        check_day(f"{label or 'gün'} {day}", incremental, full)
+        history = pd.concat([history, batch], ignore_index=True)
+    return incremental_seconds, full_seconds
+
+def check_edge_cases(store):
+    """Geç indekslenen eski versiyon, yeni kullanıcı hatası ve aynı gün yayınlanan versiyonlar"""
+    def frame(rows):
+        return pd.DataFrame(rows, columns=['app_version', 'date']).assign(date=lambda df: pd.to_datetime(df['date']))
+
+    history = frame([('1.0.0', '2024-01-01'), ('', '2024-01-03'), ('1.1.0', '2024-01-10'), ('', '2024-01-12'),
+                     ('1.2.0', '2024-01-20'), ('', '2024-01-25')])
+    batches = [
+        frame([('', '2024-01-26'), ('1.3.0', '2024-01-27'), ('', '2024-01-27'), ('1.3.1', '2024-01-27')]),  # aynı gün iki yeni versiyon
+        frame([('0.9.0', '2024-01-28'), ('', '2024-01-28')]),  # kullanıcı hatası (düşük numara)
+        frame([('1.1.5', '2024-01-05'), ('', '2024-01-29')]),  # geç gelen eski tarihli yorum - progression yeniden hesaplanır
+        frame([('', None), ('', '2023-12-01'), ('', '2024-03-01')]),  # tarihsiz ve aralık dışı satırlar
+    ]
+    run_days(store, history, batches, label="kenar durumu")
+    print("✅ Kenar durumları tam hesapla aynı")
+
+def run(rows, days, versions):
+    df = make_version_history(rows, versions).sort_values('date', kind='stable').reset_index(drop=True)
+    cutoff = df['date'].max().normalize() - pd.Timedelta(days=days - 1)
+    history = df[df['date'] < cutoff].reset_index(drop=True)
+    day_index = (df['date'] - cutoff).dt.days
+    batches = [df[day_index == day].reset_index(drop=True) for day in range(days)]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        store = ReviewStore(os.path.join(work_dir, 'bench.sqlite3'))
+        check_edge_cases(store)
+        store.delete_app(*APP)
+
+        started = time.perf_counter()
+        incremental_fix(store, history)
+        print(f"İlk kayıt: {len(history):,} satır, {time.perf_counter() - started:.2f} sn")
+
+        incremental_seconds, full_seconds = run_days(store, history, batches)
+
+    print(f"{'gün':>4} {'yeni satır':>11} {'tam hesap (sn)':>15} {'artımlı (sn)':>13} {'hızlanma':>9}")
+    for day, (batch, full, incremental) in enumerate(zip(batches, full_seconds, incremental_seconds), start=1):
+        print(f"{day:>4} {len(batch):>11,} {full:>15.3f} {incremental:>13.3f} {full / incremental:>8,.0f}x")
+    print("✅ Her gün yeni satırlar ve versiyon aralıkları tam hesapla aynı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Artımlı versiyon düzeltme benchmark'ı")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help="Günlük yenileme sayısı (verinin son günleri)")
+    parser.add_argument('--versions', type=int, default=DEFAULT_VERSIONS)
+    args = parser.parse_args(argv)
+    run(args.rows, args.days, args.versions)
+
+if __name__ == "__main__":
+    main()
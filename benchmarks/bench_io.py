@@ -0,0 +1,54 @@
+"""
+Dosya Okuma Benchmark'ı
+Analiz modülünün aynı veriyi CSV, Parquet ve Arrow IPC'den yükleme süresini karşılaştırır
+(okuma + şema standardizasyonu + sıkıştırma, yani load_and_prepare_data'nın dosya yolu).
+
+Kullanım:
+    python -m benchmarks.bench_io
+    python -m benchmarks.bench_io --rows 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.bench_exports import make_reviews
+from export_utils import write_arrow, write_parquet
+from streamlit_z_analiz import prepare_platform_frame, read_platform_file
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+
+def write_files(df, directory):
+    """Aynı veriyi üç formatta diske yaz, {format: yol} döndür"""
+    paths = {fmt: os.path.join(directory, f"play_reviews.{fmt}") for fmt in ('csv', 'parquet', 'arrow')}
+    df.to_csv(paths['csv'], index=False, encoding='utf-8-sig')
+    with open(paths['parquet'], 'wb') as f:
+        write_parquet(df, f)
+    with open(paths['arrow'], 'wb') as f:
+        write_arrow(df, f)
+    return paths
+
+def run(rows_list):
+    print(f"{'satır':>10} {'format':>8} {'boyut (MB)':>11} {'yükleme (sn)':>13}")
+    for rows in rows_list:
+        df = make_reviews(rows)
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt, path in write_files(df, directory).items():
+                started = time.perf_counter()
+                loaded = prepare_platform_frame(read_platform_file(path, 'Play Store'), 'Play Store')
+                elapsed = time.perf_counter() - started
+                assert len(loaded) == rows
+                print(f"{rows:>10,} {fmt:>8} {os.path.getsize(path) / 1024 / 1024:>11.1f} {elapsed:>13.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV / Parquet / Arrow yükleme benchmark'ı")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS))
+    args = parser.parse_args(argv)
+    run(args.rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Uygulama Bazında Paralel Versiyon Düzeltme Benchmark'ı
+Birden fazla uygulamanın birleşik Play Store verisinde process_version_fixing_by_app'i farklı süreç sayılarıyla ölçer.
+Her uygulamanın tek başına düzeltilmesiyle birebir aynı sonucu doğrular; karşılaştırma için eski davranışın
+(tüm uygulamalar tek versiyon geçmişi) kaç satırı yanlış doldurduğunu da gösterir.
+
+Kullanım:
+    python -m benchmarks.bench_parallel_version_fix
+    python -m benchmarks.bench_parallel_version_fix --apps 8 --rows-per-app 250000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.bench_version_fix import make_version_history
+from streamlit_version_fixer import (process_version_fixing, process_version_fixing_by_app,
+                                     process_version_fixing_chunked, shutdown_process_pool)
+
+DEFAULT_APPS = 8
+DEFAULT_ROWS_PER_APP = 250_000
+
+def make_portfolio(apps, rows_per_app, versions=150):
+    """Farklı sürüm geçmişli uygulamaların tarihe göre iç içe geçmiş birleşik verisi"""
+    frames = []
+    for i in range(apps):
+        history = make_version_history(rows_per_app, versions=versions + 20 * i, seed=i)
+        # Her uygulamanın kendi numaralandırması ve yayın takvimi var
+        names = {name: f"{int(name.split('.')[0]) + 2 * i}.{name.split('.', 1)[1]}"
+                 for name in history['app_version'].unique() if name}
+        history['app_version'] = history['app_version'].map(lambda name: names.get(name, name))
+        history['date'] += pd.Timedelta(days=11 * i)
+        frames.append(history.assign(app=f"com.example.app{i}"))
+    return pd.concat(frames, ignore_index=True).sort_values('date', kind='stable').reset_index(drop=True)
+
+def expected_versions(df):
+    """Her uygulama tek başına düzeltildiğinde beklenen app_version sütunu"""
+    expected = pd.Series(index=df.index, dtype=object)
+    for _, app_df in df.groupby('app', sort=False):
+        fixed, _ = process_version_fixing(app_df.drop(columns='app'), show_progress=False)
+        expected[app_df.index] = fixed['app_version']
+    return expected
+
+def check_chunked(df, expected, chunk_size=50_000):
+    """Parça parça mod da uygulama bazında aynı sonucu vermeli"""
+    sample = df.iloc[:200_000]
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'portfolio.csv')
+        output_path = os.path.join(work_dir, 'fixed.csv')
+        sample.to_csv(input_path, index=False)
+        results = process_version_fixing_chunked(input_path, output_path, chunk_size=chunk_size)
+        assert 'error' not in results, results.get('error')
+        fixed = pd.read_csv(output_path, usecols=['app_version'], dtype=str, keep_default_na=False)
+    reference = expected_versions(sample).replace('nan', '')
+    assert fixed['app_version'].tolist() == reference.tolist(), "Parça parça mod uygulama bazında farklı"
+    print("✅ Parça parça mod uygulama bazında aynı")
+
+def run(apps, rows_per_app, workers_list):
+    df = make_portfolio(apps, rows_per_app)
+    print(f"Veri: {apps} uygulama, {len(df):,} satır, {os.cpu_count()} CPU")
+
+    expected = expected_versions(df)
+    check_chunked(df, expected)
+
+    started = time.perf_counter()
+    combined, _ = process_version_fixing(df.drop(columns='app'), show_progress=False)
+    combined_seconds = time.perf_counter() - started
+    wrong = int((combined['app_version'] != expected).sum())
+
+    print(f"{'mod':>26} {'süre (sn)':>10} {'hızlanma':>9}")
+    print(f"{'tek geçmiş (eski)':>26} {combined_seconds:>10.2f} {'':>9}  ({wrong:,} satır yanlış dolduruldu)")
+
+    baseline = None
+    for workers in sorted(workers_list):
+        # Havuz sunucu sürecinde bir kez kurulur - ilk (soğuk) çağrı ölçüme katılmaz
+        process_version_fixing_by_app(df, 'app', show_progress=False, max_workers=workers)
+        started = time.perf_counter()
+        fixed, results = process_version_fixing_by_app(df, 'app', show_progress=False, max_workers=workers)
+        seconds = time.perf_counter() - started
+        assert 'error' not in results, results.get('error')
+        assert fixed['app_version'].tolist() == expected.tolist(), f"{workers} süreçte sonuç farklı"
+        baseline = baseline or seconds
+        label = f"uygulama bazında ({results['workers']} süreç)"
+        print(f"{label:>26} {seconds:>10.2f} {baseline / seconds:>8.1f}x")
+    shutdown_process_pool()
+    print("✅ Tüm süreç sayılarında her uygulamanın tek başına düzeltilmesiyle aynı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uygulama bazında paralel versiyon düzeltme benchmark'ı")
+    parser.add_argument('--apps', type=int, default=DEFAULT_APPS)
+    parser.add_argument('--rows-per-app', type=int, default=DEFAULT_ROWS_PER_APP)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args(argv)
+    run(args.apps, args.rows_per_app, args.workers)
+
+if __name__ == "__main__":
+    main()
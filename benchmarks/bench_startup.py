@@ -0,0 +1,105 @@
+"""
+Açılış Süresi Benchmark'ı
+Her Streamlit giriş noktasının soğuk açılışını ayrı bir Python sürecinde ölçer:
+Streamlit'in kendi import süresi ayrı tutulur, geri kalanı (modül importları + ilk çizim) bütçeyle karşılaştırılır.
+Açılışta yüklenmemesi gereken ağır kütüphaneler (googletrans, requests, matplotlib ...) yüklenirse de başarısız sayılır.
+
+Kullanım:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget 0.8 --repeat 5
+
+Çıkış kodu: 0 tüm giriş noktaları bütçede, 1 en az biri bütçeyi aştı veya ağır kütüphane yükledi
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Giriş noktası → Streamlit importu hariç açılış bütçesi (saniye)
+STARTUP_BUDGETS = {
+    'streamlit_master_app.py': 1.5,
+    'streamlit_version_fixer.py': 1.0,
+    'streamlit_app_selector.py': 1.0,
+    'translator_streamlit.py': 1.0,
+    'rss_scraper_streamlit.py': 1.0,
+    'play_scraper_streamlit.py': 1.0,
+    'streamlit_z_analiz.py': 1.0,
+}
+
+# İlk kullanımda yüklenmesi gereken kütüphaneler
+LAZY_MODULES = ('matplotlib', 'seaborn', 'googletrans', 'httpx', 'google_play_scraper', 'requests')
+
+# Ayrı süreçte çalışan ölçüm - `streamlit run` gibi betiği baştan çalıştırır (bare mode)
+PROBE = """
+import json, runpy, sys, time
+started = time.perf_counter()
+import streamlit
+framework_done = time.perf_counter()
+before = set(sys.modules)
+runpy.run_path(sys.argv[1], run_name='__main__')
+finished = time.perf_counter()
+loaded = sorted({name.split('.')[0] for name in set(sys.modules) - before})
+print(json.dumps({'framework': framework_done - started, 'app': finished - framework_done, 'loaded': loaded}))
+"""
+
+def measure(entry_point):
+    """Giriş noktasını yeni bir süreçte çalıştır, {'framework', 'app', 'loaded'} döndür"""
+    # Boş çalışma dizini ve geçici veritabanı - ölçüm repo'ya dosya bırakmaz
+    with tempfile.TemporaryDirectory() as work_dir:
+        env = dict(
+            os.environ,
+            PYTHONPATH=REPO_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''),
+            REVIEW_STORE_PATH=os.path.join(work_dir, 'reviews.sqlite3')
+        )
+        completed = subprocess.run(
+            [sys.executable, '-c', PROBE, os.path.join(REPO_DIR, entry_point)],
+            cwd=work_dir, env=env, capture_output=True, text=True, timeout=120
+        )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{entry_point} açılamadı:\n{completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def run(entry_points, repeat, budget=None):
+    print(f"{'giriş noktası':<28} {'streamlit (sn)':>14} {'uygulama (sn)':>14} {'bütçe (sn)':>11}  durum")
+    failures = []
+
+    for entry_point in entry_points:
+        runs = [measure(entry_point) for _ in range(repeat)]
+        best = min(runs, key=lambda result: result['app'])
+        entry_budget = budget or STARTUP_BUDGETS.get(entry_point, 1.0)
+        eager = sorted(set(LAZY_MODULES) & {name for result in runs for name in result['loaded']})
+
+        problems = []
+        if best['app'] > entry_budget:
+            problems.append("bütçe aşıldı")
+        if eager:
+            problems.append(f"açılışta yüklendi: {', '.join(eager)}")
+        if problems:
+            failures.append(entry_point)
+
+        print(f"{entry_point:<28} {best['framework']:>14.2f} {best['app']:>14.2f} {entry_budget:>11.2f}  "
+              f"{'; '.join(problems) or 'ok'}")
+
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streamlit giriş noktalarının soğuk açılış süresi")
+    parser.add_argument('--entry', action='append', dest='entry_points', help="Sadece bu giriş noktası (tekrarlanabilir)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her giriş noktası için ölçüm sayısı (en iyisi alınır)")
+    parser.add_argument('--budget', type=float, help="Tüm giriş noktaları için tek bütçe (saniye)")
+    args = parser.parse_args(argv)
+
+    failures = run(args.entry_points or list(STARTUP_BUDGETS), args.repeat, args.budget)
+    if failures:
+        print(f"\n❌ Bütçe dışı: {', '.join(failures)}")
+        return 1
+    print("\n✅ Tüm giriş noktaları bütçede")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
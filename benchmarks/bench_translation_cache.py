@@ -0,0 +1,106 @@
+"""
+Kalıcı Çeviri Önbelleği Benchmark'ı
+Çakışan tarih aralıklarıyla iki kez çalıştırılan pipeline'ı (translate_reviews) taklit eder: ikinci çalıştırmada
+ilk çalıştırmayla ortak yorumlar önbellekten gelmeli, sadece yeni yorumlar Google'a gitmeli.
+Google isteği sabit gecikmeli sahte bir çevirmenle ölçülür (ağ/kota ölçülmez, sadece istek sayısı ve süre).
+Küçük bütçeyle LRU silmenin en eski kullanılanları attığı ve bütçenin aşılmadığı da doğrulanır.
+
+Kullanım:
+    python -m benchmarks.bench_translation_cache
+    python -m benchmarks.bench_translation_cache --days 90 --reviews-per-day 50 --latency-ms 20
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fake_translator import WORDS, LatencyTranslator, install_fake_translator, temporary_translation_cache
+import translator_streamlit
+from translation_cache import TranslationCache
+
+def make_reviews(days, reviews_per_day, seed=3):
+    """Gün başına İngilizce yorumlar (her yorum farklı metin) - tarih aralığı filtrelemesi için 'date'"""
+    rng = np.random.default_rng(seed)
+    rows = days * reviews_per_day
+    content = [' '.join(rng.choice(WORDS, rng.integers(4, 14))) + f" #{i}" for i in range(rows)]
+    # Sütun sırası process_play_review gibi: content review_id'den önce (metin sütunu tespiti ilk eşleşeni alır)
+    return pd.DataFrame({
+        'content': content,
+        'review_id': [f"gp:{i}" for i in range(rows)],
+        'lang': 'en',
+        'date': pd.Timestamp('2025-01-01') + pd.to_timedelta(np.repeat(np.arange(days), reviews_per_day), unit='D'),
+    })
+
+def run_translation(df):
+    LatencyTranslator.calls = 0
+    started = time.perf_counter()
+    result = translator_streamlit.translate_reviews(df)
+    return result, time.perf_counter() - started, LatencyTranslator.calls
+
+def check_eviction(work_dir):
+    """Bütçe aşılınca en eski kullanılanlar silinmeli, yeni kullanılanlar kalmalı"""
+    cache = TranslationCache(os.path.join(work_dir, 'small.sqlite3'), max_bytes=20_000)
+    texts = [f"review text number {i:04d} " * 3 for i in range(400)]
+    for i, text in enumerate(texts):
+        cache.put(text, 'auto', 'tr', text.upper())
+        if i % 10 == 0:
+            cache.get(texts[0], 'auto', 'tr')  # ilk metin sürekli kullanılıyor
+    summary = cache.summary()
+    assert summary['total_bytes'] <= cache.max_bytes and summary['evictions'] > 0, summary
+    assert cache.get(texts[0], 'auto', 'tr') is not None, "Sık kullanılan çeviri silindi"
+    assert cache.get(texts[1], 'auto', 'tr') is None, "En eski kullanılan çeviri silinmedi"
+    assert cache.get(texts[-1], 'auto', 'tr') is not None, "En yeni çeviri silindi"
+    assert TranslationCache(cache.db_path, max_bytes=20_000).total_bytes == summary['total_bytes'], \
+        "Yeniden açılışta boyut farklı"
+    print(f"✅ LRU silme: {summary['evictions']} kayıt silindi, {summary['total_bytes']:,} / {cache.max_bytes:,} bayt")
+
+def run(days, reviews_per_day, latency_ms):
+    install_fake_translator(latency_ms)
+
+    df = make_reviews(days, reviews_per_day)
+    first_range = df[df['date'] < df['date'].min() + pd.Timedelta(days=days * 2 // 3)]
+    second_range = df[df['date'] >= df['date'].min() + pd.Timedelta(days=days // 3)]
+    overlap = len(first_range) + len(second_range) - len(df)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        with temporary_translation_cache(work_dir) as cache:
+            first, first_seconds, first_calls = run_translation(first_range)
+            second, second_seconds, second_calls = run_translation(second_range)
+            # Önbellek kapalıyken (eski davranış) ikinci çalıştırma
+            cache.clear()
+            expected, uncached_seconds, uncached_calls = run_translation(second_range)
+
+            assert second['translated_text'].tolist() == expected['translated_text'].tolist(), "Önbellekli çeviri farklı"
+            # +1: önbellekte olmayan ilk metinden önceki bağlantı testi
+            assert second_calls == len(second_range) - overlap + 1, f"Yeni yorum dışında istek: {second_calls}"
+            # Metin normalizasyonu: boşluk farkı aynı çeviriyi kullanır
+            spaced = second_range.head(20).assign(content=lambda frame: '  ' + frame['content'].str.replace(' ', '   ') + ' ')
+            _, _, spaced_calls = run_translation(spaced)
+            assert spaced_calls == 0, "Boşluk farkı önbelleği atladı"
+
+            print(f"Veri: {len(first_range):,} + {len(second_range):,} yorum ({overlap:,} ortak), "
+                  f"istek gecikmesi {latency_ms} ms")
+            print(f"{'çalıştırma':<30} {'istek':>7} {'süre (sn)':>10}")
+            print(f"{'1. aralık (boş önbellek)':<30} {first_calls:>7,} {first_seconds:>10.2f}")
+            print(f"{'2. aralık (önbellekli)':<30} {second_calls:>7,} {second_seconds:>10.2f}")
+            print(f"{'2. aralık (önbelleksiz)':<30} {uncached_calls:>7,} {uncached_seconds:>10.2f}")
+            summary = cache.summary()
+            print(f"Önbellek: {summary['entries']:,} çeviri, {summary['total_bytes'] / 1024:.0f} KB")
+
+        check_eviction(work_dir)
+    print("✅ Ortak yorumlar önbellekten geldi, sonuç önbelleksiz çeviriyle aynı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalıcı çeviri önbelleği benchmark'ı")
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--reviews-per-day', type=int, default=25)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    args = parser.parse_args(argv)
+    run(args.days, args.reviews_per_day, args.latency_ms)
+
+if __name__ == "__main__":
+    main()
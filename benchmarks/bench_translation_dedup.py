@@ -0,0 +1,70 @@
+"""
+Tekrarlanan Metin Tekilleştirme Benchmark'ı
+Kısa yorumlar ("good app", "very bad", "👍") yüzlerce kez tekrarlanır. translate_reviews çevrilecek metinleri
+normalize edip her tekil metni bir kez çevirir ve sonucu satırlara dağıtır. Sabit gecikmeli sahte çevirmenle
+istek sayısı / süre ölçülür ve sonucun satır satır çeviriyle aynı olduğu doğrulanır (kalıcı önbellek boş başlar).
+
+Kullanım:
+    python -m benchmarks.bench_translation_dedup
+    python -m benchmarks.bench_translation_dedup --rows 5000 --unique-share 0.2 --latency-ms 20
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fake_translator import WORDS, LatencyTranslator, install_fake_translator, temporary_translation_cache
+import translator_streamlit
+
+_SHORT_REVIEWS = ['good app', 'very bad', '👍', 'great', 'not working', 'nice', 'bad app', 'love it', 'ok',
+                  'worst app ever', 'useless', 'perfect', 'thanks', 'does not open', 'too many ads']
+
+def make_reviews(rows, unique_share, seed=5):
+    """Zipf dağılımlı kısa yorum tekrarları + boşluk farklı kopyalar + tekil uzun yorumlar"""
+    rng = np.random.default_rng(seed)
+    unique_rows = int(rows * unique_share)
+    ranks = np.minimum(rng.zipf(1.6, rows - unique_rows), len(_SHORT_REVIEWS)) - 1
+    short = [_SHORT_REVIEWS[rank] for rank in ranks]
+    short = [f"  {text} " if i % 10 == 0 else text for i, text in enumerate(short)]
+    long = [' '.join(rng.choice(WORDS, rng.integers(6, 16))) + f" #{i}" for i in range(unique_rows)]
+    content = np.array(short + long, dtype=object)
+    rng.shuffle(content)
+    return pd.DataFrame({'content': content, 'review_id': [f"gp:{i}" for i in range(rows)], 'lang': 'en'})
+
+def run(rows, unique_share, latency_ms):
+    install_fake_translator(latency_ms)
+    df = make_reviews(rows, unique_share)
+
+    with tempfile.TemporaryDirectory() as work_dir, temporary_translation_cache(work_dir):
+        started = time.perf_counter()
+        result = translator_streamlit.translate_reviews(df)
+        seconds = time.perf_counter() - started
+
+    expected = [f"[tr] {' '.join(text.split())}" for text in df['content']]
+    assert result['translated_text'].tolist() == expected, "Tekilleştirilmiş çeviri satır satır çeviriyle farklı"
+    # +1: önbellekte olmayan ilk metinden önceki bağlantı testi
+    unique_texts = df['content'].map(lambda text: ' '.join(text.split())).nunique()
+    assert LatencyTranslator.calls == unique_texts + 1, LatencyTranslator.calls
+
+    per_row_seconds = rows * LatencyTranslator.latency
+    print(f"Veri: {rows:,} yorum, {unique_texts:,} tekil metin, istek gecikmesi {latency_ms} ms")
+    print(f"{'yöntem':<26} {'istek':>7} {'süre (sn)':>10}")
+    print(f"{'satır başına (eski)':<26} {rows + 1:>7,} {per_row_seconds:>9.1f}*")
+    print(f"{'tekilleştirilmiş':<26} {LatencyTranslator.calls:>7,} {seconds:>10.1f}")
+    print(f"Tasarruf: {rows - unique_texts:,} çağrı ({1 - unique_texts / rows:.0%})")
+    print("* yalnız istek gecikmesinden hesaplanan alt sınır")
+    print("✅ Her tekil metin bir kez çevrildi, sonuç satır satır çeviriyle aynı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tekrarlanan metin tekilleştirme benchmark'ı")
+    parser.add_argument('--rows', type=int, default=3000)
+    parser.add_argument('--unique-share', type=float, default=0.2, help="Tekil uzun yorumların oranı")
+    parser.add_argument('--latency-ms', type=float, default=20)
+    args = parser.parse_args(argv)
+    run(args.rows, args.unique_share, args.latency_ms)
+
+if __name__ == "__main__":
+    main()
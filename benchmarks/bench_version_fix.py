@@ -0,0 +1,116 @@
+"""
+Versiyon Doldurma Benchmark'ı
+Boş versiyonların eski satır satır doldurulmasını (df.apply + fill_version_smart) aralık sınırları
+üzerinde searchsorted yapan vektörel fill_missing_versions ile karşılaştırır; sonuçların aynı olduğunu da doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_version_fix
+    python -m benchmarks.bench_version_fix --rows 100000 1000000 --versions 300 --legacy-max-rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from streamlit_version_fixer import fill_missing_versions, fill_version_smart, process_version_fixing
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+DEFAULT_VERSIONS = 300
+DEFAULT_LEGACY_MAX_ROWS = 1_000_000
+
+def make_version_history(rows, versions=DEFAULT_VERSIONS, missing_rate=0.3, seed=42):
+    """
+    Düzenli sürüm takvimli sentetik Play Store verisi: çoğu kullanıcı güncel sürümde,
+    bir kısmı birkaç sürüm geride, az sayıda hatalı (düşük numaralı) versiyon ve boş versiyonlar
+    """
+    rng = np.random.default_rng(seed)
+    release_names = np.array([f"{i // 50 + 1}.{i % 50}.0" for i in range(versions)], dtype=object)
+    release_dates = pd.Timestamp('2022-01-01') + pd.to_timedelta(np.arange(versions) * 3.5, unit='D')
+
+    dates = pd.Timestamp('2022-01-01') + pd.to_timedelta(
+        rng.integers(0, int(versions * 3.5 * 24 * 60), rows), unit='min')
+    current = np.searchsorted(release_dates.values, dates.values, side='right') - 1
+    lag = np.where(rng.random(rows) < 0.1, rng.integers(1, 6, rows), 0)
+    app_version = release_names[np.clip(current - lag, 0, versions - 1)]
+
+    # Kullanıcı hatası: geçmişte kalmış düşük numaralı versiyonlar
+    user_errors = rng.random(rows) < 0.001
+    app_version[user_errors] = [f"0.9.{k}" for k in rng.integers(0, 20, user_errors.sum())]
+
+    app_version[rng.random(rows) < missing_rate] = ''
+    return pd.DataFrame({
+        'app_version': app_version,
+        'date': dates,
+        'rating': rng.integers(1, 6, rows),
+    })
+
+def legacy_fill(df, version_ranges):
+    """Eski doldurma: her satır için fill_version_smart"""
+    return df.apply(fill_version_smart, axis=1, args=(version_ranges,))
+
+def run(rows_list, versions, legacy_max_rows):
+    print(f"{'satır':>10} {'versiyon':>9} {'boş':>9} {'yöntem':>8} {'doldurma (sn)':>14} {'toplam (sn)':>12}")
+    for rows in rows_list:
+        df = make_version_history(rows, versions)
+
+        started = time.perf_counter()
+        fixed, results = process_version_fixing(df, show_progress=False)
+        total = time.perf_counter() - started
+
+        # Doldurma adımını ayrıca ölç - aynı hazırlanmış veri ve aralıklarla
+        prepared = df.assign(app_version=df['app_version'].astype(str), date=pd.to_datetime(df['date']))
+        version_ranges = results['version_ranges']
+
+        started = time.perf_counter()
+        filled = fill_missing_versions(prepared, version_ranges)
+        fill_seconds = time.perf_counter() - started
+        print(f"{rows:>10,} {len(version_ranges):>9} {results['missing_versions_count']:>9,} {'yeni':>8} "
+              f"{fill_seconds:>14.2f} {total:>12.2f}")
+
+        if rows <= legacy_max_rows:
+            started = time.perf_counter()
+            expected = legacy_fill(prepared, version_ranges)
+            legacy_seconds = time.perf_counter() - started
+            print(f"{rows:>10,} {len(version_ranges):>9} {results['missing_versions_count']:>9,} {'eski':>8} "
+                  f"{legacy_seconds:>14.2f} {'':>12}  (x{legacy_seconds / fill_seconds:,.0f} hızlanma)")
+            assert filled.tolist() == expected.tolist(), f"Doldurulan versiyonlar farklı ({rows} satır)"
+            assert fixed['app_version'].tolist() == expected.tolist()
+
+def check_edge_cases():
+    """Aralık dışı, NaT ve aynı gün yayınlanan versiyonlarda eski sonuçla birebir aynı mı"""
+    ranges = [
+        {'version': '1.0', 'start_date': pd.Timestamp('2024-01-10').date(), 'end_date': pd.Timestamp('2024-01-10').date()},
+        {'version': '1.1', 'start_date': pd.Timestamp('2024-01-10').date(), 'end_date': pd.Timestamp('2024-02-01').date()},
+        {'version': '1.2', 'start_date': pd.Timestamp('2024-02-01').date(), 'end_date': pd.Timestamp('2024-02-01').date()},
+        {'version': '1.3', 'start_date': pd.Timestamp('2024-02-01').date(), 'end_date': pd.Timestamp('2024-03-01').date()},
+    ]
+    df = pd.DataFrame({
+        'app_version': ['', 'nan', '', '', '', '', '', '0.5'],
+        'date': pd.to_datetime(['2024-01-01 00:00', '2024-01-10 08:00', '2024-01-31 23:00', '2024-02-01 00:00',
+                                '2024-02-20 12:00', '2024-03-01 00:00', '2024-05-01 00:00', '2024-01-15 00:00']),
+    })
+    assert fill_missing_versions(df, ranges).tolist() == legacy_fill(df, ranges).tolist()
+    assert fill_missing_versions(df, []).tolist() == legacy_fill(df, []).tolist()
+
+    # Eski yöntem tarihsiz satırda hata veriyordu - yenisi o satırı boş bırakır
+    undated = pd.DataFrame({'app_version': ['', ''], 'date': pd.to_datetime(['2024-01-15', None])})
+    assert fill_missing_versions(undated, ranges).tolist() == ['1.1', '']
+    print("✅ Kenar durumları eski sonuçla aynı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versiyon doldurma benchmark'ı")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS))
+    parser.add_argument('--versions', type=int, default=DEFAULT_VERSIONS)
+    parser.add_argument('--legacy-max-rows', type=int, default=DEFAULT_LEGACY_MAX_ROWS,
+                        help="Eski yöntem bu satır sayısına kadar ölçülür (1M satırda dakikalar sürer)")
+    args = parser.parse_args(argv)
+    check_edge_cases()
+    run(args.rows, args.versions, args.legacy_max_rows)
+
+if __name__ == "__main__":
+    main()
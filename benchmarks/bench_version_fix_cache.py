@@ -0,0 +1,78 @@
+"""
+Versiyon Düzeltme Önbelleği Benchmark'ı
+Aynı veri tekrar düzeltildiğinde (sayfa yeniden çalıştırma, aynı veriyle ikinci pipeline çalıştırması) önbelleksiz
+(soğuk) ve önbellekten (sıcak) süreyi ölçer; sıcak sonucun soğukla birebir aynı olduğunu ve verideki küçük bir
+değişikliğin önbelleği atladığını doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_version_fix_cache
+    python -m benchmarks.bench_version_fix_cache --sizes 100000 1000000 --apps 4
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.synthetic_history import make_release_history
+from streamlit_version_fixer import process_and_save_data, process_version_fixing, shutdown_process_pool
+from version_fix_cache import get_version_fix_cache
+
+DEFAULT_SIZES = (100_000, 1_000_000)
+
+def make_input(rows, apps):
+    if apps <= 1:
+        return make_release_history(rows)
+    frames = [make_release_history(rows // apps, seed=i).assign(app=f"com.example.app{i}") for i in range(apps)]
+    return pd.concat(frames, ignore_index=True).sort_values('date', kind='stable').reset_index(drop=True)
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def check_invalidation(df, cache):
+    """Tek satırlık değişiklik yeni anahtar üretmeli - eski sonuç kullanılmamalı"""
+    changed = df.copy()
+    position = changed.index[changed['app_version'] == ''][0]
+    changed.loc[position, 'app_version'] = '0.0.1'
+    misses = cache.stats['misses']
+    _, results = process_version_fixing(changed, show_progress=False)
+    assert cache.stats['misses'] == misses + 1 and 'from_cache' not in results, "Değişen veri önbellekten döndü"
+
+def run(sizes, apps):
+    cache = get_version_fix_cache()
+    print(f"{'durum':<24} {'satır':>10} {'soğuk (sn)':>11} {'sıcak (sn)':>11} {'hızlanma':>9}")
+    for rows in sizes:
+        df = make_input(rows, apps)
+        for name, func in (('process_version_fixing', lambda data: process_version_fixing(data, show_progress=False)),
+                           ('process_and_save_data', process_and_save_data)):
+            cache.clear()
+            cold, cold_seconds = timed(func, df)
+            warm, warm_seconds = timed(func, df)
+
+            cold_df = cold[0] if isinstance(cold, tuple) else cold
+            warm_df = warm[0] if isinstance(warm, tuple) else warm
+            pd.testing.assert_frame_equal(cold_df, warm_df)
+            if isinstance(cold, tuple):
+                assert warm[1].pop('from_cache') and warm[1] == cold[1], "Önbellekten dönen sonuç özeti farklı"
+            print(f"{name:<24} {len(df):>10,} {cold_seconds:>11.3f} {warm_seconds:>11.3f} "
+                  f"{cold_seconds / warm_seconds:>8.1f}x")
+        check_invalidation(df, cache)
+
+    shutdown_process_pool()
+    print(f"Önbellek: {len(cache.entries)} kayıt, {cache.total_bytes / 1024 / 1024:.1f} MB, istatistik {cache.stats}")
+    print("✅ Önbellekten dönen sonuç soğuk hesaplamayla aynı, değişen veri yeniden hesaplandı")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versiyon düzeltme önbelleği benchmark'ı")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--apps', type=int, default=1, help="Birleşik veride uygulama sayısı")
+    args = parser.parse_args(argv)
+    run(args.sizes, args.apps)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Versiyon Anahtarı Benchmark'ı
+Her karşılaştırmada packaging.version.parse çağıran eski sıralama / progression kontrolünü
+bir kez hesaplanan sayısal versiyon anahtarlarıyla karşılaştırır; PEP 440 versiyonlarda sonuçların aynı olduğunu doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_version_keys
+    python -m benchmarks.bench_version_keys --rows 1000000 --versions 300 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    from packaging import version
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    # Eski yöntemle karşılaştırma için gerekli - uygulama bağımlılığı değil (pip install packaging)
+    PACKAGING_AVAILABLE = False
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from streamlit_version_fixer import split_version_progression
+from version_utils import _parse_version_key, sort_versions, version_key, version_key_column
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_VERSIONS = (300, 5000)
+
+def make_versions(count, seed=42):
+    """Karışık sıralı sürüm adları: ara sıra ön sürümler ve eski (kullanıcı hatası) versiyonlar"""
+    rng = np.random.default_rng(seed)
+    names = []
+    for i in range(count):
+        name = f"{i // 400 + 1}.{(i // 20) % 20}.{i % 20}"
+        if rng.random() < 0.05:
+            name += f"b{rng.integers(1, 4)}"
+        elif rng.random() < 0.05:
+            name += f"rc{rng.integers(1, 3)}"
+        names.append(name)
+    # İlk görülme sırası: çoğunlukla artan, %2 geriye düşen versiyon
+    order = list(range(count))
+    for position in np.flatnonzero(rng.random(count) < 0.02):
+        order[position] = int(rng.integers(0, max(position, 1)))
+    return [names[index] for index in order]
+
+def legacy_is_version_higher(v1, v2):
+    """Eski karşılaştırma: her çağrıda iki versiyon da yeniden ayrıştırılır"""
+    try:
+        return version.parse(str(v1)) > version.parse(str(v2))
+    except:
+        return str(v1) > str(v2)
+
+def legacy_split(sorted_versions):
+    valid_versions, user_error_versions = [], []
+    for i, (current_version, current_date) in enumerate(sorted_versions):
+        if i == 0 or legacy_is_version_higher(current_version, valid_versions[-1][0]):
+            valid_versions.append((current_version, current_date))
+        else:
+            user_error_versions.append((current_version, current_date))
+    return valid_versions, user_error_versions
+
+def legacy_sort_column(series):
+    """Eski yaklaşım: sütunu satır başına parse edilen anahtarla sırala"""
+    return series.iloc[np.argsort(series.map(lambda v: version.parse(str(v))).to_numpy(), kind='stable')]
+
+def new_sort_column(series):
+    return series.iloc[np.argsort(version_key_column(series).to_numpy(), kind='stable')]
+
+def timed(func, *args):
+    _parse_version_key.cache_clear()  # Soğuk önbellek - anahtarlar her ölçümde yeniden üretilir
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def check_edge_cases():
+    """PEP 440 dışı uygulama versiyonları ve eşitlikler"""
+    assert sort_versions(['1.10.0', '1.9.0', '1.2.0', '1.2.0rc1', '1.2.0b2', '1.2.0b10']) == \
+        ['1.2.0b2', '1.2.0b10', '1.2.0rc1', '1.2.0', '1.9.0', '1.10.0']
+    assert version_key('1.0') == version_key('1.0.0') == version_key('v1.0.0')
+    assert version_key('3.2.1 (45)') == version_key('3.2.1')
+    assert version_key('2.0-beta') < version_key('2.0') < version_key('2.0.1')
+    assert version_key('Varies with device') < version_key('0.0.1')
+    assert version_key_column(pd.Series(['1.10', None, '1.9', '1.9.0'])).tolist() == [1, -1, 0, 0]
+    # Ön sürüm etiketiyle başlayan ama etiket olmayan ekler normal sürümdür ve eksiz halinden sonra gelir
+    for build in ('3.1.0-arm64', '2.0.1-amazon', '1.0-build5', '1.0-cn'):
+        assert version_key(build)[2] == version_key('1.0')[2], build
+    assert version_key('4.2.0') < version_key('4.2.0-amazon') < version_key('4.2.1')
+    assert split_version_progression([('4.2.0', 1), ('4.2.0-amazon', 2)])[1] == []
+    print("✅ Kenar durumları doğru")
+
+def run_new_only(rows, versions_list):
+    """packaging yoksa sadece yeni anahtarlar ölçülür"""
+    print("⚠️ packaging kurulu değil - eski yöntemle karşılaştırma atlandı")
+    print(f"{'versiyon':>9} {'işlem':>26} {'yeni (sn)':>10}")
+    for versions in versions_list:
+        names = make_versions(versions)
+        first_seen = list(zip(names, pd.date_range('2020-01-01', periods=versions, freq='D')))
+        column = pd.Series(np.array(names, dtype=object)[np.random.default_rng(7).integers(0, versions, rows)])
+        for name, new, args in (('progression', split_version_progression, (first_seen,)),
+                                ('versiyon listesi sıralama', sort_versions, (names,)),
+                                (f'{rows:,} satır sıralama', new_sort_column, (column,))):
+            _, new_seconds = timed(new, *args)
+            print(f"{versions:>9,} {name:>26} {new_seconds:>10.3f}")
+
+def run(rows, versions_list):
+    print(f"{'versiyon':>9} {'işlem':>26} {'eski (sn)':>10} {'yeni (sn)':>10} {'hızlanma':>9}")
+    for versions in versions_list:
+        names = make_versions(versions)
+        first_seen = list(zip(names, pd.date_range('2020-01-01', periods=versions, freq='D')))
+        rng = np.random.default_rng(7)
+        column = pd.Series(np.array(names, dtype=object)[rng.integers(0, versions, rows)])
+
+        cases = [
+            ('progression', legacy_split, split_version_progression, (first_seen,)),
+            ('versiyon listesi sıralama', lambda v: sorted(v, key=lambda x: version.parse(str(x))), sort_versions, (names,)),
+            (f'{rows:,} satır sıralama', legacy_sort_column, new_sort_column, (column,)),
+        ]
+        for name, legacy, new, args in cases:
+            expected, legacy_seconds = timed(legacy, *args)
+            result, new_seconds = timed(new, *args)
+            if isinstance(expected, pd.Series):
+                assert expected.tolist() == result.tolist(), f"{name} sonucu farklı ({versions} versiyon)"
+            else:
+                assert expected == result, f"{name} sonucu farklı ({versions} versiyon)"
+            print(f"{versions:>9,} {name:>26} {legacy_seconds:>10.3f} {new_seconds:>10.3f} "
+                  f"{legacy_seconds / new_seconds:>8,.1f}x")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versiyon anahtarı benchmark'ı")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--versions', type=int, nargs='+', default=list(DEFAULT_VERSIONS))
+    args = parser.parse_args(argv)
+    check_edge_cases()
+    if PACKAGING_AVAILABLE:
+        run(args.rows, args.versions)
+    else:
+        run_new_only(args.rows, args.versions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Versiyon Düzeltici Benchmark Paketi
+Sentetik sürüm geçmişleri (benchmarks/synthetic_history.py) üzerinde process_version_fixing ve process_and_save_data'yı
+10k / 100k / 1M satırda ölçer: süre (en iyi tekrar) ve en yüksek bellek (tracemalloc, ayrı çalıştırma).
+Sonuçlar benchmarks/baselines/version_suite.json'daki kayıtlı değerlerle karşılaştırılır.
+
+Kullanım:
+    python -m benchmarks.bench_version_suite
+    python -m benchmarks.bench_version_suite --sizes 10000 100000 --repeat 5
+    python -m benchmarks.bench_version_suite --update-baseline      # mevcut sonuçları yeni referans yap
+
+Çıkış kodu: 0 gerileme yok, 1 en az bir ölçüm referansı tolerans dışında aştı
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.synthetic_history import make_release_history
+from streamlit_version_fixer import process_and_save_data, process_version_fixing
+from version_fix_cache import get_version_fix_cache
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'version_suite.json')
+
+# Süre ölçümleri gürültülü - hem oran hem mutlak fark aşılırsa gerileme sayılır
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.25
+MIN_TIME_REGRESSION_SECONDS = 0.05
+
+CASES = {
+    'process_version_fixing': lambda df: process_version_fixing(df, show_progress=False),
+    'process_and_save_data': process_and_save_data,
+}
+
+def measure_case(func, df, repeat):
+    """En iyi süre (saniye) ve tracemalloc ile ayrı bir çalıştırmada en yüksek bellek (MB) - önbelleksiz (soğuk)"""
+    cache = get_version_fix_cache()
+    timings = []
+    for _ in range(repeat):
+        cache.clear()
+        gc.collect()
+        started = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - started)
+
+    cache.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(df)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': round(min(timings), 4), 'peak_mb': round(peak / 1024 / 1024, 1)}
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'environment': environment(),
+                   'results': results}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+def compare(result, reference, time_tolerance, memory_tolerance):
+    """Referansa göre gerileme mesajları (boş liste = sorun yok)"""
+    problems = []
+    if (result['seconds'] > reference['seconds'] * (1 + time_tolerance) and
+            result['seconds'] - reference['seconds'] > MIN_TIME_REGRESSION_SECONDS):
+        problems.append(f"süre {reference['seconds']:.3f} → {result['seconds']:.3f} sn")
+    if result['peak_mb'] > reference['peak_mb'] * (1 + memory_tolerance):
+        problems.append(f"bellek {reference['peak_mb']:.1f} → {result['peak_mb']:.1f} MB")
+    return problems
+
+def run(sizes, cases, repeat, baseline, time_tolerance, memory_tolerance):
+    reference = (baseline or {}).get('results', {})
+    results = {}
+    regressions = []
+
+    print(f"{'durum':<28} {'satır':>10} {'süre (sn)':>10} {'ref (sn)':>9} {'bellek (MB)':>12} {'ref (MB)':>9}  sonuç")
+    for rows in sizes:
+        df = make_release_history(rows)
+        for case in cases:
+            key = f"{case}@{rows}"
+            result = measure_case(CASES[case], df, repeat if rows < 1_000_000 else 1)
+            results[key] = result
+
+            ref = reference.get(key)
+            if ref is None:
+                status = "referans yok"
+            else:
+                problems = compare(result, ref, time_tolerance, memory_tolerance)
+                status = '; '.join(problems) or 'ok'
+                if problems:
+                    regressions.append(key)
+
+            print(f"{case:<28} {rows:>10,} {result['seconds']:>10.3f} "
+                  f"{(ref or {}).get('seconds', float('nan')):>9.3f} {result['peak_mb']:>12.1f} "
+                  f"{(ref or {}).get('peak_mb', float('nan')):>9.1f}  {status}")
+    return results, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versiyon düzeltici benchmark paketi")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3, help="Süre için tekrar sayısı (1M satırda 1)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="Sonuçları referans dosyasına yaz")
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument('--memory-tolerance', type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline.get('environment') != environment():
+        print(f"⚠️ Referans farklı bir ortamda alınmış: {baseline.get('environment')}")
+
+    results, regressions = run(args.sizes, args.cases, args.repeat, baseline,
+                               args.time_tolerance, args.memory_tolerance)
+
+    if args.update_baseline:
+        # Sadece ölçülen durumlar güncellenir, diğer referanslar korunur
+        merged = dict((baseline or {}).get('results', {}), **results)
+        save_baseline(args.baseline, merged)
+        print(f"\n💾 Referans güncellendi: {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n❌ Gerileme: {', '.join(regressions)}")
+        return 1
+    print("\n✅ Referanslara göre gerileme yok")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
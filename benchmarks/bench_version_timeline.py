@@ -0,0 +1,81 @@
+"""
+Versiyon Zaman Çizelgesi Benchmark'ı
+Versiyon başına tüm veriyi filtreleyen eski ilk görülme hesaplarını (versiyon düzeltici döngüsü ve
+analizdeki get_version_dates) tek groupby geçişli version_timeline ile karşılaştırır, sonuçları doğrular.
+
+Kullanım:
+    python -m benchmarks.bench_version_timeline
+    python -m benchmarks.bench_version_timeline --rows 100000 1000000 --versions 300
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+from benchmarks.bench_version_fix import DEFAULT_VERSIONS, make_version_history
+from streamlit_version_fixer import is_missing_version
+from streamlit_z_analiz import get_version_dates
+from version_utils import version_timeline
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+
+def legacy_first_dates(df):
+    """Eski process_version_fixing döngüsü: her versiyon için tüm veriyi filtrele"""
+    version_first_dates = {}
+    non_empty_data = df[~is_missing_version(df['app_version'])]
+    for version_name in non_empty_data['app_version'].unique():
+        version_data = non_empty_data[non_empty_data['app_version'] == version_name]
+        version_first_dates[version_name] = version_data['date'].min().date()
+    return version_first_dates
+
+def legacy_version_dates(df, versions):
+    """Eski get_version_dates: versiyon başına filtre + pd.to_datetime"""
+    version_dates = {}
+    for version_name in versions:
+        version_data = df[df['version'] == version_name]
+        dates = pd.to_datetime(version_data['date'], errors='coerce').dropna()
+        version_dates[version_name] = dates.min().strftime('%m.%y') if len(dates) > 0 else "N/A"
+    return version_dates
+
+def new_first_dates(df):
+    first_seen = version_timeline(df[~is_missing_version(df['app_version'])])['first_seen'].dropna()
+    return {version_name: first_date.date() for version_name, first_date in first_seen.items()}
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def run(rows_list, versions):
+    print(f"{'satır':>10} {'versiyon':>9} {'hesap':>22} {'eski (sn)':>10} {'yeni (sn)':>10} {'hızlanma':>9}")
+    for rows in rows_list:
+        df = make_version_history(rows, versions)
+        df['app_version'] = df['app_version'].astype(str)
+        analysis_df = df[df['app_version'] != ''].rename(columns={'app_version': 'version'})
+        all_versions = analysis_df['version'].unique().tolist()
+
+        cases = [
+            ('düzeltici ilk görülme', legacy_first_dates, new_first_dates, (df,)),
+            ('analiz versiyon tarihi', legacy_version_dates, get_version_dates, (analysis_df, all_versions)),
+        ]
+        for name, legacy, new, args in cases:
+            expected, legacy_seconds = timed(legacy, *args)
+            result, new_seconds = timed(new, *args)
+            # Sıra da aynı olmalı - eşit tarihli versiyonların progression'daki yeri buna bağlı
+            assert list(result.items()) == list(expected.items()), f"{name} sonucu farklı ({rows} satır)"
+            print(f"{rows:>10,} {len(all_versions):>9} {name:>22} {legacy_seconds:>10.2f} {new_seconds:>10.3f} "
+                  f"{legacy_seconds / new_seconds:>8,.0f}x")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Versiyon zaman çizelgesi benchmark'ı")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS))
+    parser.add_argument('--versions', type=int, default=DEFAULT_VERSIONS)
+    args = parser.parse_args(argv)
+    run(args.rows, args.versions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Sahte Çevirmen (Çeviri Benchmark'ları)
+Google isteği yerine sabit gecikmeli bir çevirmen ve İngilizce yorum kelime havuzu. translator_streamlit
+headless modda yüklenir; çeviri önbelleği benchmark'ları bu modülden çevirmeni kurar ve geçici önbellek açar.
+
+Kullanım:
+    from benchmarks.fake_translator import LatencyTranslator, install_fake_translator, temporary_translation_cache
+    install_fake_translator(latency_ms=20)
+    with temporary_translation_cache(work_dir):
+        translator_streamlit.translate_reviews(df)
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from streamlit_compat import set_headless
+set_headless(True)
+
+import translation_cache
+import translator_streamlit
+from translation_cache import TranslationCache
+
+# İngilizce yorum kelimeleri - uzun / tekil yorum metinleri bunlardan üretilir
+WORDS = np.array(['good', 'bad', 'app', 'crashes', 'after', 'update', 'login', 'slow', 'great', 'payment', 'fails',
+                  'love', 'it', 'too', 'many', 'ads', 'notifications', 'not', 'working', 'please', 'fix', 'ticket',
+                  'seat', 'train', 'refund', 'screen', 'freezes', 'support', 'never', 'answers', 'booking'])
+
+class LatencyTranslator:
+    """Google isteği yerine sabit gecikme - boşluk farkını gerçek çevirmen gibi yok sayar, çağrılar sayılır"""
+    calls = 0
+    latency = 0.02
+
+    def translate(self, text, src='auto', dest='tr'):
+        LatencyTranslator.calls += 1
+        time.sleep(LatencyTranslator.latency)
+        return type('Translated', (), {'text': f"[{dest}] {' '.join(text.split())}"})()
+
+def install_fake_translator(latency_ms):
+    """translator_streamlit'in Google çevirmenini LatencyTranslator ile değiştir ve sayacı sıfırla"""
+    LatencyTranslator.latency = latency_ms / 1000
+    LatencyTranslator.calls = 0
+    translator_streamlit.TRANSLATOR_AVAILABLE = True
+    translator_streamlit.Translator = LatencyTranslator
+
+@contextmanager
+def temporary_translation_cache(work_dir, name='cache.sqlite3'):
+    """Süreç genelindeki çeviri önbelleğini work_dir altında boş bir önbellekle değiştir, çıkışta bırak"""
+    translation_cache._translation_cache = TranslationCache(os.path.join(work_dir, name))
+    try:
+        yield translation_cache._translation_cache
+    finally:
+        translation_cache._translation_cache = None
@@ -0,0 +1,114 @@
+"""
+Sentetik Play Store Sürüm Geçmişi
+Gerçekçi sürüm takvimli yorum verisi üretir: düzensiz sürüm aralıkları ve hotfix'ler, kademeli güncelleme (rollout),
+sürüm sonrası yorum patlamaları ve hafta sonu etkisiyle çarpık yorum hacmi, sırasız (eski / beta / hiç yayınlanmamış)
+versiyon bildiren kullanıcılar ve zamanla azalan boş versiyon oranı.
+
+Kullanım:
+    from benchmarks.synthetic_history import make_release_history
+    df = make_release_history(100_000, seed=7)
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_START = '2021-01-01'
+DEFAULT_DAYS = 1000
+
+# Yorum metni / yazar havuzları - satır başına metin üretmek 1M satırda çok yavaş
+_WORDS = np.array(['uygulama', 'güncelleme', 'sonrası', 'hata', 'veriyor', 'çok', 'güzel', 'yavaş', 'giriş',
+                   'yapamıyorum', 'reklam', 'fazla', 'harika', 'çöküyor', 'teşekkürler', 'bildirim', 'gelmiyor',
+                   'ödeme', 'sorunu', 'var', 'yeni', 'tasarım', 'beğendim', 'eski', 'sürüm', 'daha', 'iyiydi'])
+_TEXT_POOL_SIZE = 5000
+_AUTHOR_POOL_SIZE = 20000
+
+# Puan dağılımı - Play Store'daki tipik J eğrisi
+_RATING_PROBS = [0.16, 0.05, 0.07, 0.14, 0.58]
+
+def make_release_calendar(days=DEFAULT_DAYS, seed=42, mean_interval_days=9.0, hotfix_rate=0.3, start=DEFAULT_START):
+    """
+    Sürüm adları ve yayın tarihleri: gamma dağılımlı düzensiz aralıklar, sürümlerden sonra 1-4 gün içinde hotfix
+    (patch) sürümleri, ara sıra atlanan minor numarası ve her 20 minor'da bir major sürüm.
+    """
+    rng = np.random.default_rng(seed)
+    names, offsets = [], []
+    major, minor, patch = 1, 0, 0
+    day = 0.0
+    while day < days:
+        names.append(f"{major}.{minor}.{patch}")
+        offsets.append(day)
+        if rng.random() < hotfix_rate:
+            patch += 1
+            day += rng.uniform(1, 4)
+        else:
+            minor += 2 if rng.random() < 0.05 else 1
+            patch = 0
+            if minor >= 20:
+                major, minor = major + 1, 0
+            day += rng.gamma(4.0, mean_interval_days / 4.0)
+    dates = pd.Timestamp(start) + pd.to_timedelta(np.array(offsets), unit='D')
+    return np.array(names, dtype=object), dates
+
+def _daily_volume(days, release_days, rng, start=DEFAULT_START, spike=4.0, spike_decay_days=3.0):
+    """Gün başına yorum ağırlığı: büyüyen taban + hafta sonu etkisi + sürüm sonrası sönümlenen patlamalar"""
+    day_grid = np.arange(days)
+    weights = 1.0 + day_grid / days
+    weights *= np.where((pd.Timestamp(start).dayofweek + day_grid) % 7 >= 5, 1.3, 1.0)
+    since_release = day_grid[:, None] - release_days[None, :]
+    weights += spike * np.where(since_release >= 0, np.exp(-since_release / spike_decay_days), 0).sum(axis=1)
+    weights *= rng.lognormal(0, 0.25, days)  # günlük gürültü
+    return weights / weights.sum()
+
+def make_release_history(rows, days=DEFAULT_DAYS, seed=42, missing_rate=0.3, stale_rate=0.01,
+                         beta_rate=0.003, bogus_rate=0.001, start=DEFAULT_START):
+    """
+    Play Store yorum verisi (review_id, author_name, content, rating, helpful_count, app_version, date), tarihe göre sıralı.
+
+    missing_rate: ortalama boş versiyon oranı - eski yorumlarda daha yüksek
+    stale_rate: çok eski (yayınlanmış) bir sürümü bildiren kullanıcılar
+    beta_rate: bir sonraki sürümü yayından önce '-beta' etiketiyle bildiren erken erişim kullanıcıları
+    bogus_rate: hiç yayınlanmamış düşük numaralı versiyonlar (kullanıcı hatası)
+    """
+    rng = np.random.default_rng(seed)
+    names, release_dates = make_release_calendar(days, seed=seed, start=start)
+    release_days = ((release_dates - pd.Timestamp(start)) / pd.Timedelta(days=1)).to_numpy()
+
+    # Çarpık hacim: gün örneklenir, gün içi saat düzgün dağılır
+    review_days = rng.choice(days, size=rows, p=_daily_volume(days, release_days, rng, start=start))
+    offsets = np.sort(review_days + rng.random(rows))
+    dates = pd.Timestamp(start) + pd.to_timedelta(offsets * 24 * 60, unit='min')
+
+    # Kademeli güncelleme: yayından sonraki günlerde yeni sürüme geçen kullanıcı oranı lojistik artar
+    current = np.searchsorted(release_days, offsets, side='right') - 1
+    days_since = offsets - release_days[current]
+    adopted = rng.random(rows) < 1 / (1 + np.exp(-(days_since - 3) / 1.5))
+    lag = np.where(adopted, 0, rng.geometric(0.6, rows))
+    versions = names[np.clip(current - lag, 0, None)]
+
+    # Sırasız bildirilen versiyonlar
+    draw = rng.random(rows)
+    stale = (draw < stale_rate) & (current > 5)
+    versions[stale] = names[rng.integers(0, np.maximum(current[stale] - 5, 1))]
+
+    beta = (draw >= stale_rate) & (draw < stale_rate + beta_rate) & (current < len(names) - 1)
+    versions[beta] = [f"{name}-beta" for name in names[current[beta] + 1]]
+
+    bogus = (draw >= stale_rate + beta_rate) & (draw < stale_rate + beta_rate + bogus_rate)
+    versions[bogus] = [f"0.{minor}.{patch}" for minor, patch in zip(rng.integers(1, 10, bogus.sum()),
+                                                                     rng.integers(0, 5, bogus.sum()))]
+
+    # Boş versiyon oranı zamanla azalır (ortalama missing_rate)
+    missing_probability = np.clip(missing_rate * (1.5 - offsets / days), 0, 1)
+    versions[rng.random(rows) < missing_probability] = ''
+
+    text_pool = np.array([' '.join(rng.choice(_WORDS, rng.integers(3, 25))) for _ in range(_TEXT_POOL_SIZE)],
+                         dtype=object)
+    return pd.DataFrame({
+        'review_id': [f"gp:{seed}:{i}" for i in range(rows)],
+        'author_name': np.char.add('Kullanıcı ', rng.integers(0, _AUTHOR_POOL_SIZE, rows).astype(str)).astype(object),
+        'content': text_pool[rng.integers(0, _TEXT_POOL_SIZE, rows)],
+        'rating': rng.choice(np.arange(1, 6), size=rows, p=_RATING_PROBS),
+        'helpful_count': rng.geometric(0.5, rows) - 1,
+        'app_version': versions,
+        'date': dates,
+    })
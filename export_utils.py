@@ -0,0 +1,284 @@
+"""
+Dışa Aktarma Yardımcıları
+İndirme dosyaları sadece istendiğinde üretilir ve (veri versiyonu, sütunlar, format)
+anahtarıyla, toplam boyutu sınırlı bir LRU önbellekte tutulur.
+CSV/JSON/TXT yazıcıları satırları parça parça, vektörel biçimlendirmeyle yazar;
+Parquet/Arrow tipleri koruyan ikili formatlardır.
+"""
+
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+from streamlit_compat import st
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+EXPORT_CHUNK_SIZE = 50_000
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+EXPORT_FORMATS = {
+    'csv': {'label': "CSV", 'extension': 'csv', 'mime': "text/csv"},
+    'json': {'label': "JSON", 'extension': 'json', 'mime': "application/json"},
+    'txt': {'label': "TXT", 'extension': 'txt', 'mime': "text/plain"},
+    'parquet': {'label': "Parquet", 'extension': 'parquet', 'mime': "application/vnd.apache.parquet"},
+    'arrow': {'label': "Arrow", 'extension': 'arrow', 'mime': "application/vnd.apache.arrow.file"},
+}
+
+# İkili formatlar tipleri korur - tekrar okurken CSV ayrıştırması gerekmez
+BINARY_COMPRESSION = 'zstd'
+
+class ExportCache:
+    """Bayt bütçeli LRU önbellek - süreç genelinde tüm oturumlar paylaşır"""
+
+    def __init__(self, max_bytes=EXPORT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            # Bütçeden büyük dosya önbelleğe alınmaz, sadece döndürülür
+            return
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= len(self.entries.pop(key))
+            self.entries[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+_export_cache = ExportCache()
+
+def data_version_hash(df):
+    """Verinin içerik özeti (sütunlar, tipler, index ve değerler) - sonuç oluşturulurken bir kez hesaplanır (1M satırda ~2 sn)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return hasher.hexdigest()
+
+def data_version_token(df, metadata=None):
+    """
+    İndirme önbelleği anahtarındaki veri versiyonu: sonuç oluşturulurken metadata['data_version']'a yazılan içerik özeti
+    (rerun başına O(1)). Önbellek tüm oturumlarca paylaşıldığından yoksa burada hesaplanıp metadata'ya yazılır;
+    sonucu yerinde değiştiren kod metadata['data_version']'ı data_version_hash ile yenilemelidir.
+    """
+    if metadata is None:
+        return data_version_hash(df)
+    if not metadata.get('data_version'):
+        metadata['data_version'] = data_version_hash(df)
+    return metadata['data_version']
+
+def export_cache_key(data_version, columns, fmt, keep_types=False):
+    """(veri versiyonu, sütunlar, format, tip koruma) anahtarının hash'i"""
+    payload = json.dumps([data_version, list(columns), fmt, keep_types], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def prepare_export_frame(df, columns):
+    """Seçili sütunları al ve tarihi Gün/Ay/Yıl formatına çevir"""
+    filtered_df = df[columns].copy()
+
+    if 'date' in filtered_df.columns:
+        filtered_df['date'] = pd.to_datetime(filtered_df['date'], errors='coerce')
+        filtered_df['date'] = filtered_df['date'].dt.strftime('%d/%m/%Y')
+
+    return filtered_df
+
+def _text_column(chunk, column):
+    """Sütunu metne çevir - eksik değerler 'nan' olarak yazılır (pandas sürümünden bağımsız)"""
+    return chunk[column].astype(str).fillna('nan')
+
+def write_csv(df, out, chunk_size=EXPORT_CHUNK_SIZE):
+    """CSV'yi parça parça yaz - başlık sadece ilk parçada"""
+    for start in range(0, max(len(df), 1), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        out.write(chunk.to_csv(index=False, header=start == 0).encode('utf-8'))
+
+def write_json_records(df, out, chunk_size=EXPORT_CHUNK_SIZE):
+    """to_json(orient='records', indent=2) çıktısının aynısını parça parça yaz"""
+    if df.empty:
+        out.write(b"[\n\n]")
+        return
+
+    out.write(b"[")
+    for start in range(0, len(df), chunk_size):
+        chunk_json = df.iloc[start:start + chunk_size].to_json(orient='records', force_ascii=False, indent=2)
+        if start > 0:
+            out.write(b",")
+        # "[" ve "\n]" parça sınırlarını at, kayıtları birleştir
+        out.write(chunk_json[1:-2].encode('utf-8'))
+    out.write(b"\n]")
+
+def write_txt_records(df, out, fields, header="", row_prefix=None, separator="---", chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Her satırı 'Etiket: değer' blokları halinde parça parça yaz (satır sınırı yok).
+
+    fields: [(etiket, [aday sütunlar])] - ilk bulunan sütun kullanılır, yoksa 'N/A'
+    row_prefix: satır index'inden blok başlığı üreten fonksiyon (ör. '#1')
+    """
+    if header:
+        out.write(header.encode('utf-8'))
+
+    resolved_fields = []
+    for label, candidates in fields:
+        column = next((col for col in candidates if col in df.columns), None)
+        resolved_fields.append((label, column))
+
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        block = pd.Series("", index=chunk.index)
+
+        if row_prefix is not None:
+            block = block + row_prefix(chunk.index) + "\n"
+
+        for label, column in resolved_fields:
+            values = _text_column(chunk, column) if column is not None else "N/A"
+            block = block + f"{label}: " + values + "\n"
+
+        block = block + separator + "\n"
+        out.write("".join(block.tolist()).encode('utf-8'))
+
+def _arrow_safe_frame(df):
+    """Karışık tipli object sütunları (ör. '3.1' ve 3.1 birlikte) metne çevir - Arrow tek tip ister"""
+    mixed_columns = [
+        col for col in df.columns
+        if df[col].dtype == object and df[col].dropna().map(type).nunique() > 1
+    ]
+    if not mixed_columns:
+        return df
+    df = df.copy()
+    for col in mixed_columns:
+        df[col] = df[col].astype(object).where(df[col].isna(), df[col].astype(str))
+    return df
+
+def write_parquet(df, out):
+    """Parquet (zstd) olarak yaz - tipler ve category sütunlar korunur"""
+    _arrow_safe_frame(df).to_parquet(out, index=False, compression=BINARY_COMPRESSION)
+
+def write_arrow(df, out):
+    """Arrow IPC dosyası (Feather v2, zstd) olarak yaz"""
+    _arrow_safe_frame(df).reset_index(drop=True).to_feather(out, compression=BINARY_COMPRESSION)
+
+BINARY_WRITERS = {'parquet': write_parquet, 'arrow': write_arrow}
+
+def export_to_bytes(writer, df, *args, **kwargs):
+    """Yazıcıyı diske taşabilen geçici dosyaya çalıştırıp sonucu bytes olarak döndür"""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as out:
+        writer(df, out, *args, **kwargs)
+        out.seek(0)
+        return out.read()
+
+def build_export(df, columns, fmt, metadata=None, keep_types=False):
+    """
+    Seçili sütunlardan istenen formatta indirme dosyası üret (bytes).
+    keep_types: tarih Gün/Ay/Yıl metnine çevrilmez - Parquet/Arrow modüller arası aktarımda tipleri korur
+    """
+    metadata = metadata or {}
+    filtered_df = df[columns] if keep_types else prepare_export_frame(df, columns)
+
+    if fmt == 'csv':
+        return export_to_bytes(write_csv, filtered_df)
+
+    if fmt == 'json':
+        return export_to_bytes(write_json_records, filtered_df)
+
+    if fmt == 'txt':
+        header = f"Scraping Verileri - {metadata.get('timestamp', '')}\n"
+        header += f"Tarih Aralığı: {metadata.get('date_range', 'Bilinmiyor')}\n"
+        header += f"Toplam Yorum: {len(filtered_df)}\n"
+        header += f"Seçilen Sütunlar: {', '.join(columns)}\n"
+        header += "=" * 50 + "\n\n"
+
+        return export_to_bytes(
+            write_txt_records, filtered_df,
+            fields=[(col, [col]) for col in columns],
+            header=header,
+            row_prefix=lambda index: "#" + pd.Series(index + 1, index=index).astype(str),
+            separator="-" * 30
+        )
+
+    if fmt in BINARY_WRITERS:
+        return export_to_bytes(BINARY_WRITERS[fmt], filtered_df)
+
+    raise ValueError(f"Desteklenmeyen format: {fmt}")
+
+def _session_data_version(df, key):
+    """Aynı DataFrame nesnesi için oturumda sabit, oturumlar arası benzersiz veri versiyonu - rerun başına O(1)"""
+    state_key = f"{key}_data_version"
+    entry = st.session_state.get(state_key)
+    if entry is None or entry['frame'] is not df:
+        entry = {'frame': df, 'version': uuid.uuid4().hex}
+        st.session_state[state_key] = entry
+    return entry['version']
+
+def render_binary_downloads(df, file_stem, key, data_version=None):
+    """
+    Parquet ve Arrow indirme butonları - modüller arası aktarımda tipler korunur.
+    Dosyalar sadece "Hazırla" ile üretilip paylaşılan indirme önbelleğine konur; diğer rerun'larda iş yapılmaz.
+    data_version verilmezse DataFrame nesnesine oturumda bir kez atanan rastgele versiyon kullanılır.
+    """
+    if data_version is None:
+        data_version = _session_data_version(df, key)
+    columns = list(df.columns)
+
+    for column, fmt in zip(st.columns(len(BINARY_WRITERS)), BINARY_WRITERS):
+        fmt_info = EXPORT_FORMATS[fmt]
+        with column:
+            data = get_cached_export(data_version, columns, fmt, keep_types=True)
+
+            if data is None and st.button(
+                f"📦 {fmt_info['label']} Hazırla",
+                key=f"{key}_prepare_{fmt}",
+                use_container_width=True
+            ):
+                try:
+                    with st.spinner(f"{fmt_info['label']} hazırlanıyor..."):
+                        data = get_or_build_export(df, columns, fmt, data_version, keep_types=True)
+                except Exception as e:
+                    st.warning(f"⚠️ {fmt_info['label']} oluşturulamadı: {e}")
+                    continue
+
+            if data is not None:
+                st.download_button(
+                    label=f"🗜️ {fmt_info['label']} İndir",
+                    data=data,
+                    file_name=f"{file_stem}.{fmt_info['extension']}",
+                    mime=fmt_info['mime'],
+                    key=f"{key}_{fmt}",
+                    use_container_width=True
+                )
+
+def get_cached_export(data_version, columns, fmt, keep_types=False):
+    """Önbellekte hazır dosya varsa döndür, yoksa None - hiçbir dışa aktarma işi yapmaz"""
+    return _export_cache.get(export_cache_key(data_version, columns, fmt, keep_types))
+
+def get_or_build_export(df, columns, fmt, data_version, metadata=None, keep_types=False):
+    """Önbellekte yoksa dosyayı üretip önbelleğe koy"""
+    key = export_cache_key(data_version, columns, fmt, keep_types)
+    data = _export_cache.get(key)
+    if data is None:
+        data = build_export(df, columns, fmt, metadata, keep_types=keep_types)
+        _export_cache.put(key, data)
+        logger.info(f"Dışa aktarma üretildi: {fmt} - {len(data):,} bayt")
+    return data
@@ -0,0 +1,182 @@
+"""
+Arka Plan İş Yöneticisi
+Pipeline işlerini Streamlit rerun'larından bağımsız worker thread'lerinde çalıştırır.
+İş durumu ve ilerlemesi jobs/ klasöründe JSON olarak, sonuçlar pickle olarak saklanır.
+"""
+
+import json
+import logging
+import os
+import pickle
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from json_utils import json_default
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+JOBS_DIR = "jobs"
+DEFAULT_MAX_WORKERS = 2
+
+# İş durumları
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_INTERRUPTED = "interrupted"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+class JobManager:
+    """Süreç genelinde tek örnek - tüm Streamlit oturumları aynı kuyruğu paylaşır"""
+
+    def __init__(self, jobs_dir=JOBS_DIR, max_workers=DEFAULT_MAX_WORKERS):
+        self.jobs_dir = jobs_dir
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pipeline-job')
+        self.lock = threading.Lock()
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._mark_interrupted_jobs()
+
+    def _status_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _result_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.pkl")
+
+    def _write_job(self, job):
+        """Durumu geçici dosyaya yazıp atomik olarak taşı - okuyucular yarım dosya görmez"""
+        tmp_path = self._status_path(job['id']) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False, indent=2, default=json_default)
+        os.replace(tmp_path, self._status_path(job['id']))
+
+    def _update_job(self, job_id, **changes):
+        with self.lock:
+            job = self.get_job(job_id)
+            if job is None:
+                return
+            job.update(changes)
+            self._write_job(job)
+
+    def _mark_interrupted_jobs(self):
+        """Sunucu yeniden başladığında yarım kalmış işleri işaretle"""
+        for job in self.list_jobs():
+            if job.get('status') in ACTIVE_STATUSES:
+                job['status'] = STATUS_INTERRUPTED
+                job['message'] = "⚠️ Sunucu yeniden başladı, iş yarıda kaldı"
+                self._write_job(job)
+
+    def submit(self, config, label=None, target=None):
+        """İşi kuyruğa al ve iş kimliğini döndür - target verilmezse tam pipeline çalışır"""
+        job_id = datetime.now().strftime("%Y%m%d_%H%M%S_") + uuid.uuid4().hex[:6]
+        job = {
+            'id': job_id,
+            'label': label or f"{config.get('package_name', '')} / {config.get('app_id', '')}",
+            'status': STATUS_QUEUED,
+            'progress': 0.0,
+            'message': "⏳ Kuyrukta bekliyor",
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'started_at': None,
+            'finished_at': None,
+            'config': config,
+            'messages': [],
+            'error': None,
+            'result_path': None
+        }
+        with self.lock:
+            self._write_job(job)
+
+        self.executor.submit(self._run_job, job_id, config, target)
+        logger.info(f"İş kuyruğa alındı: {job_id}")
+        return job_id
+
+    def _run_job(self, job_id, config, target):
+        self._update_job(job_id, status=STATUS_RUNNING, message="🔄 Başladı",
+                         started_at=datetime.now().isoformat(timespec='seconds'))
+
+        def progress_callback(progress, message):
+            self._update_job(job_id, progress=round(float(progress), 3), message=message)
+
+        try:
+            if target is None:
+                from review_pipeline import run_pipeline
+                target = run_pipeline
+
+            result = target(config, progress_callback=progress_callback)
+
+            with open(self._result_path(job_id), 'wb') as f:
+                pickle.dump(result, f)
+
+            self._update_job(
+                job_id,
+                status=STATUS_DONE,
+                progress=1.0,
+                message="✅ Tamamlandı",
+                messages=result.get('messages', []),
+                result_path=self._result_path(job_id),
+                finished_at=datetime.now().isoformat(timespec='seconds')
+            )
+        except Exception as e:
+            logger.error(f"İş başarısız: {job_id} - {e}")
+            self._update_job(
+                job_id,
+                status=STATUS_FAILED,
+                message=f"❌ Hata: {e}",
+                error=traceback.format_exc(),
+                finished_at=datetime.now().isoformat(timespec='seconds')
+            )
+
+    def get_job(self, job_id):
+        """İş durumunu diskten oku"""
+        try:
+            with open(self._status_path(job_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def list_jobs(self, limit=None):
+        """Tüm işleri en yeniden eskiye listele"""
+        jobs = []
+        for file in os.listdir(self.jobs_dir):
+            if file.endswith('.json'):
+                job = self.get_job(file[:-len('.json')])
+                if job:
+                    jobs.append(job)
+        jobs.sort(key=lambda j: j.get('created_at') or '', reverse=True)
+        return jobs[:limit] if limit else jobs
+
+    def load_result(self, job_id):
+        """Tamamlanmış işin sonucunu yükle"""
+        job = self.get_job(job_id)
+        if not job or job.get('status') != STATUS_DONE or not job.get('result_path'):
+            return None
+        try:
+            with open(job['result_path'], 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError) as e:
+            logger.error(f"İş sonucu okunamadı: {job_id} - {e}")
+            return None
+
+    def delete_job(self, job_id):
+        """Bitmiş işin durum ve sonuç dosyalarını sil"""
+        job = self.get_job(job_id)
+        if job and job.get('status') in ACTIVE_STATUSES:
+            return False
+        for path in (self._status_path(job_id), self._result_path(job_id)):
+            if os.path.exists(path):
+                os.remove(path)
+        return True
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+def get_job_manager():
+    """Süreç genelindeki iş yöneticisini döndür (ilk çağrıda oluşturulur)"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+        return _job_manager
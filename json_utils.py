@@ -0,0 +1,14 @@
+"""
+JSON Yardımcıları
+İş kayıtları, CLI özetleri ve yenileme servisi çıktıları için ortak json.dump(default=...) fonksiyonu.
+"""
+
+from datetime import datetime, date
+
+def json_default(value):
+    """Tarih ve numpy değerlerini JSON'a yazılabilir hale getir"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
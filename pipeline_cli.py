@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless Pipeline Komut Satırı
+Master app ile aynı çek → düzelt → çevir → analiz pipeline'ını tarayıcı olmadan
+bir veya birden fazla uygulama için config dosyasından çalıştırır (cron için).
+
+Kullanım:
+    python pipeline_cli.py --config pipeline_config.json
+    python pipeline_cli.py --config pipeline_config.json --app tcdd --days 30
+
+Çıktılar: <output_dir>/<run_id>/<app>/reviews.csv (output_formats ile .parquet/.arrow), analysis.json
+ve run özeti summary.json
+Çıkış kodu: 0 başarılı, 1 en az bir uygulama başarısız, 2 config hatası
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, date, timedelta
+
+# UI kütüphaneleri hiç yüklenmesin - pipeline modülleri import edilmeden önce
+from streamlit_compat import set_headless
+set_headless(True)
+
+from json_utils import json_default
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = "pipeline_runs"
+DEFAULT_DAYS = 90
+DEFAULT_OUTPUT_FORMATS = ['csv']
+OUTPUT_FORMATS = ('csv', 'parquet', 'arrow')
+
+PIPELINE_FLAGS = (
+    'enable_play_store', 'enable_app_store', 'enable_version_fix',
+    'enable_translation', 'enable_analysis', 'streaming_mode', 'arrow_text', 'use_scrape_cache'
+)
+
+class ConfigError(Exception):
+    """Config dosyası okunamadı veya eksik/hatalı alan içeriyor"""
+
+def _parse_date(value, field):
+    try:
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
+    except ValueError:
+        raise ConfigError(f"Geçersiz tarih ({field}): {value} - YYYY-MM-DD formatı kullanın")
+
+def load_config(path):
+    """JSON config dosyasını oku ve temel yapıyı doğrula"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"Config okunamadı: {path} - {e}")
+
+    apps = config.get('apps')
+    if not isinstance(apps, list) or not apps:
+        raise ConfigError("Config'te en az bir uygulama içeren 'apps' listesi olmalı")
+
+    unknown_formats = set(config.get('output_formats', DEFAULT_OUTPUT_FORMATS)) - set(OUTPUT_FORMATS)
+    if unknown_formats:
+        raise ConfigError(f"Desteklenmeyen output_formats: {', '.join(sorted(unknown_formats))} "
+                          f"(seçenekler: {', '.join(OUTPUT_FORMATS)})")
+
+    for i, app in enumerate(apps):
+        if not app.get('package_name') and not app.get('app_id'):
+            raise ConfigError(f"apps[{i}]: 'package_name' veya 'app_id' alanlarından en az biri gerekli")
+
+    return config
+
+def resolve_app_configs(config, only_apps=None, overrides=None):
+    """Varsayılanları uygulama ayarlarıyla birleştirip run_pipeline config'lerine çevir"""
+    from review_pipeline import build_pipeline_config
+
+    defaults = config.get('defaults', {})
+    overrides = {k: v for k, v in (overrides or {}).items() if v is not None}
+    resolved = []
+
+    for app in config['apps']:
+        settings = {**defaults, **app, **overrides}
+        name = settings.get('name') or settings.get('package_name') or str(settings.get('app_id'))
+
+        if only_apps and name not in only_apps:
+            continue
+
+        end_date = _parse_date(settings['end_date'], 'end_date') if settings.get('end_date') else date.today()
+        if settings.get('start_date'):
+            start_date = _parse_date(settings['start_date'], 'start_date')
+        else:
+            start_date = end_date - timedelta(days=int(settings.get('days', DEFAULT_DAYS)))
+
+        if start_date >= end_date:
+            raise ConfigError(f"{name}: başlangıç tarihi bitiş tarihinden önce olmalı")
+
+        package_name = settings.get('package_name') or ''
+        app_id = str(settings.get('app_id') or '')
+        flags = {flag: bool(settings[flag]) for flag in PIPELINE_FLAGS if flag in settings}
+        flags.setdefault('enable_play_store', bool(package_name))
+        flags.setdefault('enable_app_store', bool(app_id))
+
+        resolved.append((name, build_pipeline_config(package_name, app_id, start_date, end_date, **flags)))
+
+    if only_apps and not resolved:
+        raise ConfigError(f"Config'te seçilen uygulama bulunamadı: {', '.join(only_apps)}")
+
+    return resolved
+
+def summarize_analysis(analysis_data):
+    """Analiz sonucunu DataFrame'siz, JSON'a yazılabilir özet haline getir"""
+    summary = {}
+    for platform, data in analysis_data.items():
+        summary[platform] = {
+            'top_versions': data['top_versions'],
+            'versions': {
+                display_version: {
+                    'version': stats['original_version'],
+                    'total': stats['total'],
+                    'avg_rating': round(float(stats['avg_rating']), 3) if stats['total'] else None,
+                    'counts': {str(rating): count for rating, count in stats['counts'].items()},
+                    'percentages': {str(rating): round(float(pct), 2) for rating, pct in stats['percentages'].items()}
+                }
+                for display_version, stats in data['version_ratings'].items()
+            }
+        }
+    return summary
+
+def write_outputs(result, app_dir, output_formats=None):
+    """Pipeline sonucunu diske yaz, yazılan dosyaların yollarını döndür"""
+    from export_utils import BINARY_WRITERS, EXPORT_FORMATS
+
+    outputs = {}
+    if result['scraped_data'] is not None or result['analysis_data']:
+        os.makedirs(app_dir, exist_ok=True)
+
+    if result['scraped_data'] is not None:
+        for fmt in output_formats or DEFAULT_OUTPUT_FORMATS:
+            path = os.path.join(app_dir, f"reviews.{EXPORT_FORMATS[fmt]['extension']}")
+            if fmt == 'csv':
+                result['scraped_data'].to_csv(path, index=False, encoding='utf-8')
+            else:
+                with open(path, 'wb') as f:
+                    BINARY_WRITERS[fmt](result['scraped_data'], f)
+            outputs[f'reviews_{fmt}'] = path
+
+    if result['analysis_data']:
+        outputs['analysis_json'] = os.path.join(app_dir, "analysis.json")
+        with open(outputs['analysis_json'], 'w', encoding='utf-8') as f:
+            json.dump(summarize_analysis(result['analysis_data']), f, ensure_ascii=False, indent=2, default=json_default)
+
+    return outputs
+
+def run_app(name, pipeline_config, run_dir, output_formats=None):
+    """Tek uygulama için pipeline'ı çalıştır - hata diğer uygulamaları durdurmaz"""
+    from review_pipeline import run_pipeline
+
+    started = time.perf_counter()
+    app_summary = {
+        'name': name,
+        'package_name': pipeline_config['package_name'],
+        'app_id': pipeline_config['app_id'],
+        'start_date': pipeline_config['start_date'],
+        'end_date': pipeline_config['end_date'],
+        'status': 'failed',
+        'rows': 0,
+        'outputs': {},
+        'messages': [],
+        'error': None
+    }
+
+    def log_progress(progress, message):
+        logger.info(f"[{name}] %{progress * 100:.0f} - {message}")
+
+    def log_message(level, message):
+        logger.log(logging.ERROR if level == 'error' else logging.WARNING if level == 'warning' else logging.INFO,
+                   f"[{name}] {message}")
+
+    try:
+        result = run_pipeline(pipeline_config, progress_callback=log_progress, notify=log_message)
+        metadata = result['metadata']
+
+        app_summary['messages'] = [{'level': level, 'message': message} for level, message in result['messages']]
+        app_summary['outputs'] = write_outputs(result, os.path.join(run_dir, name), output_formats)
+        app_summary['rows'] = int(metadata.get('total_count', 0))
+        app_summary['play_count'] = int(metadata.get('play_count', 0))
+        app_summary['app_count'] = int(metadata.get('app_count', 0))
+        if metadata.get('stream_stats'):
+            app_summary['stream_stats'] = metadata['stream_stats']
+        app_summary['stage_metrics'] = metadata.get('stage_metrics', [])
+        app_summary['status'] = 'ok' if result['scraped_data'] is not None else 'empty'
+
+    except Exception as e:
+        logger.exception(f"[{name}] Pipeline hatası: {e}")
+        app_summary['error'] = str(e)
+
+    app_summary['duration_seconds'] = round(time.perf_counter() - started, 2)
+    return app_summary
+
+def run_batch(config, only_apps=None, overrides=None, output_dir=None):
+    """Config'teki tüm (veya seçilen) uygulamaları sırayla çalıştır, run özetini döndür"""
+    app_configs = resolve_app_configs(config, only_apps, overrides)
+
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_dir = os.path.join(output_dir or config.get('output_dir', DEFAULT_OUTPUT_DIR), run_id)
+    os.makedirs(run_dir, exist_ok=True)
+
+    started_at = datetime.now()
+    apps = []
+    for name, pipeline_config in app_configs:
+        logger.info(f"▶ {name} başlıyor ({pipeline_config['start_date']} - {pipeline_config['end_date']})")
+        apps.append(run_app(name, pipeline_config, run_dir, config.get('output_formats', DEFAULT_OUTPUT_FORMATS)))
+
+    summary = {
+        'run_id': run_id,
+        'run_dir': run_dir,
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'duration_seconds': round((datetime.now() - started_at).total_seconds(), 2),
+        'succeeded': sum(app['status'] != 'failed' for app in apps),
+        'failed': sum(app['status'] == 'failed' for app in apps),
+        'total_rows': sum(app['rows'] for app in apps),
+        'apps': apps
+    }
+
+    summary['summary_path'] = os.path.join(run_dir, "summary.json")
+    with open(summary['summary_path'], 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2, default=json_default)
+
+    return summary
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Yorum pipeline'ını Streamlit olmadan çalıştır")
+    parser.add_argument('--config', required=True, help="JSON config dosyası")
+    parser.add_argument('--app', action='append', dest='apps', help="Sadece bu uygulamayı çalıştır (tekrarlanabilir)")
+    parser.add_argument('--output-dir', help="Çıktı klasörü (config'teki output_dir'i ezer)")
+    parser.add_argument('--start-date', help="YYYY-MM-DD - tüm uygulamalar için başlangıç tarihi")
+    parser.add_argument('--end-date', help="YYYY-MM-DD - tüm uygulamalar için bitiş tarihi")
+    parser.add_argument('--days', type=int, help="Başlangıç tarihi verilmezse bitişten kaç gün geriye gidilsin")
+    return parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+
+    overrides = {'start_date': args.start_date, 'end_date': args.end_date, 'days': args.days}
+    if args.days is not None and args.start_date is None:
+        # --days verildiyse config'teki sabit başlangıç tarihi geçersiz sayılır
+        overrides['start_date'] = ''
+
+    try:
+        config = load_config(args.config)
+        summary = run_batch(config, only_apps=args.apps, overrides=overrides, output_dir=args.output_dir)
+    except ConfigError as e:
+        logger.error(f"❌ {e}")
+        return 2
+
+    # Makine tarafından okunacak özet stdout'a, loglar stderr'e
+    json.dump(summary, sys.stdout, ensure_ascii=False, indent=2, default=json_default)
+    sys.stdout.write("\n")
+    return 1 if summary['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,13 +7,14 @@ google-play-scraper kütüphanesini kullanır
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 import pandas as pd
 
-try:
-    import streamlit as st
-except:
-    st = None
+from streamlit_compat import st
+from review_store import get_review_store
+from export_utils import render_binary_downloads
+from scrape_cache import get_scrape_cache, scrape_cache_key
+from rate_limiter import wait_for_slot
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -44,6 +45,7 @@ def use_google_play_scraper_library(package_name: str, count: int = 100, lang: s
         
         # google-play-scraper ile veri çek
         try:
+            wait_for_slot('play')
             if sort_param:
                 result, token = reviews(
                     package_name,
@@ -82,19 +84,7 @@ def use_google_play_scraper_library(package_name: str, count: int = 100, lang: s
                 if end_date and at_dt > end_date:
                     continue
             
-            processed = {
-                'author_name': r.get('userName', '') or 'Anonim',
-                'rating': int(r.get('score', 0) or 0),
-                'content': r.get('content', '') or '',
-                'date': at_dt.strftime('%Y-%m-%d %H:%M:%S') if isinstance(at_dt, datetime) else str(at_dt),
-                'helpful_count': int(r.get('thumbsUpCount', 0) or 0),
-                'reply_content': r.get('replyContent', '') or '',
-                'reply_date': str(r.get('repliedAt', '')) if r.get('repliedAt') else '',
-                'app_version': r.get('reviewCreatedVersion', '') or '',
-                'review_id': r.get('reviewId', '') or '',
-                'lang': lang,
-                'platform': 'Play Store'
-            }
+            processed = process_play_review(r, lang)
             
             # Boş içerikli yorumları atla
             if processed['content'].strip():
@@ -113,23 +103,154 @@ def use_google_play_scraper_library(package_name: str, count: int = 100, lang: s
             st.error(f"❌ Veri işleme hatası: {e}")
         return []
 
+def process_play_review(r: Dict, lang: str) -> Dict:
+    """google-play-scraper kaydını standart yorum formatına çevir"""
+    at_dt = r.get('at')
+    return {
+        'author_name': r.get('userName', '') or 'Anonim',
+        'rating': int(r.get('score', 0) or 0),
+        'content': r.get('content', '') or '',
+        'date': at_dt.strftime('%Y-%m-%d %H:%M:%S') if isinstance(at_dt, datetime) else str(at_dt),
+        'helpful_count': int(r.get('thumbsUpCount', 0) or 0),
+        'reply_content': r.get('replyContent', '') or '',
+        'reply_date': str(r.get('repliedAt', '')) if r.get('repliedAt') else '',
+        'app_version': r.get('reviewCreatedVersion', '') or '',
+        'review_id': r.get('reviewId', '') or '',
+        'lang': lang,
+        'platform': 'Play Store'
+    }
+
+def iter_play_review_batches(package_name: str, count: int = 1000, lang: str = 'tr',
+                             start_date: Optional[datetime] = None,
+                             end_date: Optional[datetime] = None,
+                             batch_size: int = 200,
+                             version_fixer=None) -> Iterator[List[Dict]]:
+    """
+    Play Store yorumlarını continuation token ile sayfa sayfa çek - her sayfa bir batch.
+    version_fixer (StreamingVersionFixer): dolu versiyonlar sayfa geldikçe geçmişe eklenir; boş versiyonlu kayıtlar
+    bekletilir ve çekim bitince tüm geçmişle doldurularak son batch olarak verilir (tam geçişle aynı sonuç)
+    """
+    for batch in _iter_raw_play_review_batches(package_name, count, lang, start_date, end_date, batch_size):
+        if version_fixer is None:
+            yield batch
+            continue
+        ready = version_fixer.hold_records(batch)
+        if ready:
+            yield ready
+    
+    if version_fixer is not None:
+        held = version_fixer.flush_records()
+        if held:
+            yield held
+
+def _iter_raw_play_review_batches(package_name, count, lang, start_date, end_date, batch_size):
+    """Play Store sayfaları - versiyon doldurmasız ham kayıtlar"""
+    try:
+        from google_play_scraper import reviews, Sort
+        sort_param = Sort.NEWEST
+    except Exception:
+        try:
+            from google_play_scraper import reviews
+            sort_param = None
+        except Exception as e:
+            logger.error(f"google-play-scraper kütüphanesi bulunamadı: {e}")
+            return
+
+    collected = 0
+    token = None
+    
+    while collected < count:
+        request_count = min(batch_size, count - collected)
+        try:
+            wait_for_slot('play')
+            if sort_param:
+                result, token = reviews(
+                    package_name,
+                    lang=lang,
+                    country='tr',
+                    sort=sort_param,
+                    count=request_count,
+                    continuation_token=token
+                )
+            else:
+                result, token = reviews(
+                    package_name,
+                    lang=lang,
+                    country='tr',
+                    count=request_count,
+                    continuation_token=token
+                )
+        except Exception as e:
+            logger.error(f"Play Store API çağrısı başarısız: {e}")
+            return
+
+        if not result:
+            return
+
+        batch = []
+        reached_older = False
+        for r in result:
+            at_dt = r.get('at')
+            
+            # Tarih filtresi uygula
+            if isinstance(at_dt, datetime):
+                if start_date and at_dt < start_date:
+                    reached_older = True
+                    continue
+                if end_date and at_dt > end_date:
+                    continue
+            
+            processed = process_play_review(r, lang)
+            
+            # Boş içerikli yorumları atla
+            if processed['content'].strip():
+                batch.append(processed)
+        
+        batch = batch[:count - collected]
+        if batch:
+            collected += len(batch)
+            yield batch
+        
+        # En yeniden eskiye sıralı: başlangıç tarihinden eskiye ulaşıldıysa dur
+        if (reached_older and sort_param) or token is None:
+            return
+
 def scrape_play_reviews(package_name: str,
                         max_count: int = 1000,
                         lang: str = 'tr',
                         start_date: Optional[datetime] = None,
-                        end_date: Optional[datetime] = None):
-    """Ana koordinatör fonksiyonu - Sadece gerçek veri"""
+                        end_date: Optional[datetime] = None,
+                        use_cache: bool = True,
+                        version_fixer=None):
+    """
+    Ana koordinatör fonksiyonu - Sadece gerçek veri (use_cache ile oturumlar arası önbellekli).
+    version_fixer (StreamingVersionFixer): boş versiyonlar çekim sırasında doldurulur - ayrı düzeltme geçişi gerekmez
+    """
     try:
         logger.info(f"Play Store scraping başlıyor: {package_name} (hedef {max_count})")
         
         # Sadece gerçek API'yi dene
-        real_reviews = use_google_play_scraper_library(
-            package_name=package_name,
-            count=max_count,
-            lang=lang,
-            start_date=start_date,
-            end_date=end_date
-        )
+        def fetch():
+            return use_google_play_scraper_library(
+                package_name=package_name,
+                count=max_count,
+                lang=lang,
+                start_date=start_date,
+                end_date=end_date
+            )
+        
+        if use_cache:
+            cache_key = scrape_cache_key('play', package_name, lang, start_date, end_date, max_count=max_count)
+            real_reviews, cache_status = get_scrape_cache().get_or_compute(cache_key, fetch)
+            if cache_status != 'miss' and st:
+                st.info(f"♻️ Play Store: {package_name} sonuçları "
+                        f"{'önbellekten alındı' if cache_status == 'hit' else 'aynı anda çalışan scraping ile paylaşıldı'}")
+        else:
+            real_reviews = fetch()
+        
+        # Önbellekte ham kayıtlar tutulur - doldurma her çağrının kendi versiyon geçmişiyle yapılır
+        if real_reviews and version_fixer is not None:
+            real_reviews = version_fixer.fix_records(real_reviews)
         
         if real_reviews:
             logger.info(f"✅ {len(real_reviews)} gerçek yorum alındı")
@@ -187,6 +308,13 @@ def main():
                 
                 # İstatistikler
                 df = pd.DataFrame(data)
+                
+                try:
+                    stored_count = get_review_store().upsert_reviews(df, platform='Play Store', app=package)
+                    st.info(f"🗄️ {stored_count:,} yorum veritabanına kaydedildi")
+                except Exception as e:
+                    st.warning(f"⚠️ Veritabanına kaydedilemedi: {e}")
+                
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
@@ -220,6 +348,7 @@ def main():
                     mime="text/csv",
                     use_container_width=True
                 )
+                render_binary_downloads(df, f"play_reviews_{package}_{datetime.now().strftime('%Y%m%d_%H%M%S')}", key="play_reviews")
             else:
                 st.error("❌ Hiç veri alınamadı. Paket adını ve tarih aralığını kontrol edin.")
 
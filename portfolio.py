@@ -0,0 +1,262 @@
+"""
+Çoklu Uygulama (Portföy) Modu
+Birden fazla (paket adı, App Store ID) çiftini ortak bir worker havuzunda çeker ve işler,
+sonuçları 'app' sütunuyla tek veri setinde birleştirir ve karşılaştırma özetlerini bir kez hesaplar.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+from streamlit_compat import st
+from review_schema import compact_reviews
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTFOLIO_WORKERS = 4
+
+def parse_portfolio(text):
+    """
+    Her satırda bir uygulama: 'ad, paket_adı, app_id' veya 'paket_adı, app_id'.
+    Boş alan o platformun atlanması demektir; '#' ile başlayan satırlar yorumdur.
+    """
+    apps = []
+    errors = []
+
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        parts = [part.strip() for part in line.split(',')]
+        if len(parts) == 2:
+            parts = [parts[0] or parts[1]] + parts
+        if len(parts) != 3:
+            errors.append(f"{line_no}. satır: 'ad, paket_adı, app_id' formatında olmalı")
+            continue
+
+        name, package_name, app_id = parts
+        if not package_name and not app_id:
+            errors.append(f"{line_no}. satır: paket adı veya App ID gerekli")
+            continue
+        if app_id and not app_id.isdigit():
+            errors.append(f"{line_no}. satır: App ID sayı olmalı ({app_id})")
+            continue
+
+        apps.append({'name': name, 'package_name': package_name, 'app_id': app_id})
+
+    names = [app['name'] for app in apps]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        errors.append(f"Aynı ad birden fazla kullanılmış: {', '.join(duplicates)}")
+
+    return apps, errors
+
+def build_portfolio_aggregates(df):
+    """Uygulamalar arası karşılaştırma tabloları - görünümler sadece bunları okur"""
+    rated = df[df['rating'].between(1, 5)]
+    rated = rated.assign(
+        negative=rated['rating'] <= 2,
+        positive=rated['rating'] >= 4
+    )
+
+    summary = rated.groupby(['app', 'platform'], observed=True).agg(
+        review_count=('rating', 'size'),
+        avg_rating=('rating', 'mean'),
+        negative_pct=('negative', 'mean'),
+        positive_pct=('positive', 'mean'),
+        version_count=('version', 'nunique'),
+    ).reset_index()
+    summary[['negative_pct', 'positive_pct']] *= 100
+
+    rating_distribution = pd.crosstab(rated['app'], rated['rating'].astype(int), normalize='index') * 100
+
+    dated = rated.dropna(subset=['date'])
+    monthly = (
+        dated.groupby(['app', dated['date'].dt.to_period('M').dt.to_timestamp()], observed=True)['rating']
+        .agg(['mean', 'size'])
+        .rename(columns={'mean': 'avg_rating', 'size': 'review_count'})
+        .reset_index()
+    )
+
+    return {
+        'summary': summary,
+        'rating_distribution': rating_distribution,
+        'monthly': monthly,
+    }
+
+def run_portfolio(apps, start_date, end_date, max_workers=DEFAULT_PORTFOLIO_WORKERS,
+                  progress_callback=None, notify=None, **pipeline_options):
+    """
+    Tüm uygulamaların pipeline'ını ortak worker havuzunda çalıştır.
+    Mağaza istekleri rate_limiter üzerinden süreç genelinde sınırlanır.
+
+    Dönüş: {'scraped_data', 'metadata', 'analysis_data', 'aggregates', 'apps', 'messages'}
+    """
+    from review_pipeline import build_pipeline_config, run_pipeline
+    from export_utils import data_version_hash
+
+    messages = []
+    messages_lock = threading.Lock()
+
+    def report(level, message):
+        with messages_lock:
+            messages.append((level, message))
+        if notify:
+            notify(level, message)
+
+    # Analiz uygulama başına değil, birleşik veri üzerinden yapılır
+    pipeline_options = dict(pipeline_options, enable_analysis=False)
+
+    def run_app(app):
+        config = build_pipeline_config(
+            app['package_name'], app['app_id'], start_date, end_date,
+            enable_play_store=bool(app['package_name']),
+            enable_app_store=bool(app['app_id']),
+            **pipeline_options
+        )
+        return run_pipeline(config, notify=lambda level, message: report(level, f"[{app['name']}] {message}"))
+
+    frames = []
+    app_results = []
+    stage_metrics = []
+    started_at = datetime.now()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='portfolio') as executor:
+        futures = {executor.submit(run_app, app): app for app in apps}
+
+        for completed, future in enumerate(as_completed(futures), 1):
+            app = futures[future]
+            app_result = {'name': app['name'], 'rows': 0, 'status': 'failed', 'error': None}
+
+            try:
+                result = future.result()
+                df = result['scraped_data']
+                if df is not None and not df.empty:
+                    frames.append(df.assign(app=app['name']))
+                    app_result.update(rows=len(df), status='ok')
+                else:
+                    app_result['status'] = 'empty'
+                stage_metrics.extend(dict(stage, app=app['name']) for stage in result['metadata'].get('stage_metrics', []))
+            except Exception as e:
+                logger.error(f"Portföy uygulaması başarısız: {app['name']} - {e}")
+                app_result['error'] = str(e)
+                report('error', f"❌ [{app['name']}] {e}")
+
+            app_results.append(app_result)
+            if progress_callback:
+                progress_callback(completed / len(apps), f"🗂️ {completed}/{len(apps)} uygulama tamamlandı ({app['name']})")
+
+    metadata = {
+        'timestamp': started_at.strftime("%Y%m%d_%H%M%S"),
+        'date_range': f"{start_date} - {end_date}",
+        'mode': 'portfolio',
+        'apps': [app['name'] for app in apps],
+        'play_count': 0,
+        'app_count': 0,
+        'stage_metrics': stage_metrics,
+        'duration_seconds': round((datetime.now() - started_at).total_seconds(), 2)
+    }
+
+    if not frames:
+        return {'scraped_data': None, 'metadata': metadata, 'analysis_data': None, 'aggregates': None,
+                'apps': app_results, 'messages': messages}
+
+    # Uygulama verileri aynı şemada - sütunlar hizalı birleşir, tipler sonra tekrar sıkıştırılır
+    scraped_df = pd.concat(
+        [frame.astype({col: object for col in frame.columns if isinstance(frame[col].dtype, pd.CategoricalDtype)})
+         for frame in frames],
+        ignore_index=True
+    )
+    scraped_df, metadata['memory'] = compact_reviews(scraped_df, arrow_text=pipeline_options.get('arrow_text', False))
+
+    platform_counts = scraped_df['platform'].value_counts()
+    metadata['total_count'] = len(scraped_df)
+    metadata['data_version'] = data_version_hash(scraped_df)
+    metadata['play_count'] = int(platform_counts.get('Play Store', 0))
+    metadata['app_count'] = int(platform_counts.get('App Store', 0))
+
+    return {
+        'scraped_data': scraped_df,
+        'metadata': metadata,
+        'analysis_data': None,
+        'aggregates': build_portfolio_aggregates(scraped_df),
+        'apps': app_results,
+        'messages': messages
+    }
+
+def run_portfolio_config(config, progress_callback=None):
+    """JobManager hedefi - {'apps', 'start_date', 'end_date', 'max_workers', 'pipeline_options'} config'iyle çalıştır"""
+    return run_portfolio(
+        config['apps'], config['start_date'], config['end_date'],
+        max_workers=config.get('max_workers', DEFAULT_PORTFOLIO_WORKERS),
+        progress_callback=progress_callback,
+        **config.get('pipeline_options', {})
+    )
+
+def render_portfolio_comparison(aggregates):
+    """Önceden hesaplanmış özetlerden uygulamalar arası karşılaştırma görünümleri"""
+    import plotly.graph_objects as go
+
+    summary = aggregates['summary']
+
+    st.subheader("🗂️ Uygulama Karşılaştırması")
+    st.dataframe(
+        summary.rename(columns={
+            'app': 'Uygulama',
+            'platform': 'Platform',
+            'review_count': 'Yorum',
+            'avg_rating': 'Ort. Puan',
+            'negative_pct': '1-2⭐ (%)',
+            'positive_pct': '4-5⭐ (%)',
+            'version_count': 'Versiyon'
+        }).round(2),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # Ortalama puan - uygulama x platform
+    fig = go.Figure()
+    for platform, platform_summary in summary.groupby('platform', observed=True):
+        fig.add_trace(go.Bar(
+            name=str(platform),
+            x=platform_summary['app'].astype(str),
+            y=platform_summary['avg_rating'],
+            text=platform_summary['avg_rating'].round(2),
+            textposition='auto'
+        ))
+    fig.update_layout(title="⭐ Ortalama Puan", barmode='group', yaxis=dict(range=[0, 5]), height=400)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Puan dağılımı - yığılmış yüzde
+    distribution = aggregates['rating_distribution']
+    colors = {1: '#d62728', 2: '#ff7f0e', 3: '#bcbd22', 4: '#2ca02c', 5: '#1f77b4'}
+    fig = go.Figure()
+    for rating in distribution.columns:
+        fig.add_trace(go.Bar(
+            name=f"{rating}⭐",
+            x=distribution.index.astype(str),
+            y=distribution[rating],
+            marker_color=colors.get(rating)
+        ))
+    fig.update_layout(title="📊 Puan Dağılımı (%)", barmode='stack', height=400)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Aylık ortalama puan trendi
+    monthly = aggregates['monthly']
+    if not monthly.empty:
+        fig = go.Figure()
+        for app_name, app_monthly in monthly.groupby('app', observed=True):
+            fig.add_trace(go.Scatter(
+                name=str(app_name),
+                x=app_monthly['date'],
+                y=app_monthly['avg_rating'],
+                mode='lines+markers',
+                customdata=app_monthly['review_count'],
+                hovertemplate="%{x|%Y-%m}: %{y:.2f}⭐ (%{customdata} yorum)"
+            ))
+        fig.update_layout(title="📈 Aylık Ortalama Puan", yaxis=dict(range=[0, 5]), height=400)
+        st.plotly_chart(fig, use_container_width=True)
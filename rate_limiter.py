@@ -0,0 +1,50 @@
+"""
+Süreç Geneli İstek Hız Sınırı
+Aynı anda çalışan tüm scraping işleri (oturumlar, arka plan işleri, portföy) kaynak başına
+ortak bir hız sınırını paylaşır - paralel çekim mağazaları daha sık çağırmaz.
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Kaynak → saniyedeki en fazla istek (ortam değişkeniyle ezilebilir)
+DEFAULT_RATE_LIMITS = {
+    'play': float(os.environ.get("RATE_LIMIT_PLAY_RPS", 2.0)),
+    'app_store': float(os.environ.get("RATE_LIMIT_APP_STORE_RPS", 0.5)),
+}
+
+class RateLimiter:
+    """İstekler arasında en az 1/rate saniye bırakan thread güvenli sınırlayıcı"""
+
+    def __init__(self, rate_per_second):
+        self.min_interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Sıradaki istek hakkı gelene kadar bekle, beklenen süreyi döndür"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def wait_for_slot(source):
+    """Kaynak için süreç geneli hız sınırına uy (bilinmeyen kaynaklar sınırsız)"""
+    with _limiters_lock:
+        limiter = _limiters.get(source)
+        if limiter is None:
+            limiter = _limiters[source] = RateLimiter(DEFAULT_RATE_LIMITS.get(source, 0.0))
+    delay = limiter.wait()
+    if delay > 1:
+        logger.info(f"{source} hız sınırı: {delay:.1f} sn beklendi")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zamanlanmış Yenileme Servisi
+Config'teki uygulamaları belirli aralıklarla artımlı olarak çeker: her uygulama için depodaki
+en yeni yorum tarihinden (biraz örtüşmeyle) itibaren scraping yapılır, sadece depoda olmayan
+yorumlar versiyon düzeltme ve çeviriden geçirilip yazılır, özet tabloları güncellenir.
+Streamlit uygulamaları veritabanından açıldığında veri zaten günceldir.
+
+Kullanım:
+    python refresh_daemon.py --config pipeline_config.json
+    python refresh_daemon.py --config pipeline_config.json --once
+    python refresh_daemon.py --config pipeline_config.json --interval 60 --app tcdd
+
+Config: pipeline_cli ile aynı dosya; ek olarak refresh_interval_minutes ve
+refresh_overlap_days alanları okunur. Depoda hiç verisi olmayan uygulama için
+ilk çekim 'days' (varsayılan 90) gün geriye gider.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+# UI kütüphaneleri hiç yüklenmesin - pipeline modülleri import edilmeden önce
+from streamlit_compat import set_headless
+set_headless(True)
+
+import pandas as pd
+
+from json_utils import json_default
+from pipeline_cli import ConfigError, DEFAULT_DAYS, load_config
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_MINUTES = 360
+# Son kayıtlı tarihten kaç gün geriden başlansın - geç indekslenen yorumlar kaçmasın
+DEFAULT_OVERLAP_DAYS = 2
+
+def incremental_start(store, platform, app, settings):
+    """Artımlı çekimin başlangıcı: son kayıtlı yorum - örtüşme, depo boşsa 'days' gün önce"""
+    latest = store.latest_review_date(platform, app)
+    if latest is None:
+        return datetime.now() - timedelta(days=int(settings.get('days', DEFAULT_DAYS)))
+    overlap_days = int(settings.get('refresh_overlap_days', DEFAULT_OVERLAP_DAYS))
+    return latest.to_pydatetime() - timedelta(days=overlap_days)
+
+def new_reviews_only(store, df, platform, app, window_start):
+    """Depoda zaten olan yorumları at - id'si olmayan satırlar upsert'te içerikten eşleştirilir"""
+    if df.empty or 'review_id' not in df.columns:
+        return df
+    known_ids = store.review_ids(platform, app, start_date=window_start - timedelta(days=1))
+    review_ids = df['review_id'].astype(str)
+    return df[~review_ids.isin(known_ids) | (review_ids == '')].reset_index(drop=True)
+
+def seeded_version_fixer(store, package_name):
+    """
+    Versiyon geçmişi depodan yüklenmiş akış düzelticisi - geçmiş yeniden okunmaz.
+    Kayıtlı progression varsa o kullanılır; yoksa (eski depolar) versiyon özetlerinden başlatılır.
+    """
+    from streamlit_version_fixer import StreamingVersionFixer
+
+    progression = store.load_version_progression('Play Store', package_name)
+    if progression:
+        return StreamingVersionFixer.from_state(progression)
+
+    fixer = StreamingVersionFixer()
+    stats = store.load_version_stats(platform='Play Store', app=package_name)
+    if not stats.empty:
+        known_versions = stats.dropna(subset=['version'])
+        fixer.seed(dict(zip(known_versions['version'], known_versions['first_date'])),
+                   max_date=stats['last_date'].max())
+    return fixer
+
+def refresh_play_store(store, package_name, settings, stage_metrics):
+    """Play Store'dan yeni yorumları çek, sadece yenileri düzeltip çevir ve yaz - yeni satır sayısını döndür"""
+    from play_scraper_streamlit import scrape_play_reviews
+    from review_pipeline import timed_stage
+    from streamlit_version_fixer import prepare_output_columns
+    from translator_streamlit import translate_reviews
+
+    window_start = incremental_start(store, 'Play Store', package_name, settings)
+    # Kayıtlı progression ile boş versiyonlar çekim sırasında doldurulur
+    fixer = seeded_version_fixer(store, package_name) if settings.get('enable_version_fix', True) else None
+
+    with timed_stage(stage_metrics, "📱 Play Store scraping") as stage:
+        raw = scrape_play_reviews(
+            package_name=package_name,
+            max_count=int(settings.get('max_count', 5000)),
+            lang='tr',
+            start_date=window_start,
+            end_date=datetime.now(),
+            use_cache=False,
+            version_fixer=fixer
+        )
+        df = pd.DataFrame(raw) if raw else pd.DataFrame()
+        stage['rows_out'] = len(df)
+
+    with timed_stage(stage_metrics, "🆕 Yeni yorum filtresi", rows_in=len(df)) as stage:
+        df = new_reviews_only(store, df, 'Play Store', package_name, window_start)
+        stage['rows_out'] = len(df)
+
+    if df.empty:
+        return 0
+
+    if fixer is not None:
+        with timed_stage(stage_metrics, "🔧 Versiyon düzeltme", rows_in=len(df)) as stage:
+            df = prepare_output_columns(df)
+            stage['rows_out'] = len(df)
+
+    if settings.get('enable_translation', True):
+        with timed_stage(stage_metrics, "🌍 Çeviri", rows_in=len(df)) as stage:
+            df = translate_reviews(df)
+            stage['rows_out'] = len(df)
+
+    df['platform'] = 'Play Store'
+    df['source_package'] = package_name
+
+    with timed_stage(stage_metrics, "🗄️ Depoya yazma", rows_in=len(df)) as stage:
+        stage['rows_out'] = store.upsert_reviews(df)
+        # Progression yorumlar yazıldıktan sonra kaydedilir - yazma başarısızsa bir sonraki döngü aynı satırları işler
+        if fixer is not None:
+            store.save_version_progression('Play Store', package_name, fixer.state())
+    return stage['rows_out']
+
+def refresh_app_store(store, app_id, settings, stage_metrics):
+    """App Store RSS'ten yeni yorumları çek, işle ve yaz - yeni satır sayısını döndür"""
+    from review_pipeline import timed_stage
+    from rss_scraper_streamlit import scrape_app_store_reviews
+    from streamlit_app_selector import process_app_store_data
+
+    window_start = incremental_start(store, 'App Store', app_id, settings)
+
+    with timed_stage(stage_metrics, "🍎 App Store scraping") as stage:
+        raw = scrape_app_store_reviews(
+            app_id=str(app_id),
+            max_pages=int(settings.get('max_pages', 20)),
+            country='tr',
+            start_date=window_start,
+            end_date=datetime.now(),
+            max_reviews=int(settings.get('max_count', 5000)),
+            use_cache=False
+        )
+        df = pd.DataFrame(raw) if raw else pd.DataFrame()
+        stage['rows_out'] = len(df)
+
+    if df.empty:
+        return 0
+
+    with timed_stage(stage_metrics, "🍎 App Store işleme", rows_in=len(df)) as stage:
+        needed_columns = ['title', 'content', 'rating', 'version', 'date', 'id']
+        available_columns = [col for col in needed_columns if col in df.columns] or list(df.columns)
+        df = process_app_store_data(df, available_columns).rename(columns={'id': 'review_id'})
+        df = new_reviews_only(store, df, 'App Store', app_id, window_start)
+        stage['rows_out'] = len(df)
+
+    if df.empty:
+        return 0
+
+    df['platform'] = 'App Store'
+    df['source_app_id'] = str(app_id)
+
+    with timed_stage(stage_metrics, "🗄️ Depoya yazma", rows_in=len(df)) as stage:
+        stage['rows_out'] = store.upsert_reviews(df)
+    return stage['rows_out']
+
+def refresh_app(store, settings):
+    """Bir uygulamanın etkin platformlarını yenile - platform hatası diğerini durdurmaz"""
+    name = settings.get('name') or settings.get('package_name') or str(settings.get('app_id'))
+    started = time.perf_counter()
+    app_summary = {'name': name, 'platforms': {}, 'stage_metrics': []}
+
+    sources = [
+        (settings.get('enable_play_store', True) and settings.get('package_name'),
+         'Play Store', settings.get('package_name'), refresh_play_store),
+        (settings.get('enable_app_store', True) and settings.get('app_id'),
+         'App Store', str(settings.get('app_id') or ''), refresh_app_store),
+    ]
+
+    for enabled, platform, app, refresh in sources:
+        if not enabled:
+            continue
+        try:
+            new_rows = refresh(store, app, settings, app_summary['stage_metrics'])
+            store.record_refresh(platform, app, new_rows, 'ok')
+            app_summary['platforms'][platform] = {'status': 'ok', 'new_rows': new_rows}
+            logger.info(f"[{name}] {platform}: {new_rows} yeni yorum")
+        except Exception as e:
+            logger.exception(f"[{name}] {platform} yenileme hatası: {e}")
+            store.record_refresh(platform, app, 0, 'failed', str(e))
+            app_summary['platforms'][platform] = {'status': 'failed', 'new_rows': 0, 'error': str(e)}
+
+    app_summary['duration_seconds'] = round(time.perf_counter() - started, 2)
+    return app_summary
+
+def run_refresh_cycle(config, only_apps=None):
+    """Config'teki tüm (veya seçilen) uygulamaları bir kez yenile, tur özetini döndür"""
+    from review_store import get_review_store
+
+    store = get_review_store()
+    defaults = config.get('defaults', {})
+    started_at = datetime.now()
+
+    apps = []
+    for app in config['apps']:
+        settings = {**defaults, **app}
+        name = settings.get('name') or settings.get('package_name') or str(settings.get('app_id'))
+        if only_apps and name not in only_apps:
+            continue
+        apps.append(refresh_app(store, settings))
+
+    if only_apps and not apps:
+        raise ConfigError(f"Config'te seçilen uygulama bulunamadı: {', '.join(only_apps)}")
+
+    return {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'duration_seconds': round((datetime.now() - started_at).total_seconds(), 2),
+        'new_rows': sum(platform['new_rows'] for app in apps for platform in app['platforms'].values()),
+        'failed': sum(platform['status'] == 'failed' for app in apps for platform in app['platforms'].values()),
+        'apps': apps
+    }
+
+def run_daemon(config, interval_minutes, only_apps=None, stop_event=None):
+    """Durdurulana kadar her interval_minutes dakikada bir yenileme turu çalıştır"""
+    stop_event = stop_event or threading.Event()
+
+    while not stop_event.is_set():
+        summary = run_refresh_cycle(config, only_apps)
+        logger.info(f"🔄 Yenileme turu bitti: {summary['new_rows']} yeni yorum, "
+                    f"{summary['failed']} hata, {summary['duration_seconds']} sn")
+        # Her tur tek satır JSON - log toplayıcılar için
+        sys.stdout.write(json.dumps(summary, ensure_ascii=False, default=json_default) + "\n")
+        sys.stdout.flush()
+
+        logger.info(f"⏳ Sonraki tur {interval_minutes} dakika sonra")
+        stop_event.wait(interval_minutes * 60)
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Config'teki uygulamaları periyodik ve artımlı olarak yenile")
+    parser.add_argument('--config', required=True, help="JSON config dosyası (pipeline_cli ile aynı)")
+    parser.add_argument('--app', action='append', dest='apps', help="Sadece bu uygulamayı yenile (tekrarlanabilir)")
+    parser.add_argument('--interval', type=float, help="Turlar arası dakika (config'teki refresh_interval_minutes'i ezer)")
+    parser.add_argument('--once', action='store_true', help="Tek tur çalıştır ve çık (cron için)")
+    return parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+        interval = args.interval or float(config.get('refresh_interval_minutes', DEFAULT_INTERVAL_MINUTES))
+
+        if args.once:
+            summary = run_refresh_cycle(config, args.apps)
+            json.dump(summary, sys.stdout, ensure_ascii=False, indent=2, default=json_default)
+            sys.stdout.write("\n")
+            return 1 if summary['failed'] else 0
+
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            logger.info("🛑 Durdurma sinyali alındı - mevcut tur bitince çıkılacak")
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        run_daemon(config, interval, args.apps, stop_event)
+    except ConfigError as e:
+        logger.error(f"❌ {e}")
+        return 2
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
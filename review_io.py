@@ -0,0 +1,126 @@
+"""
+Yorum Dosyası Okuma
+CSV, Parquet ve Arrow IPC (Feather v2) dosyalarını uzantıya göre okur.
+Parquet/Arrow tipleri korur ve sadece istenen sütunları diskten okur (sütun projeksiyonu).
+Bellekten büyük dosyalar iter_reviews_file ile parça parça okunabilir.
+"""
+
+import logging
+import os
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Uzantı → format
+DATA_FILE_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+}
+
+# st.file_uploader(type=...) için uzantılar
+UPLOAD_TYPES = [ext.lstrip('.') for ext in DATA_FILE_FORMATS]
+
+# Parça parça okumada varsayılan satır sayısı
+DEFAULT_CHUNK_ROWS = 100_000
+
+def detect_format(name):
+    """Dosya adından formatı bul - bilinmeyen uzantılar CSV sayılır"""
+    return DATA_FILE_FORMATS.get(os.path.splitext(str(name).lower())[1], 'csv')
+
+def is_data_file(name):
+    return os.path.splitext(str(name).lower())[1] in DATA_FILE_FORMATS
+
+def scan_data_files(directory='.'):
+    """Dizindeki okunabilir veri dosyalarını (CSV/Parquet/Arrow) listele"""
+    return [file for file in os.listdir(directory) if is_data_file(file)]
+
+def _source_name(source):
+    """Yol veya Streamlit UploadedFile için dosya adı"""
+    return getattr(source, 'name', source)
+
+def _rewind(source):
+    """Yüklenen dosyayı başa sar - şema ve veri aynı tampondan iki kez okunur"""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+def _available_columns(source, file_format):
+    """Parquet/Arrow şemasından sütun adlarını veriyi okumadan al"""
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_schema(_rewind(source)).names
+
+    import pyarrow.ipc as ipc
+    with ipc.open_file(_rewind(source)) as reader:
+        return reader.schema.names
+
+def read_reviews_file(source, columns=None):
+    """
+    Yol veya yüklenen dosyadan DataFrame oku.
+
+    columns: sadece bu sütunları oku - dosyada olmayanlar atlanır (None = tümü)
+    """
+    file_format = detect_format(_source_name(source))
+
+    if file_format == 'csv':
+        usecols = (lambda col: col in columns) if columns is not None else None
+        return pd.read_csv(_rewind(source), usecols=usecols)
+
+    selected = None
+    if columns is not None:
+        available = _available_columns(source, file_format)
+        selected = [col for col in available if col in columns]
+
+    if file_format == 'parquet':
+        return pd.read_parquet(_rewind(source), columns=selected)
+    return pd.read_feather(_rewind(source), columns=selected)
+
+def iter_reviews_file(source, columns=None, chunk_size=DEFAULT_CHUNK_ROWS, dtype=None):
+    """
+    Dosyayı en fazla chunk_size satırlık DataFrame parçaları olarak oku - bellekte tek seferde bir parça tutulur.
+
+    columns: sadece bu sütunları oku - dosyada olmayanlar atlanır (None = tümü)
+    dtype: CSV için sütun tipleri (ör. {'app_version': str}) - parçalar arasında tip tahmini değişmesin
+    """
+    file_format = detect_format(_source_name(source))
+
+    if file_format == 'csv':
+        usecols = (lambda col: col in columns) if columns is not None else None
+        with pd.read_csv(_rewind(source), usecols=usecols, dtype=dtype, chunksize=chunk_size) as reader:
+            yield from reader
+        return
+
+    selected = None
+    if columns is not None:
+        available = _available_columns(source, file_format)
+        selected = [col for col in available if col in columns]
+
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(_rewind(source)).iter_batches(batch_size=chunk_size, columns=selected)
+        for batch in batches:
+            yield batch.to_pandas()
+        return
+
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    with ipc.open_file(_rewind(source)) as reader:
+        # Arrow IPC kayıt grupları parça boyutuna göre birleştirilir/bölünür
+        pending, pending_rows = [], 0
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            if selected is not None:
+                batch = batch.select(selected)
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, chunk_size).to_pandas()
+                rest = table.slice(chunk_size)
+                pending, pending_rows = rest.to_batches(), rest.num_rows
+        if pending_rows:
+            yield pa.Table.from_batches(pending).to_pandas()
@@ -0,0 +1,699 @@
+"""
+Yorum Pipeline Çekirdeği
+Çekilen yorumların standardizasyonu ve parça parça (streaming) işlenmesi
+"""
+
+import logging
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from review_schema import PIPELINE_COLUMNS, compact_reviews, standardize_reviews
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Kuyruk sonu işareti
+_END_OF_STREAM = object()
+
+class StreamingPipelineError(RuntimeError):
+    """Akış kaynağı veya bir aşama hata verdi - kısmi / işlenmemiş veri sonuç olarak döndürülmez"""
+
+    def __init__(self, stage_name, error, stage_stats):
+        super().__init__(f"Akış '{stage_name}' aşamasında durdu: {error}")
+        self.stage_name = stage_name
+        self.error = error
+        self.stage_stats = stage_stats
+
+class _StreamAborted(BaseException):
+    """
+    Başka bir aşama hata verdiğinde kaynağı durdurmak için emit() içinden fırlatılır.
+    BaseException: kaynakların sayfa başına 'except Exception' blokları bunu yutmaz.
+    """
+
+def standardize_review_frame(df):
+    """Platform verisinde eksik ortak sütunları (content, rating, date, version, author_name) şemadan oluştur"""
+    return standardize_reviews(df, columns=PIPELINE_COLUMNS)
+
+def combine_review_frames(frames):
+    """Platform DataFrame'lerini standardize edip tek DataFrame'de birleştir"""
+    # Tarihler her platformda kendi formatıyla ayrıştırılır, concat aynı tipteki sütunları birleştirir
+    standardized_data = [standardize_review_frame(df) for df in frames if df is not None and not df.empty]
+
+    if not standardized_data:
+        return pd.DataFrame()
+
+    return pd.concat(standardized_data, ignore_index=True)
+
+def _peak_rss_mb():
+    """Sürecin şimdiye kadarki en yüksek bellek kullanımı (MB) - ölçülemeyen platformlarda None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döndürür
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+@contextmanager
+def timed_stage(stage_metrics, name, rows_in=0):
+    """
+    Pipeline aşamasının süresini, satır sayılarını ve bellek tepe değerini stage_metrics listesine ekle.
+    Aşama içinde kayıt['rows_out'] doldurulur; hata olursa durum 'error' olarak kaydedilip yeniden fırlatılır.
+    """
+    record = {
+        'stage': name,
+        'rows_in': int(rows_in),
+        'rows_out': 0,
+        'seconds': 0.0,
+        'rows_per_sec': 0.0,
+        'peak_rss_mb': None,
+        'status': 'ok'
+    }
+    started_at = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        record['status'] = 'error'
+        raise
+    finally:
+        elapsed = time.perf_counter() - started_at
+        processed_rows = max(record['rows_in'], record['rows_out'])
+        record['seconds'] = round(elapsed, 3)
+        record['rows_per_sec'] = round(processed_rows / elapsed, 1) if elapsed > 0 else 0.0
+        record['peak_rss_mb'] = _peak_rss_mb()
+        stage_metrics.append(record)
+        logger.info(f"Aşama {name}: {record['seconds']:.2f} sn, {record['rows_in']} → {record['rows_out']} satır")
+
+def _new_stage_stats(name):
+    """Aşama verim sayaçları"""
+    return {
+        'stage': name,
+        'batches': 0,
+        'rows_in': 0,
+        'rows_out': 0,
+        'errors': 0,
+        'busy_seconds': 0.0,
+        'wall_seconds': 0.0,
+        'rows_per_sec': 0.0
+    }
+
+def _finish_stage_stats(stats, started_at):
+    """Duvar saati süresini ve satır/saniye verimini hesapla"""
+    stats['wall_seconds'] = round(time.perf_counter() - started_at, 3)
+    stats['busy_seconds'] = round(stats['busy_seconds'], 3)
+    stats['rows_per_sec'] = round(stats['rows_out'] / stats['busy_seconds'], 1) if stats['busy_seconds'] > 0 else 0.0
+
+def run_streaming_pipeline(producer, stages, queue_size=4, progress_callback=None):
+    """
+    Batch'leri kaynak → aşamalar → toplayıcı zincirinde parça parça işle.
+
+    producer(emit): her batch için emit(batch) çağıran kaynak fonksiyonu (liste veya DataFrame)
+    stages: [(aşama_adı, fonksiyon)] - her fonksiyon DataFrame alır, DataFrame döndürür
+    queue_size: aşamalar arası kuyruk kapasitesi - dolunca önceki aşama bekler (backpressure)
+    progress_callback(stage_stats, collected_rows): toplayıcı her batch aldığında çağrılır
+
+    Dönüş: (işlenmiş batch listesi, aşama istatistikleri listesi)
+    Kaynak veya bir aşama hata verirse akış durdurulur, kuyruklar boşaltılır ve ilk hata
+    StreamingPipelineError olarak fırlatılır.
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    source_stats = _new_stage_stats('source')
+    stage_stats = [source_stats] + [_new_stage_stats(name) for name, _ in stages]
+    failed = threading.Event()
+    failures = []
+    failures_lock = threading.Lock()
+
+    def record_failure(stage_name, error):
+        with failures_lock:
+            failures.append((stage_name, error))
+        failed.set()
+
+    def run_source():
+        started_at = time.perf_counter()
+        blocked_seconds = 0.0
+
+        def emit(batch):
+            nonlocal blocked_seconds
+            if failed.is_set():
+                raise _StreamAborted()
+            if not isinstance(batch, pd.DataFrame):
+                batch = pd.DataFrame(batch)
+            if batch.empty:
+                return
+            source_stats['batches'] += 1
+            source_stats['rows_in'] += len(batch)
+            source_stats['rows_out'] += len(batch)
+            # Kuyruk doluysa burada bekler - bekleme süresi kaynağın çalışma süresinden düşülür
+            put_started = time.perf_counter()
+            queues[0].put(batch)
+            blocked_seconds += time.perf_counter() - put_started
+
+        try:
+            producer(emit)
+        except _StreamAborted:
+            pass
+        except Exception as e:
+            source_stats['errors'] += 1
+            logger.error(f"Akış kaynağı hatası: {e}")
+            record_failure('source', e)
+        finally:
+            source_stats['busy_seconds'] = max(time.perf_counter() - started_at - blocked_seconds, 0.0)
+            _finish_stage_stats(source_stats, started_at)
+            queues[0].put(_END_OF_STREAM)
+
+    def run_stage(index, stage_name, stage_func):
+        stats = stage_stats[index + 1]
+        inbox, outbox = queues[index], queues[index + 1]
+        started_at = time.perf_counter()
+
+        while True:
+            batch = inbox.get()
+            if batch is _END_OF_STREAM:
+                break
+            # Akış durduruldu - önceki aşama beklemesin diye kuyruk boşaltılır, batch iletilmez
+            if failed.is_set():
+                continue
+
+            batch_started = time.perf_counter()
+            stats['batches'] += 1
+            stats['rows_in'] += len(batch)
+
+            try:
+                result = stage_func(batch)
+                if result is None:
+                    result = batch
+            except Exception as e:
+                # İşlenmemiş batch iletilmez - akış durur, hata toplayıcıda fırlatılır
+                stats['errors'] += 1
+                stats['busy_seconds'] += time.perf_counter() - batch_started
+                logger.error(f"Akış aşaması hatası ({stage_name}): {e}")
+                record_failure(stage_name, e)
+                continue
+
+            stats['rows_out'] += len(result)
+            stats['busy_seconds'] += time.perf_counter() - batch_started
+            outbox.put(result)
+
+        _finish_stage_stats(stats, started_at)
+        outbox.put(_END_OF_STREAM)
+
+    threads = [threading.Thread(target=run_source, name='stream-source', daemon=True)]
+    for index, (stage_name, stage_func) in enumerate(stages):
+        threads.append(threading.Thread(
+            target=run_stage,
+            args=(index, stage_name, stage_func),
+            name=f'stream-{stage_name}',
+            daemon=True
+        ))
+
+    for thread in threads:
+        thread.start()
+
+    # Toplayıcı - çağıran thread'de çalışır (Streamlit güncellemeleri burada güvenli)
+    processed_batches = []
+    collected_rows = 0
+    while True:
+        batch = queues[-1].get()
+        if batch is _END_OF_STREAM:
+            break
+        processed_batches.append(batch)
+        collected_rows += len(batch)
+        if progress_callback:
+            try:
+                progress_callback(stage_stats, collected_rows)
+            except Exception as e:
+                logger.warning(f"İlerleme bildirimi hatası: {e}")
+
+    for thread in threads:
+        thread.join()
+
+    if failures:
+        stage_name, error = failures[0]
+        raise StreamingPipelineError(stage_name, error, stage_stats) from error
+
+    return processed_batches, stage_stats
+
+def stream_play_store(package_name, start_date, end_date, max_count=5000, lang='tr',
+                      enable_version_fix=True, enable_translation=True,
+                      batch_size=200, queue_size=4, progress_callback=None):
+    """Play Store yorumlarını çekildikçe versiyon düzeltme ve çeviriden geçir"""
+    from play_scraper_streamlit import iter_play_review_batches
+    from streamlit_version_fixer import StreamingVersionFixer, prepare_output_columns
+    from translator_streamlit import translate_reviews
+
+    # Boş versiyonlar çekim sırasında doldurulur (boş kayıtlar çekim sonunda son batch olarak gelir) - aşamada sadece
+    # sütunlar hazırlanır
+    fixer = StreamingVersionFixer() if enable_version_fix else None
+
+    def producer(emit):
+        for batch in iter_play_review_batches(package_name, count=max_count, lang=lang,
+                                              start_date=start_date, end_date=end_date,
+                                              batch_size=batch_size, version_fixer=fixer):
+            emit(batch)
+
+    stages = []
+    if enable_version_fix:
+        stages.append(('version_fix', prepare_output_columns))
+    if enable_translation:
+        stages.append(('translation', translate_reviews))
+
+    batches, stage_stats = run_streaming_pipeline(producer, stages, queue_size=queue_size,
+                                                  progress_callback=progress_callback)
+    df_play = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    return df_play, stage_stats
+
+def stream_app_store(app_id, start_date, end_date, max_pages=20, country='tr', max_reviews=5000,
+                     queue_size=4, progress_callback=None):
+    """App Store RSS sayfalarını geldikçe App Store veri işlemeden geçir"""
+    from rss_scraper_streamlit import scrape_app_store_reviews
+    from streamlit_app_selector import process_app_store_data
+
+    def producer(emit):
+        scrape_app_store_reviews(
+            app_id=str(app_id),
+            max_pages=max_pages,
+            country=country,
+            start_date=start_date,
+            end_date=end_date,
+            max_reviews=max_reviews,
+            page_callback=emit
+        )
+
+    def process_batch(batch):
+        needed_columns = ['title', 'content', 'rating', 'version', 'date', 'id']
+        available_columns = [col for col in needed_columns if col in batch.columns]
+        if not available_columns:
+            available_columns = list(batch.columns)
+        return process_app_store_data(batch, available_columns).rename(columns={'id': 'review_id'})
+
+    batches, stage_stats = run_streaming_pipeline(producer, [('app_store_processing', process_batch)],
+                                                  queue_size=queue_size,
+                                                  progress_callback=progress_callback)
+    df_app = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    return df_app, stage_stats
+
+def build_pipeline_config(package_name, app_id, start_date, end_date,
+                          enable_play_store=True, enable_app_store=True,
+                          enable_version_fix=True, enable_translation=True,
+                          enable_analysis=True, streaming_mode=False, persist=True, arrow_text=False,
+                          use_scrape_cache=True):
+    """Pipeline çalıştırma ayarlarını tek sözlükte topla"""
+    return {
+        'package_name': package_name,
+        'app_id': app_id,
+        'start_date': start_date,
+        'end_date': end_date,
+        'enable_play_store': enable_play_store,
+        'enable_app_store': enable_app_store,
+        'enable_version_fix': enable_version_fix,
+        'enable_translation': enable_translation,
+        'enable_analysis': enable_analysis,
+        'streaming_mode': streaming_mode,
+        'persist': persist,
+        'arrow_text': arrow_text,
+        'use_scrape_cache': use_scrape_cache
+    }
+
+def run_pipeline(config, progress_callback=None, notify=None):
+    """
+    Tam pipeline: çek → düzelt → çevir → birleştir → analiz.
+
+    progress_callback(oran, mesaj): 0-1 arası ilerleme bildirimi
+    notify(seviye, mesaj): 'info' / 'success' / 'warning' / 'error' kullanıcı mesajları
+
+    Dönüş: {'scraped_data', 'metadata', 'analysis_data', 'messages'}
+    """
+    from play_scraper_streamlit import scrape_play_reviews
+    from streamlit_version_fixer import StreamingVersionFixer, prepare_output_columns
+    from translator_streamlit import translate_reviews
+    from rss_scraper_streamlit import scrape_app_store_reviews
+    from streamlit_app_selector import process_app_store_data
+    from export_utils import data_version_hash
+
+    messages = []
+
+    def report(level, message):
+        messages.append((level, message))
+        if notify:
+            notify(level, message)
+
+    package_name = config['package_name']
+    app_id = config['app_id']
+    start_date = config['start_date']
+    end_date = config['end_date']
+    enable_play_store = config.get('enable_play_store', True)
+    enable_app_store = config.get('enable_app_store', True)
+    enable_version_fix = config.get('enable_version_fix', True)
+    enable_translation = config.get('enable_translation', True)
+    enable_analysis = config.get('enable_analysis', True)
+    streaming_mode = config.get('streaming_mode', False)
+
+    total_steps = sum([enable_play_store, enable_app_store, enable_version_fix, enable_translation])
+    current_step = 0
+
+    def update_progress(message, step_increment=1):
+        nonlocal current_step
+        current_step += step_increment
+        progress = min(current_step / total_steps, 1.0) if total_steps > 0 else 1.0
+        if progress_callback:
+            progress_callback(progress, message)
+
+    def stream_progress(platform_label):
+        def callback(stage_stats, collected_rows):
+            stage_summary = " | ".join(
+                f"{stats['stage']}: {stats['rows_out']:,}" for stats in stage_stats
+            )
+            if progress_callback:
+                progress_callback(
+                    min(current_step / total_steps, 1.0) if total_steps > 0 else 1.0,
+                    f"⚡ {platform_label} akışı - {collected_rows:,} yorum hazır ({stage_summary})"
+                )
+        return callback
+
+    # Veri saklama
+    combined_data = []
+    metadata = {
+        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+        'date_range': f"{start_date} - {end_date}",
+        'play_count': 0,
+        'app_count': 0,
+        'package_name': package_name,
+        'app_id': app_id,
+        'stage_metrics': []
+    }
+    stage_metrics = metadata['stage_metrics']
+
+    start_datetime = datetime.combine(start_date, datetime.min.time())
+    end_datetime = datetime.combine(end_date, datetime.max.time())
+
+    # PLAY STORE SCRAPING
+    if enable_play_store:
+        update_progress("📱 Play Store yorumları çekiliyor...")
+
+        try:
+            if streaming_mode:
+                with timed_stage(stage_metrics, "⚡ Play Store akışı") as stage:
+                    df_play, play_stream_stats = stream_play_store(
+                        package_name=package_name,
+                        start_date=start_datetime,
+                        end_date=end_datetime,
+                        max_count=5000,
+                        lang='tr',
+                        enable_version_fix=enable_version_fix,
+                        enable_translation=enable_translation,
+                        progress_callback=stream_progress("📱 Play Store")
+                    )
+                    stage['rows_out'] = len(df_play)
+                metadata['stream_stats'] = metadata.get('stream_stats', []) + [
+                    dict(stats, platform='Play Store') for stats in play_stream_stats
+                ]
+                # Akışta birleşik aşamalar - ilerlemeyi toplu ilerlet
+                update_progress("📱 Play Store akışı tamamlandı", step_increment=enable_version_fix + enable_translation)
+            else:
+                with timed_stage(stage_metrics, "📱 Play Store scraping") as stage:
+                    # Boş versiyonlar çekim sırasında doldurulur
+                    play_raw = scrape_play_reviews(
+                        package_name=package_name,
+                        max_count=5000,
+                        lang='tr',
+                        start_date=start_datetime,
+                        end_date=end_datetime,
+                        use_cache=config.get('use_scrape_cache', True),
+                        version_fixer=StreamingVersionFixer() if enable_version_fix else None
+                    )
+
+                    df_play = pd.DataFrame(play_raw) if play_raw else pd.DataFrame()
+                    stage['rows_out'] = len(df_play)
+
+            if not df_play.empty:
+                # Version fixing - boş versiyonlar çekim sırasında dolduruldu, burada sütunlar hazırlanır
+                if enable_version_fix and not streaming_mode:
+                    update_progress("🔧 Play Store versiyon düzeltiliyor...")
+                    with timed_stage(stage_metrics, "🔧 Versiyon düzeltme", rows_in=len(df_play)) as stage:
+                        df_play = prepare_output_columns(df_play)
+                        stage['rows_out'] = len(df_play)
+
+                # Translation
+                if enable_translation and not streaming_mode:
+                    update_progress("🌍 Play Store yorumları çevriliyor...")
+                    with timed_stage(stage_metrics, "🌍 Çeviri", rows_in=len(df_play)) as stage:
+                        df_play = translate_reviews(df_play)
+                        stage['rows_out'] = len(df_play)
+
+                # Platform bilgisi ekle
+                df_play['platform'] = 'Play Store'
+                df_play['source_package'] = package_name
+
+                combined_data.append(df_play)
+                metadata['play_count'] = len(df_play)
+
+                report('success', f"✅ Play Store: {len(df_play)}  yorum işlendi")
+            else:
+                report('warning', f"⚠️ Play Store: {package_name} için belirtilen tarih aralığında yorum bulunamadı")
+
+        except StreamingPipelineError as e:
+            # Yarım kalan akış başarılı sonuç gibi döndürülmez - iş / CLI çalıştırması başarısız sayılır
+            report('error', f"❌ Play Store akışı durdu: {e}")
+            raise
+        except Exception as e:
+            report('error', f"❌ Play Store hatası: {e}")
+
+    # APP STORE SCRAPING
+    if enable_app_store:
+        update_progress("🍎 App Store yorumları çekiliyor...")
+
+        try:
+            if streaming_mode:
+                with timed_stage(stage_metrics, "⚡ App Store akışı") as stage:
+                    df_app, app_stream_stats = stream_app_store(
+                        app_id=app_id,
+                        start_date=start_datetime,
+                        end_date=end_datetime,
+                        max_pages=20,
+                        country='tr',
+                        max_reviews=5000,
+                        progress_callback=stream_progress("🍎 App Store")
+                    )
+                    stage['rows_out'] = len(df_app)
+                metadata['stream_stats'] = metadata.get('stream_stats', []) + [
+                    dict(stats, platform='App Store') for stats in app_stream_stats
+                ]
+            else:
+                with timed_stage(stage_metrics, "🍎 App Store scraping") as stage:
+                    app_raw = scrape_app_store_reviews(
+                        app_id=str(app_id),
+                        max_pages=20,
+                        country='tr',
+                        start_date=start_datetime,
+                        end_date=end_datetime,
+                        max_reviews=5000,
+                        use_cache=config.get('use_scrape_cache', True)
+                    )
+
+                    df_app = pd.DataFrame(app_raw) if app_raw else pd.DataFrame()
+                    stage['rows_out'] = len(df_app)
+
+            if not df_app.empty:
+                # App Store veri işleme (akış modunda parça parça yapıldı)
+                if not streaming_mode:
+                    needed_columns = ['title', 'content', 'rating', 'version', 'date', 'id']
+                    available_columns = [col for col in needed_columns if col in df_app.columns]
+
+                    if not available_columns:
+                        available_columns = list(df_app.columns)
+
+                    with timed_stage(stage_metrics, "🍎 App Store işleme", rows_in=len(df_app)) as stage:
+                        df_app = process_app_store_data(df_app, available_columns).rename(columns={'id': 'review_id'})
+                        stage['rows_out'] = len(df_app)
+
+                # Platform bilgisi ekle
+                df_app['platform'] = 'App Store'
+                df_app['source_app_id'] = str(app_id)
+
+                combined_data.append(df_app)
+                metadata['app_count'] = len(df_app)
+
+                report('success', f"✅ App Store: {len(df_app)}  yorum işlendi")
+            else:
+                report('warning', f"⚠️ App Store: App ID {app_id} için belirtilen tarih aralığında yorum bulunamadı")
+
+        except StreamingPipelineError as e:
+            report('error', f"❌ App Store akışı durdu: {e}")
+            raise
+        except Exception as e:
+            report('error', f"❌ App Store hatası: {e}")
+
+    # VERİYİ BİRLEŞTİR
+    with timed_stage(stage_metrics, "🧩 Standardizasyon", rows_in=sum(len(df) for df in combined_data)) as stage:
+        scraped_df = combine_review_frames(combined_data)
+        if not scraped_df.empty:
+            scraped_df = compact_scraped_data(scraped_df, config, metadata, report)
+        stage['rows_out'] = len(scraped_df)
+    analysis_data = None
+
+    if scraped_df.empty:
+        return {'scraped_data': None, 'metadata': metadata, 'analysis_data': None, 'messages': messages}
+
+    metadata['total_count'] = len(scraped_df)
+    # İndirme önbelleği anahtarı - oturumlar arası paylaşılan önbellekte içerikle eşleşir
+    metadata['data_version'] = data_version_hash(scraped_df)
+
+    # Platform bazında sayıları güncelle
+    if 'platform' in scraped_df.columns:
+        platform_counts = scraped_df['platform'].value_counts()
+        metadata['play_count'] = int(platform_counts.get('Play Store', 0))
+        metadata['app_count'] = int(platform_counts.get('App Store', 0))
+
+    # YEREL DEPOYA YAZ - sonraki analizler tekrar scraping gerektirmez
+    if config.get('persist', True):
+        with timed_stage(stage_metrics, "🗄️ Depoya yazma", rows_in=len(scraped_df)) as stage:
+            metadata['stored_count'] = persist_reviews(scraped_df, report)
+            stage['rows_out'] = metadata['stored_count']
+
+    # ANALİZ HAZIRLA
+    if enable_analysis:
+        update_progress("📊 Analiz hazırlanıyor...")
+        with timed_stage(stage_metrics, "📊 Analiz", rows_in=len(scraped_df)) as stage:
+            analysis_data = prepare_analysis(scraped_df, report)
+            stage['rows_out'] = len(scraped_df) if analysis_data else 0
+
+    return {'scraped_data': scraped_df, 'metadata': metadata, 'analysis_data': analysis_data, 'messages': messages}
+
+def compact_scraped_data(scraped_df, config, metadata, report):
+    """Birleşik veriyi küçük tiplere çevir, bellek kazancını metadata'ya yaz"""
+    scraped_df, memory_stats = compact_reviews(scraped_df, arrow_text=config.get('arrow_text', False))
+    metadata['memory'] = memory_stats
+    report('info', f"🗜️ Bellek: {memory_stats['before_mb']:.1f} MB → {memory_stats['after_mb']:.1f} MB "
+                   f"(%{memory_stats['saved_pct']:.0f} tasarruf)")
+    return scraped_df
+
+def persist_reviews(scraped_df, report):
+    """Birleşik veriyi yorum deposuna upsert et, yazılan satır sayısını döndür"""
+    from review_store import get_review_store
+
+    try:
+        stored_count = get_review_store().upsert_reviews(scraped_df)
+        report('info', f"🗄️ {stored_count:,} yorum veritabanına kaydedildi")
+        return stored_count
+    except Exception as e:
+        report('warning', f"⚠️ Veritabanına kaydedilemedi: {e}")
+        return 0
+
+def load_stored_pipeline_result(config, notify=None):
+    """
+    Scraping yapmadan, depodaki yorumlarla run_pipeline ile aynı sonucu üret.
+    Play Store için package_name, App Store için app_id uygulama anahtarıdır.
+    """
+    from review_store import get_review_store
+    from export_utils import data_version_hash
+
+    messages = []
+
+    def report(level, message):
+        messages.append((level, message))
+        if notify:
+            notify(level, message)
+
+    store = get_review_store()
+    frames = []
+    stage_metrics = []
+    sources = [
+        (config.get('enable_play_store', True), 'Play Store', config['package_name']),
+        (config.get('enable_app_store', True), 'App Store', str(config['app_id'])),
+    ]
+
+    for enabled, platform, app in sources:
+        if not enabled or not app:
+            continue
+        with timed_stage(stage_metrics, f"🗄️ {platform} depodan okuma") as stage:
+            df = store.load_reviews(platform=platform, app=app,
+                                    start_date=config['start_date'], end_date=config['end_date'])
+            stage['rows_out'] = len(df)
+        if df.empty:
+            report('warning', f"⚠️ {platform}: {app} için veritabanında bu tarih aralığında yorum yok")
+            continue
+        if platform == 'Play Store':
+            df['app_version'] = df['version']
+        frames.append(df)
+        report('success', f"🗄️ {platform}: {len(df):,} yorum veritabanından yüklendi")
+
+    metadata = {
+        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+        'date_range': f"{config['start_date']} - {config['end_date']}",
+        'play_count': 0,
+        'app_count': 0,
+        'package_name': config['package_name'],
+        'app_id': config['app_id'],
+        'source': 'store',
+        'stage_metrics': stage_metrics
+    }
+
+    with timed_stage(stage_metrics, "🧩 Standardizasyon", rows_in=sum(len(df) for df in frames)) as stage:
+        scraped_df = combine_review_frames(frames)
+        if not scraped_df.empty:
+            scraped_df = compact_scraped_data(scraped_df, config, metadata, report)
+        stage['rows_out'] = len(scraped_df)
+
+    if scraped_df.empty:
+        return {'scraped_data': None, 'metadata': metadata, 'analysis_data': None, 'messages': messages}
+    platform_counts = scraped_df['platform'].value_counts()
+    metadata['total_count'] = len(scraped_df)
+    metadata['data_version'] = data_version_hash(scraped_df)
+    metadata['play_count'] = int(platform_counts.get('Play Store', 0))
+    metadata['app_count'] = int(platform_counts.get('App Store', 0))
+
+    analysis_data = None
+    if config.get('enable_analysis', True):
+        with timed_stage(stage_metrics, "📊 Analiz", rows_in=len(scraped_df)) as stage:
+            analysis_data = prepare_analysis(scraped_df, report)
+            stage['rows_out'] = len(scraped_df) if analysis_data else 0
+
+    return {'scraped_data': scraped_df, 'metadata': metadata, 'analysis_data': analysis_data, 'messages': messages}
+
+def prepare_analysis(scraped_df, report):
+    """Birleşik veriyi platformlara ayırıp analiz verisini hazırla"""
+    from streamlit_z_analiz import analyze_platform_data
+
+    try:
+        # Platform bazında veri ayır
+        df_play_ready = scraped_df[scraped_df['platform'] == 'Play Store'].copy() if 'platform' in scraped_df.columns else pd.DataFrame()
+        df_app_ready = scraped_df[scraped_df['platform'] == 'App Store'].copy() if 'platform' in scraped_df.columns else pd.DataFrame()
+
+        # Her iki platformun da veri olup olmadığını kontrol et
+        play_has_data = not df_play_ready.empty and len(df_play_ready) > 0
+        app_has_data = not df_app_ready.empty and len(df_app_ready) > 0
+
+        if not (play_has_data or app_has_data):
+            report('warning', "⚠ Analiz için hiç veri bulunamadı")
+            return None
+
+        # Boş dataframe'ler için minimum sütun yapısı oluştur
+        required_cols = ['content', 'rating', 'date', 'version', 'platform']
+
+        if df_play_ready.empty:
+            df_play_ready = pd.DataFrame(columns=required_cols)
+        if df_app_ready.empty:
+            df_app_ready = pd.DataFrame(columns=required_cols)
+
+        # Analiz verisini hazırla
+        analysis_data = analyze_platform_data(df_play_ready, df_app_ready, max_versions=15)
+
+        if analysis_data:
+            # Analiz özeti göster
+            total_analyzed = len(df_play_ready) + len(df_app_ready)
+            report('success', f"✅ Analiz hazırlandı! ({total_analyzed:,} yorum analiz edildi)")
+            return analysis_data
+
+        report('warning', "⚠ Analiz için uygun veri bulunamadı")
+        return None
+
+    except Exception as e:
+        report('error', f"❌ Analiz hatası: {e}")
+        report('error', f"Debug: Scraped data columns: {scraped_df.columns.tolist() if not scraped_df.empty else 'Empty DataFrame'}")
+        return None
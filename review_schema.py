@@ -0,0 +1,189 @@
+"""
+Yorum Veri Şeması
+Birleşik yorum DataFrame'inin ortak sütunları tek yerde tanımlanır: takma adlar, tipler ve varsayılanlar.
+Pipeline, analiz ve depo modülleri eksik sütunları bu şemayla tek geçişte, vektörel olarak oluşturur.
+"""
+
+import logging
+import re
+from datetime import datetime
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype
+
+logger = logging.getLogger(__name__)
+
+# Sütun → {aliases: sütun yoksa sırayla denenecek kaynaklar,
+#          dtype: 'text' / 'number' / 'datetime',
+#          default: hiçbir kaynak yoksa tüm satırlara yazılacak değer ('now' = şu an),
+#          na_value: mevcut veya kaynaktan gelen boş değerlerin yerine yazılacak değer (None = dokunma)}
+# Sıra önemlidir: content, title'dan önce gelir ki title varsayılanı content'e kopyalanmasın
+REVIEW_SCHEMA = {
+    'content': {'aliases': ['title', 'text'], 'dtype': 'text', 'default': 'No content', 'na_value': ''},
+    'title': {'aliases': [], 'dtype': 'text', 'default': '', 'na_value': ''},
+    'rating': {'aliases': ['score'], 'dtype': 'number', 'default': 0, 'na_value': 0},
+    'date': {'aliases': ['updated', 'at', 'review_date', 'timestamp', 'created_at', 'published_at'], 'dtype': 'datetime', 'default': 'now', 'na_value': None},
+    'version': {'aliases': ['app_version', 'appVersion'], 'dtype': 'text', 'default': 'Unknown', 'na_value': 'Unknown'},
+    'author_name': {'aliases': ['userName', 'author'], 'dtype': 'text', 'default': 'Unknown', 'na_value': None},
+}
+
+# Pipeline'ın birleşik veride garanti ettiği sütunlar
+PIPELINE_COLUMNS = ['content', 'rating', 'date', 'version', 'author_name']
+
+# Analiz dosyalarında platforma göre beklenen sütunlar
+ANALYSIS_COLUMNS = {
+    'Play Store': ['rating', 'date', 'version'],
+    'App Store': ['title', 'content', 'rating', 'version', 'date'],
+}
+
+def schema_source_columns(columns, schema=REVIEW_SCHEMA):
+    """Şema sütunlarını üretmek için okunması yeterli dosya sütunları (sütun + takma adları)"""
+    source_columns = []
+    for col in columns:
+        source_columns.extend([col] + schema[col]['aliases'])
+    return list(dict.fromkeys(source_columns))
+
+def first_present_column(df, candidates):
+    """Aday sütunlardan DataFrame'de bulunan ilkini döndür, yoksa None"""
+    for col in candidates:
+        if col in df.columns:
+            return df[col]
+    return None
+
+# Saatin ardındaki saat dilimi eki ('Z', '-07:00', '+0300')
+_TZ_SUFFIX = re.compile(r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(?:Z|[+-]\d{2}:?\d{2})$')
+
+def parse_review_dates(values, label='date'):
+    """
+    Karışık biçimli tarih sütununu ayrıştır: her değerin biçimi ayrı çıkarılır (ISO, sadece gün, 'T'li, saat dilimli).
+    Saat dilimi olan değerlerde yerel saat korunur (RSS scraper'daki gibi), sonuç saat dilimsizdir.
+    Okunamayan dolu değerler NaT olur ve sayısı loglanır.
+    """
+    if is_datetime64_any_dtype(values):
+        parsed = values
+    else:
+        try:
+            parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+        except ValueError:
+            # Saat dilimli ve dilimsiz (veya farklı dilimli) değerler karışık - ekler atılıp yerel saat okunur
+            text = values.astype(object).where(values.isna(), values.astype(str).str.replace(_TZ_SUFFIX, r'\1', regex=True))
+            parsed = pd.to_datetime(text, errors='coerce', format='mixed')
+        coerced = parsed.isna() & values.notna() & (values.astype(str).str.strip() != '')
+        if coerced.any():
+            logger.warning(f"{label}: {int(coerced.sum())} tarih okunamadı, boş bırakıldı "
+                           f"(örnek: {values[coerced].iloc[0]!r})")
+    if getattr(parsed.dt, 'tz', None) is not None:
+        parsed = parsed.dt.tz_localize(None)
+    return parsed
+
+def _coerce_text(values):
+    """Metin olmayan sütunları (ör. CSV'den float okunan versiyon) boşlara dokunmadan metne çevir"""
+    if is_object_dtype(values) or is_string_dtype(values):
+        return values
+    return values.astype(object).where(values.isna(), values.astype(str))
+
+def _coerce(values, dtype):
+    """Tipi zaten doğruysa veriyi kopyalamadan geç - sadece gerekirse çevir"""
+    if dtype == 'number':
+        return values if is_numeric_dtype(values) else pd.to_numeric(values, errors='coerce')
+    if dtype == 'datetime':
+        return values if is_datetime64_any_dtype(values) else parse_review_dates(values)
+    return _coerce_text(values)
+
+def _default_value(spec):
+    return datetime.now() if spec['default'] == 'now' else spec['default']
+
+def standardize_reviews(df, columns=None, defaults=None, schema=REVIEW_SCHEMA):
+    """
+    Şemadaki sütunları takma adlardan oluştur, tiplerini doğrula ve boşlarını doldur (yerinde).
+
+    columns: sadece bu şema sütunlarını işle (varsayılan: tüm şema)
+    defaults: sütun bazında varsayılan değerleri ezer (ör. {'date': None})
+    """
+    selected = [col for col in schema if columns is None or col in columns]
+    defaults = defaults or {}
+
+    for col in selected:
+        spec = schema[col]
+        if col in defaults:
+            spec = dict(spec, default=defaults[col], na_value=defaults[col])
+
+        values = df[col] if col in df.columns else first_present_column(df, spec['aliases'])
+
+        if values is None:
+            default = _default_value(spec)
+            df[col] = pd.NaT if default is None and spec['dtype'] == 'datetime' else default
+            continue
+
+        values = _coerce(values, spec['dtype'])
+        if spec['na_value'] is not None and values.hasnans:
+            values = values.fillna(spec['na_value'])
+        df[col] = values
+
+    return df
+
+# Az sayıda farklı değer alan sütunlar - category olarak tutulur
+CATEGORY_COLUMNS = ['platform', 'app', 'version', 'app_version', 'lang', 'source_package', 'source_app_id']
+# Serbest metin sütunları - istenirse Arrow destekli string'e çevrilir
+TEXT_COLUMNS = ['content', 'title', 'translated_text', 'author_name', 'reply_content']
+# Farklı değer sayısı satır sayısının bu oranını aşarsa category kazanç sağlamaz
+CATEGORY_MAX_RATIO = 0.5
+# Sütun → (küçük tip, alt sınır, üst sınır); boş değer varsa float32 kullanılır
+INTEGER_COLUMNS = {
+    'rating': ('int8', -128, 127),
+    'helpful_count': ('int32', -2**31, 2**31 - 1),
+}
+
+def frame_memory_mb(df):
+    """DataFrame'in metinler dahil gerçek bellek kullanımı (MB)"""
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+def _arrow_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def compact_reviews(df, arrow_text=False):
+    """
+    Yorum DataFrame'ini küçük tiplere çevir (yerinde): category, int8/int32, datetime64.
+    arrow_text=True ise metin sütunları Arrow destekli string olur (pyarrow gerekir).
+
+    Dönüş: (df, {'before_mb', 'after_mb', 'saved_pct'})
+    """
+    before_mb = float(frame_memory_mb(df))
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            if df[col].nunique(dropna=True) <= max(1, len(df) * CATEGORY_MAX_RATIO):
+                df[col] = df[col].astype('category')
+
+    for col, (small_dtype, low, high) in INTEGER_COLUMNS.items():
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        if values.hasnans:
+            df[col] = values.astype('float32')
+        elif values.between(low, high).all() and (values % 1 == 0).all():
+            df[col] = values.astype(small_dtype)
+
+    if 'date' in df.columns and not is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+
+    if arrow_text:
+        if _arrow_available():
+            for col in TEXT_COLUMNS:
+                if col in df.columns:
+                    df[col] = df[col].astype('string[pyarrow]')
+        else:
+            logger.warning("pyarrow yüklü değil - metin sütunları Arrow string'e çevrilmedi")
+
+    after_mb = float(frame_memory_mb(df))
+    memory_stats = {
+        'before_mb': round(before_mb, 2),
+        'after_mb': round(after_mb, 2),
+        'saved_pct': round((1 - after_mb / before_mb) * 100, 1) if before_mb else 0.0
+    }
+    logger.info(f"Bellek sıkıştırma: {before_mb:.1f} MB → {after_mb:.1f} MB")
+    return df, memory_stats
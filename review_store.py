@@ -0,0 +1,450 @@
+"""
+Yerel Yorum Deposu (SQLite)
+Çekilen ve işlenen yorumlar tipli tek tabloda tutulur; review id ile upsert edilir.
+Tüm modüller buradan okur/yazar - yeniden analiz için tekrar scraping gerekmez.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from review_schema import first_present_column, parse_review_dates
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.environ.get("REVIEW_STORE_PATH", os.path.join("data", "reviews.sqlite3"))
+
+# Sütun adı → SQLite tipi (review_id, platform, app anahtar sütunlarıdır)
+REVIEW_COLUMNS = {
+    'review_id': 'TEXT NOT NULL',
+    'platform': 'TEXT NOT NULL',
+    'app': 'TEXT NOT NULL',
+    'date': 'TEXT',
+    'rating': 'INTEGER',
+    'version': 'TEXT',
+    'title': 'TEXT',
+    'content': 'TEXT',
+    'translated_text': 'TEXT',
+    'author_name': 'TEXT',
+    'helpful_count': 'INTEGER',
+    'reply_content': 'TEXT',
+    'lang': 'TEXT',
+    'scraped_at': 'TEXT',
+    'updated_at': 'TEXT',
+}
+
+KEY_COLUMNS = ('platform', 'app', 'review_id')
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Boş versiyon sayılan yer tutucular - depoda NULL olarak tutulur
+MISSING_VERSION_VALUES = {'', 'nan', 'None', 'NaN', 'Unknown'}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS reviews (
+    {', '.join(f'{name} {sql_type}' for name, sql_type in REVIEW_COLUMNS.items())},
+    PRIMARY KEY ({', '.join(KEY_COLUMNS)})
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_platform_app_date ON reviews (platform, app, date);
+CREATE INDEX IF NOT EXISTS idx_reviews_version ON reviews (version);
+CREATE INDEX IF NOT EXISTS idx_reviews_platform_app_version ON reviews (platform, app, version);
+
+CREATE TABLE IF NOT EXISTS version_stats (
+    platform TEXT NOT NULL,
+    app TEXT NOT NULL,
+    version TEXT,
+    review_count INTEGER,
+    rating_sum INTEGER,
+    rating_1 INTEGER,
+    rating_2 INTEGER,
+    rating_3 INTEGER,
+    rating_4 INTEGER,
+    rating_5 INTEGER,
+    first_date TEXT,
+    last_date TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_version_stats_platform_app ON version_stats (platform, app);
+
+CREATE TABLE IF NOT EXISTS refresh_state (
+    platform TEXT NOT NULL,
+    app TEXT NOT NULL,
+    last_refresh_at TEXT,
+    new_rows INTEGER,
+    status TEXT,
+    message TEXT,
+    PRIMARY KEY (platform, app)
+);
+
+CREATE TABLE IF NOT EXISTS version_progression (
+    platform TEXT NOT NULL,
+    app TEXT NOT NULL,
+    version_first_dates TEXT,
+    valid_versions TEXT,
+    data_end_date TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (platform, app)
+);
+"""
+
+# Uygulama/versiyon başına önceden hesaplanan özet - yorum tablosunu taramadan okunur.
+# {version_filter}: boş (uygulamanın tüm versiyonları) veya sadece etkilenen versiyonlar için ek koşul
+VERSION_STATS_SQL = f"""
+INSERT INTO version_stats
+SELECT platform, app, version, COUNT(*), SUM(rating),
+       {', '.join(f'SUM(rating = {r})' for r in range(1, 6))},
+       MIN(date), MAX(date), ?
+FROM reviews WHERE platform = ? AND app = ?{{version_filter}}
+GROUP BY version
+"""
+# Versiyon özetleri bu kadar versiyonluk parçalarla güncellenir - SQLite parametre sınırı
+VERSION_STATS_CHUNK = 500
+
+def _synthetic_review_ids(frame):
+    """Id'si olmayan satırlar için içerikten kararlı id üret (CSV'den gelen veriler)"""
+    keys = (frame['platform'].astype(str) + '|' + frame['app'].astype(str) + '|' +
+            frame['date'].fillna('').astype(str) + '|' + frame['author_name'].fillna('').astype(str) + '|' +
+            frame['content'].fillna('').astype(str))
+    return ['h:' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] for key in keys]
+
+def to_store_frame(df, platform=None, app=None):
+    """Pipeline / CSV DataFrame'ini depo tablosunun sütun ve tiplerine çevir"""
+    frame = pd.DataFrame(index=df.index)
+
+    platform_col = first_present_column(df, ['platform'])
+    frame['platform'] = platform_col.astype(object).fillna(platform or 'Unknown') if platform_col is not None else (platform or 'Unknown')
+
+    app_col = first_present_column(df, ['app', 'source_package', 'source_app_id'])
+    if app_col is not None:
+        frame['app'] = app_col.astype(object).where(app_col.notna(), app or '').astype(str)
+    else:
+        frame['app'] = str(app or '')
+
+    date_col = first_present_column(df, ['date', 'at', 'updated'])
+    dates = parse_review_dates(date_col) if date_col is not None else pd.Series(pd.NaT, index=df.index)
+    frame['date'] = dates.dt.strftime(DATE_FORMAT).where(dates.notna(), None)
+
+    rating = first_present_column(df, ['rating', 'score'])
+    frame['rating'] = pd.to_numeric(rating, errors='coerce').round().astype('Int64') if rating is not None else pd.NA
+
+    versions = first_present_column(df, ['app_version', 'version'])
+    if versions is not None:
+        version_text = versions.astype(str).str.strip()
+        frame['version'] = version_text.where(versions.notna() & ~version_text.isin(MISSING_VERSION_VALUES), None)
+    else:
+        frame['version'] = None
+
+    text_sources = {
+        'title': ['title'],
+        'content': ['content', 'text'],
+        'translated_text': ['translated_text'],
+        'author_name': ['author_name', 'userName', 'author'],
+        'reply_content': ['reply_content'],
+        'lang': ['lang'],
+    }
+    for target, candidates in text_sources.items():
+        column = first_present_column(df, candidates)
+        frame[target] = column.astype(object).where(column.notna(), None) if column is not None else None
+
+    helpful = first_present_column(df, ['helpful_count', 'thumbsUpCount'])
+    frame['helpful_count'] = pd.to_numeric(helpful, errors='coerce').astype('Int64') if helpful is not None else pd.NA
+
+    review_ids = first_present_column(df, ['review_id', 'reviewId', 'id'])
+    frame['review_id'] = review_ids.astype(object).where(review_ids.notna() & (review_ids.astype(str) != ''), None) \
+        if review_ids is not None else None
+    missing_ids = frame['review_id'].isna()
+    if missing_ids.any():
+        frame.loc[missing_ids, 'review_id'] = _synthetic_review_ids(frame[missing_ids])
+    frame['review_id'] = frame['review_id'].astype(str)
+
+    return frame
+
+class ReviewStore:
+    """SQLite yorum deposu - her işlem kendi bağlantısını açar (thread güvenli)"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.write_lock = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Özet tablosundan önce oluşturulmuş depolar için özetleri bir kez hesapla
+            if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM version_stats) AND EXISTS (SELECT 1 FROM reviews)").fetchone()[0]:
+                now = datetime.now().strftime(DATE_FORMAT)
+                for platform, app in conn.execute("SELECT DISTINCT platform, app FROM reviews").fetchall():
+                    self._rebuild_version_stats(conn, platform, app, now)
+
+    @contextmanager
+    def connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def upsert_reviews(self, df, platform=None, app=None):
+        """
+        Yorumları review id ile ekle/güncelle, yazılan satır sayısını döndür.
+        Gelen NULL değerler mevcut değeri ezmez (ör. sadece çeviri sütunu yazılabilir).
+        """
+        if df is None or df.empty:
+            return 0
+
+        frame = to_store_frame(df, platform=platform, app=app)
+        now = datetime.now().strftime(DATE_FORMAT)
+        frame['scraped_at'] = now
+        frame['updated_at'] = now
+        frame = frame.drop_duplicates(subset=list(KEY_COLUMNS), keep='last')
+
+        columns = list(REVIEW_COLUMNS)
+        update_columns = [col for col in columns if col not in KEY_COLUMNS and col != 'scraped_at']
+        sql = (
+            f"INSERT INTO reviews ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(KEY_COLUMNS)}) DO UPDATE SET "
+            + ', '.join(f"{col} = COALESCE(excluded.{col}, reviews.{col})" for col in update_columns)
+        )
+
+        records = frame[columns].astype(object).where(frame[columns].notna(), None).itertuples(index=False, name=None)
+
+        with self.write_lock, self.connect() as conn:
+            # Yazılan yorumların anahtarları - yazımdan önceki ve sonraki versiyonları bulmak için
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS upsert_keys (platform TEXT, app TEXT, review_id TEXT)")
+            conn.execute("DELETE FROM upsert_keys")
+            conn.executemany("INSERT INTO upsert_keys VALUES (?, ?, ?)",
+                             frame[list(KEY_COLUMNS)].itertuples(index=False, name=None))
+            affected_versions = self._upserted_versions(conn)
+            conn.executemany(sql, records)
+            # Sadece yazılan yorumların eski ve yeni versiyonlarının özetleri aynı işlemde yeniden hesaplanır
+            affected_versions |= self._upserted_versions(conn)
+            self._update_version_stats(conn, affected_versions, now)
+
+        logger.info(f"Depoya yazıldı: {len(frame)} yorum")
+        return len(frame)
+
+    def _rebuild_version_stats(self, conn, platform, app, updated_at):
+        conn.execute("DELETE FROM version_stats WHERE platform = ? AND app = ?", (platform, app))
+        conn.execute(VERSION_STATS_SQL.format(version_filter=''), (updated_at, platform, app))
+
+    def _upserted_versions(self, conn):
+        """upsert_keys'teki yorumların depodaki (platform, app, versiyon) üçlüleri"""
+        return set(conn.execute(
+            "SELECT DISTINCT r.platform, r.app, r.version FROM upsert_keys k "
+            "JOIN reviews r ON r.platform = k.platform AND r.app = k.app AND r.review_id = k.review_id"
+        ).fetchall())
+
+    def _update_version_stats(self, conn, affected_versions, updated_at):
+        """Sadece verilen (platform, app, versiyon) özetlerini yeniden hesapla - uygulamanın tüm geçmişi taranmaz"""
+        versions_by_app = {}
+        for platform, app, version_name in affected_versions:
+            versions_by_app.setdefault((platform, app), []).append(version_name)
+
+        for (platform, app), versions in versions_by_app.items():
+            if None in versions:
+                conn.execute("DELETE FROM version_stats WHERE platform = ? AND app = ? AND version IS NULL",
+                             (platform, app))
+                conn.execute(VERSION_STATS_SQL.format(version_filter=' AND version IS NULL'),
+                             (updated_at, platform, app))
+            named = [version_name for version_name in versions if version_name is not None]
+            for start in range(0, len(named), VERSION_STATS_CHUNK):
+                chunk = named[start:start + VERSION_STATS_CHUNK]
+                version_filter = f" AND version IN ({', '.join('?' for _ in chunk)})"
+                conn.execute(f"DELETE FROM version_stats WHERE platform = ? AND app = ?{version_filter}",
+                             (platform, app, *chunk))
+                conn.execute(VERSION_STATS_SQL.format(version_filter=version_filter),
+                             (updated_at, platform, app, *chunk))
+
+    def latest_review_date(self, platform, app):
+        """Uygulamanın depodaki en yeni yorum tarihi (yoksa None)"""
+        with self.connect() as conn:
+            row = conn.execute("SELECT MAX(date) FROM reviews WHERE platform = ? AND app = ?",
+                               (platform, str(app))).fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] else None
+
+    def review_ids(self, platform, app, start_date=None):
+        """Uygulamanın (start_date sonrası) kayıtlı review id'leri"""
+        sql = "SELECT review_id FROM reviews WHERE platform = ? AND app = ?"
+        params = [platform, str(app)]
+        if start_date is not None:
+            sql += " AND date >= ?"
+            params.append(pd.Timestamp(start_date).strftime(DATE_FORMAT))
+        with self.connect() as conn:
+            return {row[0] for row in conn.execute(sql, params)}
+
+    def load_version_stats(self, platform=None, app=None):
+        """Versiyon özetlerini oku - first_date/last_date datetime"""
+        conditions = []
+        params = []
+        for column, value in (('platform', platform), ('app', app)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(str(value))
+
+        sql = "SELECT * FROM version_stats"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY platform, app, first_date"
+
+        with self.connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+        for column in ('first_date', 'last_date'):
+            df[column] = parse_review_dates(df[column], label=column)
+        return df
+
+    def load_app_summaries(self):
+        """Uygulama başına yorum sayısı, ortalama puan ve son otomatik yenileme - sadece özet tablolarından"""
+        sql = """
+            SELECT s.platform, s.app,
+                   SUM(s.review_count) AS review_count,
+                   CAST(SUM(s.rating_sum) AS REAL) /
+                       NULLIF(SUM(s.rating_1 + s.rating_2 + s.rating_3 + s.rating_4 + s.rating_5), 0) AS avg_rating,
+                   COUNT(s.version) AS version_count,
+                   MAX(s.last_date) AS last_date,
+                   r.last_refresh_at, r.new_rows, r.status
+            FROM version_stats s
+            LEFT JOIN refresh_state r ON r.platform = s.platform AND r.app = s.app
+            GROUP BY s.platform, s.app ORDER BY s.platform, s.app
+        """
+        with self.connect() as conn:
+            return pd.read_sql_query(sql, conn)
+
+    def record_refresh(self, platform, app, new_rows, status, message=None):
+        """Otomatik yenilemenin sonucunu kaydet"""
+        with self.write_lock, self.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO refresh_state (platform, app, last_refresh_at, new_rows, status, message) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, str(app), datetime.now().strftime(DATE_FORMAT), int(new_rows), status, message)
+            )
+
+    def save_version_progression(self, platform, app, progression):
+        """
+        Versiyon düzelticinin ham geçmişini (doldurma öncesi ilk görülme tarihleri, geçerli versiyonlar, veri sonu) yaz.
+        version_stats doldurulmuş versiyonlardan hesaplandığı için artımlı düzeltme bu kaydı kullanır.
+        """
+        with self.write_lock, self.connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO version_progression "
+                "(platform, app, version_first_dates, valid_versions, data_end_date, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, str(app), json.dumps(progression['version_first_dates'], ensure_ascii=False),
+                 json.dumps(progression['valid_versions'], ensure_ascii=False), progression['data_end_date'],
+                 datetime.now().strftime(DATE_FORMAT))
+            )
+
+    def load_version_progression(self, platform, app):
+        """Kayıtlı versiyon geçmişi (save_version_progression formatında) - yoksa None"""
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT version_first_dates, valid_versions, data_end_date FROM version_progression "
+                "WHERE platform = ? AND app = ?", (platform, str(app))
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'version_first_dates': json.loads(row[0] or '{}'),
+            'valid_versions': json.loads(row[1] or '[]'),
+            'data_end_date': row[2],
+        }
+
+    def load_refresh_state(self):
+        with self.connect() as conn:
+            return pd.read_sql_query("SELECT * FROM refresh_state ORDER BY platform, app", conn)
+
+    def load_reviews(self, platform=None, app=None, start_date=None, end_date=None, columns=None):
+        """Filtrelere uyan yorumları DataFrame olarak oku (tarih sütunu datetime)"""
+        conditions = []
+        params = []
+
+        for column, value in (('platform', platform), ('app', app)):
+            if value:
+                values = [value] if isinstance(value, str) else list(value)
+                conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(str(v) for v in values)
+
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(pd.Timestamp(start_date).strftime(DATE_FORMAT))
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(pd.Timestamp(end_date).normalize().strftime('%Y-%m-%d') + ' 23:59:59')
+
+        selected = [col for col in (columns or REVIEW_COLUMNS) if col in REVIEW_COLUMNS]
+        sql = f"SELECT {', '.join(selected)} FROM reviews"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY date"
+
+        with self.connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+
+        if 'date' in df.columns:
+            df['date'] = parse_review_dates(df['date'])
+        return df
+
+    def list_apps(self):
+        """Depodaki platform/uygulama çiftleri ve özetleri"""
+        sql = """
+            SELECT platform, app, COUNT(*) AS review_count,
+                   MIN(date) AS first_date, MAX(date) AS last_date,
+                   MAX(updated_at) AS last_update
+            FROM reviews GROUP BY platform, app ORDER BY platform, app
+        """
+        with self.connect() as conn:
+            return pd.read_sql_query(sql, conn)
+
+    def delete_app(self, platform, app):
+        """Bir uygulamanın tüm yorumlarını sil, silinen satır sayısını döndür"""
+        with self.write_lock, self.connect() as conn:
+            cursor = conn.execute("DELETE FROM reviews WHERE platform = ? AND app = ?", (platform, str(app)))
+            for table in ('version_stats', 'refresh_state', 'version_progression'):
+                conn.execute(f"DELETE FROM {table} WHERE platform = ? AND app = ?", (platform, str(app)))
+            return cursor.rowcount
+
+_review_store = None
+_review_store_lock = threading.Lock()
+
+def get_review_store():
+    """Süreç genelindeki yorum deposunu döndür (ilk çağrıda oluşturulur)"""
+    global _review_store
+    with _review_store_lock:
+        if _review_store is None:
+            _review_store = ReviewStore()
+        return _review_store
+
+def select_stored_reviews(platform=None, key="store"):
+    """Depodan uygulama seçtiren Streamlit bileşeni - seçilen verinin DataFrame'ini döndürür"""
+    from streamlit_compat import st
+
+    try:
+        apps = get_review_store().list_apps()
+    except sqlite3.Error as e:
+        st.error(f"❌ Veritabanı okunamadı: {e}")
+        return None
+
+    if platform:
+        apps = apps[apps['platform'] == platform]
+
+    if apps.empty:
+        st.warning("❌ Veritabanında kayıtlı yorum yok - önce scraping yapın")
+        return None
+
+    labels = {
+        f"{row.platform} - {row.app} ({row.review_count:,} yorum)": (row.platform, row.app)
+        for row in apps.itertuples()
+    }
+    selected_label = st.selectbox("🗄️ Kayıtlı uygulama:", list(labels), key=f"{key}_app")
+    selected_platform, selected_app = labels[selected_label]
+
+    df = get_review_store().load_reviews(platform=selected_platform, app=selected_app)
+    st.info(f"🗄️ {len(df):,} yorum veritabanından yüklendi")
+    return df
@@ -1,5 +1,3 @@
-import streamlit as st
-import requests
 import json
 import time
 import csv
@@ -12,12 +10,19 @@ from io import StringIO
 import math
 from typing import Optional
 
+from streamlit_compat import st
+from review_store import get_review_store
+from export_utils import render_binary_downloads
+from scrape_cache import get_scrape_cache, scrape_cache_key
+from rate_limiter import wait_for_slot
+
 class SafeRSSAppStoreScraper:
     def __init__(self):
-        self.session = requests.Session()
+        # Oturum ilk istekte açılır - sayfa açılışında requests yüklenmez
+        self._session = None
         
         # Daha güvenli headers
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'tr-TR,tr;q=0.9,en;q=0.8',
@@ -25,7 +30,15 @@ class SafeRSSAppStoreScraper:
             'Connection': 'keep-alive',
             'Cache-Control': 'no-cache',
             'Pragma': 'no-cache'
-        })
+        }
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+        return self._session
 
     def parse_date_string(self, date_str):
         """Tarih string'ini datetime objesine çevir"""
@@ -108,8 +121,12 @@ class SafeRSSAppStoreScraper:
 
     def safe_rss_scraper(self, app_id, country='en', max_pages=50, delay_range=(2, 5), 
                         start_date_filter=None, end_date_filter=None, progress_callback=None,
-                        max_reviews=None):  # YENİ PARAMETRE
-        """Güvenli RSS Feed scraper with progress tracking and review limit"""
+                        max_reviews=None, page_callback=None):  # YENİ PARAMETRE
+        """Güvenli RSS Feed scraper with progress tracking and review limit
+
+        page_callback verilirse her sayfanın yorumları eklendiği anda ona iletilir (akış modu)
+        """
+        import requests
         
         start_date = None
         end_date = None
@@ -175,6 +192,7 @@ class SafeRSSAppStoreScraper:
             try:
                 delay = random.uniform(delay_range[0], delay_range[1])
                 time.sleep(delay)
+                wait_for_slot('app_store')
                 
                 response = self.session.get(url, timeout=30)
                 
@@ -246,6 +264,9 @@ class SafeRSSAppStoreScraper:
                                 
                                 all_reviews.extend(page_reviews)
                                 
+                                if page_callback:
+                                    page_callback(page_reviews)
+                                
                                 if out_of_range_ratio >= out_of_range_threshold:
                                     consecutive_out_of_range_pages += 1
                                 else:
@@ -428,6 +449,14 @@ def main():
             
             if reviews:
                 st.success(f"✅ {len(reviews)} review başarıyla çekildi!")
+                
+                try:
+                    stored_count = get_review_store().upsert_reviews(
+                        pd.DataFrame(reviews), platform='App Store', app=str(app_id)
+                    )
+                    st.info(f"🗄️ {stored_count:,} review veritabanına kaydedildi")
+                except Exception as e:
+                    st.warning(f"⚠️ Veritabanına kaydedilemedi: {e}")
             else:
                 st.error("❌ Hiçbir review alınamadı")
     
@@ -556,6 +585,8 @@ def main():
                 mime="text/plain"
             )
         
+        render_binary_downloads(df, f"rss_reviews_{st.session_state.app_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}", key="rss_reviews")
+        
         # İlk birkaç review'u göster
         st.subheader("📋 İlk 3 Review Örneği")
         
@@ -570,8 +601,11 @@ def main():
 # Koordinatör için ana fonksiyon - İyileştirilmiş
 def scrape_app_store_reviews(app_id: str, max_pages: int = 30, country: str = 'tr',
                            start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
-                           max_reviews: Optional[int] = None):
-    """Ana koordinatör tarafından çağrılacak fonksiyon - Sadece gerçek RSS API"""
+                           max_reviews: Optional[int] = None, page_callback=None, use_cache: bool = True):
+    """
+    Ana koordinatör tarafından çağrılacak fonksiyon - Sadece gerçek RSS API.
+    use_cache: oturumlar arası önbellek (page_callback verilirse sayfalar canlı gerektiği için kullanılmaz)
+    """
     try:
         # MAX_REVIEWS LİMİT KONTROLÜ
         if max_reviews:
@@ -586,19 +620,33 @@ def scrape_app_store_reviews(app_id: str, max_pages: int = 30, country: str = 't
         start_date_str = start_date.strftime('%Y-%m-%d') if start_date else None
         end_date_str = end_date.strftime('%Y-%m-%d') if end_date else None
         
-        reviews = scraper.safe_rss_scraper(
-            app_id=int(app_id),
-            country=country,
-            max_pages=max_pages,
-            delay_range=(2, 4),
-            start_date_filter=start_date_str,
-            end_date_filter=end_date_str,
-            max_reviews=max_reviews
-        )
+        def fetch():
+            return scraper.safe_rss_scraper(
+                app_id=int(app_id),
+                country=country,
+                max_pages=max_pages,
+                delay_range=(2, 4),
+                start_date_filter=start_date_str,
+                end_date_filter=end_date_str,
+                max_reviews=max_reviews,
+                page_callback=page_callback
+            )
+        
+        if use_cache and page_callback is None:
+            cache_key = scrape_cache_key('app_store', app_id, country, start_date, end_date,
+                                         max_pages=max_pages, max_reviews=max_reviews)
+            reviews, cache_status = get_scrape_cache().get_or_compute(cache_key, fetch)
+            if cache_status != 'miss':
+                try:
+                    st.info(f"♻️ App Store: {app_id} sonuçları "
+                            f"{'önbellekten alındı' if cache_status == 'hit' else 'aynı anda çalışan scraping ile paylaşıldı'}")
+                except:
+                    pass
+        else:
+            reviews = fetch()
         
         if reviews and len(reviews) > 0:
             try:
-                import streamlit as st
                 st.success(f"✅ App Store RSS: {len(reviews)} gerçek yorum alındı")
             except:
                 pass
@@ -606,7 +654,6 @@ def scrape_app_store_reviews(app_id: str, max_pages: int = 30, country: str = 't
         else:
             # Mock veri yok - sadece boş liste döndür
             try:
-                import streamlit as st
                 st.warning(f"⚠️ App Store RSS API'dan veri alınamadı (App ID: {app_id})")
             except:
                 pass
@@ -614,7 +661,6 @@ def scrape_app_store_reviews(app_id: str, max_pages: int = 30, country: str = 't
         
     except Exception as e:
         try:
-            import streamlit as st
             st.error(f"❌ App Store RSS scraping hatası: {e}")
         except:
             pass
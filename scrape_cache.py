@@ -0,0 +1,128 @@
+"""
+Scraping Sonuç Önbelleği
+Aynı kaynak/uygulama/ülke/tarih aralığı/limit için scraping sonucunu süreç genelinde TTL ile saklar.
+Aynı anda gelen özdeş istekler birleştirilir: scraping bir kez çalışır, diğerleri sonucunu bekler.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = int(os.environ.get("SCRAPE_CACHE_TTL", 15 * 60))
+# Önbellekteki toplam yorum sayısı sınırı - aşılınca en eski kullanılan sonuç atılır
+DEFAULT_MAX_REVIEWS = int(os.environ.get("SCRAPE_CACHE_MAX_REVIEWS", 200_000))
+
+def scrape_cache_key(source, app, country=None, start_date=None, end_date=None, **limits):
+    """(kaynak, uygulama, ülke/dil, tarih aralığı, limitler) anahtarı"""
+    return (
+        source,
+        str(app),
+        country,
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None,
+        tuple(sorted(limits.items()))
+    )
+
+class ScrapeCache:
+    """TTL'li, toplam yorum sayısıyla sınırlı LRU önbellek + tek uçuş (single-flight) birleştirme"""
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS, max_reviews=DEFAULT_MAX_REVIEWS):
+        self.ttl_seconds = ttl_seconds
+        self.max_reviews = max_reviews
+        self.entries = OrderedDict()
+        self.total_reviews = 0
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+
+    def _pop(self, key):
+        _, result = self.entries.pop(key)
+        self.total_reviews -= len(result)
+
+    def _get_fresh(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            self._pop(key)
+            return None
+        self.entries.move_to_end(key)
+        return result
+
+    def _put(self, key, result):
+        if len(result) > self.max_reviews:
+            return
+        if key in self.entries:
+            self._pop(key)
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, result)
+        self.total_reviews += len(result)
+        while self.total_reviews > self.max_reviews:
+            self._pop(next(iter(self.entries)))
+            self.stats['evictions'] += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Önbellekte taze sonuç varsa onu, aynı istek çalışıyorsa onun sonucunu, yoksa compute()'u döndür.
+        Boş sonuçlar (geçici hata olabilir) önbelleğe alınmaz.
+
+        Dönüş: (çağırana ait liste kopyası, 'hit' / 'coalesced' / 'miss')
+        """
+        with self.lock:
+            cached = self._get_fresh(key)
+            if cached is not None:
+                self.stats['hits'] += 1
+                return list(cached), 'hit'
+
+            future = self.in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.in_flight[key] = future
+                self.stats['misses'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not is_leader:
+            logger.info(f"Aynı scraping zaten çalışıyor, sonucu bekleniyor: {key[:2]}")
+            try:
+                return list(future.result() or []), 'coalesced'
+            except BaseException:
+                # Lider yarıda kaldıysa (hata / Streamlit rerun) isteği kendimiz çalıştırırız
+                return self.get_or_compute(key, compute)
+
+        try:
+            result = compute()
+        except BaseException as e:
+            with self.lock:
+                self.in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            if result:
+                self._put(key, result)
+            self.in_flight.pop(key, None)
+        future.set_result(result)
+        return list(result or []), 'miss'
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_reviews = 0
+
+_scrape_cache = None
+_scrape_cache_lock = threading.Lock()
+
+def get_scrape_cache():
+    """Süreç genelindeki scraping önbelleğini döndür (ilk çağrıda oluşturulur)"""
+    global _scrape_cache
+    with _scrape_cache_lock:
+        if _scrape_cache is None:
+            _scrape_cache = ScrapeCache()
+        return _scrape_cache
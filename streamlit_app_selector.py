@@ -1,4 +1,3 @@
-import streamlit as st
 import pandas as pd
 from datetime import datetime
 import logging
@@ -7,6 +6,11 @@ import re
 import os
 import io
 
+from streamlit_compat import st
+from export_utils import export_to_bytes, render_binary_downloads, write_json_records, write_txt_records
+from review_io import UPLOAD_TYPES, is_data_file, read_reviews_file
+from review_store import select_stored_reviews
+
 # Logging ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -36,7 +40,6 @@ def process_app_store_data(df, selected_columns):
         if not available_columns:
             # Hiç sütun bulunamadıysa tüm dataframe'i döndür
             try:
-                import streamlit as st
                 st.warning(f"⚠️ İstenen sütunlar bulunamadı, tüm sütunlar korunuyor")
             except:
                 pass
@@ -60,7 +63,6 @@ def process_app_store_data(df, selected_columns):
         
     except Exception as e:
         try:
-            import streamlit as st
             st.error(f"❌ Veri işleme hatası: {e}")
         except:
             pass
@@ -68,17 +70,16 @@ def process_app_store_data(df, selected_columns):
 
 def create_txt_content(df):
     """
-    DataFrame'den TXT içeriği oluştur
+    DataFrame'den TXT içeriği oluştur - parça parça, vektörel
     """
-    txt_content = ""
-    for _, row in df.iterrows():
-        txt_content += f"Başlık: {row.get('title', 'N/A')}\n"
-        txt_content += f"İçerik: {row.get('content', 'N/A')}\n"
-        txt_content += f"Puan: {row.get('rating', 'N/A')}\n"
-        txt_content += f"Versiyon: {row.get('version', 'N/A')}\n"
-        txt_content += f"Tarih: {row.get('date', 'N/A')}\n"
-        txt_content += "---\n"
-    return txt_content
+    txt_fields = [
+        ("Başlık", ['title']),
+        ("İçerik", ['content']),
+        ("Puan", ['rating']),
+        ("Versiyon", ['version']),
+        ("Tarih", ['date']),
+    ]
+    return export_to_bytes(write_txt_records, df, fields=txt_fields).decode('utf-8')
 
 def scan_app_reviews_folder():
     """
@@ -89,7 +90,7 @@ def scan_app_reviews_folder():
     
     if os.path.exists(app_reviews_dir):
         for file in os.listdir(app_reviews_dir):
-            if file.endswith('.csv'):
+            if is_data_file(file):
                 csv_files.append(os.path.join(app_reviews_dir, file))
     
     return csv_files
@@ -114,12 +115,13 @@ def main():
         # Dosya seçim yöntemi
         file_source = st.radio(
             "Dosya kaynağını seçin:",
-            ["📂 app_reviews klasöründen seç", "📤 Dosya yükle"],
-            help="Mevcut dosyalardan seçin veya yeni dosya yükleyin"
+            ["📂 app_reviews klasöründen seç", "📤 Dosya yükle", "🗄️ Veritabanından seç"],
+            help="Mevcut dosyalardan seçin, yeni dosya yükleyin veya kayıtlı yorumları kullanın"
         )
         
         uploaded_file = None
         selected_file_path = None
+        stored_df = None
         
         if file_source == "📂 app_reviews klasöründen seç":
             # app_reviews klasöründeki dosyaları listele
@@ -149,15 +151,18 @@ def main():
                     except Exception as e:
                         st.warning(f"Dosya bilgisi alınamadı: {e}")
             else:
-                st.warning("❌ app_reviews klasöründe CSV dosyası bulunamadı!")
+                st.warning("❌ app_reviews klasöründe CSV / Parquet / Arrow dosyası bulunamadı!")
                 st.info("RSS scraper ile önce veri çekin veya dosya yükleme seçeneğini kullanın.")
         
+        elif file_source == "🗄️ Veritabanından seç":
+            stored_df = select_stored_reviews(platform='App Store', key="app_selector")
+        
         else:
             # Dosya yükleme
             uploaded_file = st.file_uploader(
-                "CSV dosyasını yükleyin:",
-                type=['csv'],
-                help="App Store RSS verisi içeren CSV dosyasını seçin"
+                "CSV / Parquet / Arrow dosyasını yükleyin:",
+                type=UPLOAD_TYPES,
+                help="App Store RSS verisi içeren CSV, Parquet veya Arrow dosyasını seçin"
             )
         
         st.markdown("---")
@@ -179,16 +184,18 @@ def main():
     # Dosya yükleme veya seçme işlemi
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
+            df = read_reviews_file(uploaded_file)
             st.success(f"✅ Dosya yüklendi: {len(df)} satır")
         except Exception as e:
             st.error(f"❌ Dosya yükleme hatası: {e}")
     elif selected_file_path:
         try:
-            df = pd.read_csv(selected_file_path)
+            df = read_reviews_file(selected_file_path)
             st.success(f"✅ Dosya seçildi: {os.path.basename(selected_file_path)} - {len(df)} satır")
         except Exception as e:
             st.error(f"❌ Dosya okuma hatası: {e}")
+    elif stored_df is not None and not stored_df.empty:
+        df = stored_df
 
     if df is not None:
         try:
@@ -421,7 +428,7 @@ def main():
                         
                         # JSON İndir
                         with col2:
-                            json_data = processed_df.to_json(orient='records', force_ascii=False, indent=2)
+                            json_data = export_to_bytes(write_json_records, processed_df)
                             
                             st.download_button(
                                 label="📋 JSON İndir",
@@ -443,6 +450,9 @@ def main():
                                 use_container_width=True
                             )
                         
+                        # Parquet / Arrow İndir
+                        render_binary_downloads(processed_df, f"edited_app_store_{timestamp}", key="selector_edited")
+                        
                         # Özet bilgiler
                         st.markdown("---")
                         st.subheader("📋 İşlem Özeti")
@@ -0,0 +1,124 @@
+"""
+Streamlit Uyumluluk Katmanı
+İşleme modülleri `st`'yi buradan alır: Streamlit ilk kullanımda yüklenir.
+Headless modda (CLI / cron) Streamlit hiç yüklenmez, mesajlar log'a yazılır.
+"""
+
+import functools
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+HEADLESS_ENV = "REVIEW_PIPELINE_HEADLESS"
+
+_headless = os.environ.get(HEADLESS_ENV) == "1"
+
+def set_headless(enabled=True):
+    """Headless modu aç/kapat - UI modülleri import edilmeden önce çağrılmalı"""
+    global _headless
+    _headless = enabled
+
+def is_headless():
+    return _headless
+
+class _NullElement:
+    """progress, empty, columns, expander vb. için her çağrıyı yutan yer tutucu"""
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+class _HeadlessStreamlit:
+    """Streamlit API'sinin pipeline modüllerinde kullanılan kısmının log'a yazan karşılığı"""
+
+    _LOG_LEVELS = {
+        'error': logging.ERROR,
+        'exception': logging.ERROR,
+        'warning': logging.WARNING,
+        'info': logging.INFO,
+        'success': logging.INFO,
+        'toast': logging.INFO,
+        'write': logging.DEBUG,
+        'markdown': logging.DEBUG,
+        'text': logging.DEBUG,
+        'caption': logging.DEBUG,
+    }
+
+    def __init__(self):
+        self.session_state = {}
+        self.sidebar = _NullElement()
+
+    def columns(self, spec, *args, **kwargs):
+        count = spec if isinstance(spec, int) else len(spec)
+        return [_NullElement() for _ in range(count)]
+
+    def tabs(self, labels, *args, **kwargs):
+        return [_NullElement() for _ in labels]
+
+    def __getattr__(self, name):
+        if name in self._LOG_LEVELS:
+            level = self._LOG_LEVELS[name]
+            return lambda body='', *args, **kwargs: logger.log(level, str(body))
+        return _NullElement()
+
+class _LazyCacheData:
+    """Modül import'unda Streamlit yüklemeyen cache_data - karar ilk çağrıda verilir"""
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+
+    def __call__(self, func=None, **cache_kwargs):
+        if func is None:
+            return lambda f: self(f, **cache_kwargs)
+
+        resolved = []
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not resolved:
+                target = self._proxy._resolve()
+                resolved.append(func if target is self._proxy._headless_module
+                                else target.cache_data(func, **cache_kwargs))
+            return resolved[0](*args, **kwargs)
+
+        return wrapper
+
+    def clear(self):
+        if not _headless:
+            self._proxy._resolve().cache_data.clear()
+
+class _LazyStreamlit:
+    """`import streamlit as st` yerine geçer; gerçek modül ilk özellik erişiminde yüklenir"""
+
+    def __init__(self):
+        self._module = None
+        self._headless_module = _HeadlessStreamlit()
+        self.cache_data = _LazyCacheData(self)
+
+    def _resolve(self):
+        if _headless:
+            return self._headless_module
+        if self._module is None:
+            import streamlit
+            self._module = streamlit
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+st = _LazyStreamlit()
@@ -15,19 +15,11 @@ st.set_page_config(
 
 # Modüller import - Hata yakalama ile
 try:
-    from play_scraper_streamlit import scrape_play_reviews
-    from streamlit_version_fixer import process_and_save_data
-    from translator_streamlit import translate_reviews
-    from rss_scraper_streamlit import scrape_app_store_reviews
-    from streamlit_app_selector import process_app_store_data
-    from streamlit_z_analiz import (
-        analyze_platform_data,
-        create_platform_rating_pie_charts,
-        create_version_rating_analysis,
-        create_rating_trend_analysis,
-        create_heatmap_analysis,
-        create_platform_comparison_summary,
-    )
+    from review_pipeline import build_pipeline_config, run_pipeline, load_stored_pipeline_result, StreamingPipelineError
+    from job_runner import get_job_manager, ACTIVE_STATUSES, STATUS_DONE
+    from portfolio import parse_portfolio, run_portfolio_config, render_portfolio_comparison, DEFAULT_PORTFOLIO_WORKERS
+    from review_store import get_review_store
+    from export_utils import EXPORT_FORMATS, data_version_token, get_cached_export, get_or_build_export
     MODULES_LOADED = True
 except ImportError as e:
     st.error(f"⚠ Modül import hatası: {e}")
@@ -50,6 +42,12 @@ if "scraping_metadata" not in st.session_state:
 if "show_analysis" not in st.session_state:
     st.session_state.show_analysis = False
 
+if "pending_job_ids" not in st.session_state:
+    st.session_state.pending_job_ids = []
+
+if "portfolio_aggregates" not in st.session_state:
+    st.session_state.portfolio_aggregates = None
+
 # Ana başlık
 st.title("🎯 Yorum Scraping & Analiz Sistemi")
 st.markdown("**Otomatik:** çek → düzelt → çevir → işle → analiz")
@@ -112,15 +110,107 @@ with st.form("main_form"):
             default=["🔧 Versiyon düzeltme", "🌍 Çeviri işlemi", "📊 Analiz"]
         )
     
-    # Pipeline başlat butonu
-    submitted = st.form_submit_button(
-        "🚀 Scraping Başlat", 
-        type="primary", 
-        use_container_width=True
+    streaming_mode = st.checkbox(
+        "⚡ Akış modu (çekilen yorumları parça parça işle)",
+        value=False,
+        help="Yorumlar çekildikçe versiyon düzeltme ve çeviriden geçer; çeviri, scraping bitmeden başlar"
+    )
+    
+    run_in_background = st.checkbox(
+        "🧵 Arka planda çalıştır",
+        value=False,
+        help="İş sunucuda ayrı bir thread'de çalışır; sayfa yenilense veya başka bir yere tıklansa da devam eder"
     )
+    
+    use_scrape_cache = st.checkbox(
+        "♻️ Yakın zamanda çekilmiş sonuçları kullan",
+        value=True,
+        help="Aynı uygulama ve tarih aralığı son dakikalarda çekildiyse (veya şu an çekiliyorsa) tekrar scraping yapılmaz"
+    )
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Pipeline başlat butonu
+        submitted = st.form_submit_button(
+            "🚀 Scraping Başlat", 
+            type="primary", 
+            use_container_width=True
+        )
+    
+    with col2:
+        # Aynı uygulama/tarih aralığı için veritabanındaki yorumlarla analiz
+        load_from_store = st.form_submit_button(
+            "🗄️ Kayıtlı Veriden Analiz",
+            use_container_width=True
+        )
+
+# PORTFÖY MODU - ÇOKLU UYGULAMA
+with st.expander("🗂️ Portföy Modu (çoklu uygulama)"):
+    with st.form("portfolio_form"):
+        portfolio_text = st.text_area(
+            "📋 Uygulamalar (her satırda: ad, paket adı, App Store ID)",
+            value="tcdd, tr.gov.tcdd.tasimacilik, 1360892562",
+            height=150,
+            help="Bir platformu atlamak için alanı boş bırakın (ör. 'uygulama, com.ornek.app,'). '#' ile başlayan satırlar yok sayılır."
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            portfolio_start = st.date_input("Başlangıç Tarihi", value=datetime(2025, 5, 1).date(), key="portfolio_start")
+        
+        with col2:
+            portfolio_end = st.date_input("Bitiş Tarihi", value=datetime.now().date(), key="portfolio_end")
+        
+        with col3:
+            portfolio_workers = st.number_input(
+                "🧵 Paralel uygulama", min_value=1, max_value=16, value=DEFAULT_PORTFOLIO_WORKERS,
+                help="Aynı anda işlenecek uygulama sayısı - mağaza istekleri yine ortak hız sınırına tabidir"
+            )
+        
+        portfolio_options = st.multiselect(
+            "🔧 İşleme Seçenekleri:",
+            ["🔧 Versiyon düzeltme", "🌍 Çeviri işlemi"],
+            default=["🔧 Versiyon düzeltme"],
+            key="portfolio_options"
+        )
+        
+        portfolio_background = st.checkbox("🧵 Arka planda çalıştır", value=False, key="portfolio_background")
+        
+        portfolio_submitted = st.form_submit_button("🗂️ Portföyü Çalıştır", type="primary", use_container_width=True)
+
+# VERİTABANI DURUMU - ÖZET TABLOLARINDAN, YORUMLAR TARANMAZ
+with st.expander("🕒 Veritabanı Durumu ve Otomatik Yenileme"):
+    try:
+        app_summaries = get_review_store().load_app_summaries()
+    except Exception as e:
+        app_summaries = None
+        st.error(f"❌ Veritabanı okunamadı: {e}")
+    
+    if app_summaries is not None and app_summaries.empty:
+        st.info("🗄️ Veritabanında kayıtlı yorum yok")
+    elif app_summaries is not None:
+        st.dataframe(
+            app_summaries.rename(columns={
+                'platform': 'Platform',
+                'app': 'Uygulama',
+                'review_count': 'Yorum',
+                'avg_rating': 'Ort. Puan',
+                'version_count': 'Versiyon',
+                'last_date': 'Son Yorum',
+                'last_refresh_at': 'Son Otomatik Yenileme',
+                'new_rows': 'Son Yenilemede Yeni',
+                'status': 'Durum'
+            }).round(2),
+            use_container_width=True,
+            hide_index=True
+        )
+    st.caption("🔄 Otomatik yenileme: `python refresh_daemon.py --config pipeline_config.json` "
+               "- sonra **🗄️ Kayıtlı Veriden Analiz** ile güncel veri scraping yapılmadan açılır")
 
 # MEVCUT VERİ KONTROL PANEL - BASİT
-if st.session_state.scraped_data is not None and not submitted:
+if st.session_state.scraped_data is not None and not (submitted or load_from_store or portfolio_submitted):
     st.markdown("---")
     st.subheader("📊 Mevcut Scraping Verileri")
     
@@ -144,6 +234,34 @@ if st.session_state.scraped_data is not None and not submitted:
         total_count = play_count + app_count
         st.metric("🎯 Toplam", f"{total_count:,}")
     
+    # Akış modu aşama verimi
+    if metadata.get('stream_stats'):
+        with st.expander("⚡ Akış Aşaması Verimi"):
+            st.dataframe(pd.DataFrame(metadata['stream_stats']), use_container_width=True)
+
+    # Aşama süreleri ve verim
+    if metadata.get('stage_metrics'):
+        with st.expander("⏱️ Aşama Süreleri ve Verim"):
+            stage_df = pd.DataFrame(metadata['stage_metrics']).rename(columns={
+                'stage': 'Aşama',
+                'rows_in': 'Giren satır',
+                'rows_out': 'Çıkan satır',
+                'seconds': 'Süre (sn)',
+                'rows_per_sec': 'Satır/sn',
+                'peak_rss_mb': 'Tepe bellek (MB)',
+                'status': 'Durum'
+            })
+            st.dataframe(stage_df, use_container_width=True, hide_index=True)
+            total_seconds = sum(stage['seconds'] for stage in metadata['stage_metrics'])
+            slowest = max(metadata['stage_metrics'], key=lambda stage: stage['seconds'])
+            st.caption(f"Toplam {total_seconds:.1f} sn - en yavaş aşama: {slowest['stage']} ({slowest['seconds']:.1f} sn)")
+
+    # Sıkıştırılmış veri boyutu
+    if metadata.get('memory'):
+        memory_stats = metadata['memory']
+        st.caption(f"🗜️ Bellekte {memory_stats['after_mb']:.1f} MB "
+                   f"(sıkıştırmadan önce {memory_stats['before_mb']:.1f} MB, %{memory_stats['saved_pct']:.0f} tasarruf)")
+
     # Ana kontrol butonları
     col1, col2, col3 = st.columns(3)
     
@@ -170,7 +288,7 @@ if st.session_state.scraped_data is not None and not submitted:
             st.rerun()
 
 # SCRAPING PIPELINE - FORM SUBMİT EDİLDİĞİNDE
-if submitted:
+if submitted or load_from_store:
     if start_date >= end_date:
         st.error("⚠ Başlangıç tarihi bitiş tarihinden önce olmalıdır!")
         st.stop()
@@ -178,274 +296,232 @@ if submitted:
     # Platform seçimlerini değişkenlere çevir
     enable_play_store = "📱 Play Store" in selected_platforms
     enable_app_store = "🍎 App Store" in selected_platforms
-    enable_version_fix = "🔧 Versiyon düzeltme" in processing_options
-    enable_translation = "🌍 Çeviri işlemi" in processing_options
-    enable_analysis = "📊 Analiz" in processing_options
     
-    st.markdown("---")
-    st.subheader("🔄 Scraping İşlemi")
-    
-    # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    total_steps = sum([enable_play_store, enable_app_store, enable_version_fix, enable_translation])
-    current_step = 0
-    
-    def update_progress(message, step_increment=1):
-        global current_step
-        current_step += step_increment
-        progress = min(current_step / total_steps, 1.0) if total_steps > 0 else 1.0
-        progress_bar.progress(progress)
-        status_text.info(f"🔄 {message}")
-    
-    # Veri saklama
-    combined_data = []
-    metadata = {
-        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
-        'date_range': f"{start_date} - {end_date}",
-        'play_count': 0,
-        'app_count': 0,
-        'package_name': package_name,
-        'app_id': appstore_app_id
-    }
-    
-    # PLAY STORE SCRAPING
-    if enable_play_store:
-        update_progress("📱 Play Store yorumları çekiliyor...")
-        
-        try:
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            
-            play_raw = scrape_play_reviews(
-                package_name=package_name, 
-                max_count=5000, 
-                lang='tr',
-                start_date=start_datetime,
-                end_date=end_datetime
-            )
-            
-            df_play = pd.DataFrame(play_raw) if play_raw else pd.DataFrame()
-            
-            if not df_play.empty:
-                # Version fixing
-                if enable_version_fix:
-                    update_progress("🔧 Play Store versiyon düzeltiliyor...")
-                    df_play = process_and_save_data(df_play)
-                
-                # Translation
-                if enable_translation:
-                    update_progress("🌍 Play Store yorumları çevriliyor...")
-                    df_play = translate_reviews(df_play)
-                
-                # Platform bilgisi ekle
-                df_play['platform'] = 'Play Store'
-                df_play['source_package'] = package_name
-                
-                combined_data.append(df_play)
-                metadata['play_count'] = len(df_play)
-                
-                st.success(f"✅ Play Store: {len(df_play)}  yorum işlendi")
-            else:
-                st.warning(f"⚠️ Play Store: {package_name} için belirtilen tarih aralığında yorum bulunamadı")
-                
-        except Exception as e:
-            st.error(f"❌ Play Store hatası: {e}")
+    pipeline_config = build_pipeline_config(
+        package_name=package_name,
+        app_id=appstore_app_id,
+        start_date=start_date,
+        end_date=end_date,
+        enable_play_store=enable_play_store,
+        enable_app_store=enable_app_store,
+        enable_version_fix="🔧 Versiyon düzeltme" in processing_options,
+        enable_translation="🌍 Çeviri işlemi" in processing_options,
+        enable_analysis="📊 Analiz" in processing_options,
+        streaming_mode=streaming_mode,
+        use_scrape_cache=use_scrape_cache
+    )
     
-    # APP STORE SCRAPING
-    if enable_app_store:
-        update_progress("🍎 App Store yorumları çekiliyor...")
-        
-        try:
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-            
-            app_raw = scrape_app_store_reviews(
-                app_id=str(appstore_app_id), 
-                max_pages=20, 
-                country='tr',
-                start_date=start_datetime,
-                end_date=end_datetime,
-                max_reviews=5000
-            )
-            
-            df_app = pd.DataFrame(app_raw) if app_raw else pd.DataFrame()
-            
-            if not df_app.empty:
-                # App Store veri işleme
-                needed_columns = ['title', 'content', 'rating', 'version', 'date']
-                available_columns = [col for col in needed_columns if col in df_app.columns]
-                
-                if not available_columns:
-                    available_columns = list(df_app.columns)
-                
-                df_app = process_app_store_data(df_app, available_columns)
-                
-                # Platform bilgisi ekle
-                df_app['platform'] = 'App Store'
-                df_app['source_app_id'] = str(appstore_app_id)
-                
-                combined_data.append(df_app)
-                metadata['app_count'] = len(df_app)
-                
-                st.success(f"✅ App Store: {len(df_app)}  yorum işlendi")
-            else:
-                st.warning(f"⚠️ App Store: App ID {appstore_app_id} için belirtilen tarih aralığında yorum bulunamadı")
-                
-        except Exception as e:
-            st.error(f"❌ App Store hatası: {e}")
-    
-    # VERİYİ BİRLEŞTİR VE KAYDET
-    if combined_data:
-        # VERİLERİ BİRLEŞTİRMEDEN ÖNCE STANDARDİZE ET
-        standardized_data = []
-        
-        for df in combined_data:
-            if not df.empty:
-                # Gerekli sütunları kontrol et ve oluştur
-                required_columns = ['content', 'rating', 'date', 'platform']
-                
-                # Eksik sütunları ekle
-                for col in required_columns:
-                    if col not in df.columns:
-                        if col == 'content':
-                            # title veya text sütunu varsa kullan
-                            if 'title' in df.columns:
-                                df['content'] = df['title'].fillna('').astype(str)
-                            elif 'text' in df.columns:
-                                df['content'] = df['text'].fillna('').astype(str)
-                            else:
-                                df['content'] = 'No content'
-                        elif col == 'rating':
-                            if 'score' in df.columns:
-                                df['rating'] = df['score']
-                            else:
-                                df['rating'] = 0
-                        elif col == 'date':
-                            if 'updated' in df.columns:
-                                df['date'] = df['updated']
-                            elif 'at' in df.columns:
-                                df['date'] = df['at']
-                            else:
-                                df['date'] = datetime.now()
-                
-                # Rating'i numeric yap
-                if 'rating' in df.columns:
-                    df['rating'] = pd.to_numeric(df['rating'], errors='coerce').fillna(0)
-                
-                # Version sütunu kontrolü
-                if 'version' not in df.columns:
-                    if 'app_version' in df.columns:
-                        df['version'] = df['app_version'].astype(str)
-                    elif 'appVersion' in df.columns:
-                        df['version'] = df['appVersion'].astype(str)
-                    else:
-                        df['version'] = 'Unknown'
-                
-                # Author name kontrolü
-                if 'author_name' not in df.columns:
-                    if 'userName' in df.columns:
-                        df['author_name'] = df['userName']
-                    elif 'author' in df.columns:
-                        df['author_name'] = df['author']
-                    else:
-                        df['author_name'] = 'Unknown'
-                
-                standardized_data.append(df)
+    if not enable_play_store and not enable_app_store:
+        st.error("❌ En az bir platform seçmelisiniz!")
+    
+    elif run_in_background and submitted:
+        # ARKA PLAN İŞİ - Streamlit rerun'larından bağımsız
+        job_id = get_job_manager().submit(pipeline_config)
+        st.session_state.pending_job_ids.append(job_id)
+        st.success(f"🧵 İş kuyruğa alındı: `{job_id}` - durumunu aşağıdaki **Arka Plan İşleri** bölümünden takip edebilirsiniz")
+    
+    else:
+        st.markdown("---")
+        st.subheader("🔄 Scraping İşlemi" if submitted else "🗄️ Veritabanından Yükleme")
+        
+        # Progress tracking
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        
+        def update_progress(progress, message):
+            progress_bar.progress(progress)
+            status_text.info(f"🔄 {message}")
+        
+        def notify(level, message):
+            getattr(st, level)(message)
+        
+        if submitted:
+            try:
+                result = run_pipeline(pipeline_config, progress_callback=update_progress, notify=notify)
+            except StreamingPipelineError:
+                # Hata mesajı pipeline tarafından gösterildi - yarım veri oturuma kaydedilmez
+                status_text.error("❌ Akış hata nedeniyle durduruldu, veri kaydedilmedi")
+                st.stop()
+        else:
+            result = load_stored_pipeline_result(pipeline_config, notify=notify)
+        scraped_df = result['scraped_data']
+        metadata = result['metadata']
         
-        if standardized_data:
-            scraped_df = pd.concat(standardized_data, ignore_index=True)
-            
-            # Tarihleri standart formata çevir
-            if 'date' in scraped_df.columns:
-                scraped_df['date'] = pd.to_datetime(scraped_df['date'], errors='coerce')
-            
-            metadata['total_count'] = len(scraped_df)
-            
+        # VERİYİ KAYDET
+        if scraped_df is not None:
             # SESSION STATE'E KAYDET
             st.session_state.scraped_data = scraped_df
             st.session_state.scraping_metadata = metadata
+            st.session_state.portfolio_aggregates = None
+            
+            if result['analysis_data']:
+                st.session_state.analysis_data = result['analysis_data']
+                st.session_state.show_analysis = True
+            
+            progress_bar.progress(1.0)
+            status_text.success("✅ Scraping tamamlandı!" if submitted else "✅ Veritabanından yüklendi!")
             
-            # Platform bazında sayıları güncelle
+            # Platform bazında özet göster
+            platform_summary = ""
             if 'platform' in scraped_df.columns:
                 platform_counts = scraped_df['platform'].value_counts()
-                metadata['play_count'] = platform_counts.get('Play Store', 0)
-                metadata['app_count'] = platform_counts.get('App Store', 0)
+                for platform, count in platform_counts.items():
+                    platform_summary += f"{platform}: {count:,} yorum | "
             
-            # ANALİZ HAZIRLA - GELİŞTİRİLMİŞ
-            if enable_analysis:
-                update_progress("📊 Analiz hazırlanıyor...")
-                try:
-                    # Platform bazında veri ayır
-                    df_play_ready = scraped_df[scraped_df['platform'] == 'Play Store'].copy() if 'platform' in scraped_df.columns else pd.DataFrame()
-                    df_app_ready = scraped_df[scraped_df['platform'] == 'App Store'].copy() if 'platform' in scraped_df.columns else pd.DataFrame()
-                    
-                    # Her iki platformun da veri olup olmadığını kontrol et
-                    play_has_data = not df_play_ready.empty and len(df_play_ready) > 0
-                    app_has_data = not df_app_ready.empty and len(df_app_ready) > 0
-                    
-                    if play_has_data or app_has_data:
-                        # Boş dataframe'ler için minimum sütun yapısı oluştur
-                        required_cols = ['content', 'rating', 'date', 'version', 'platform']
-                        
-                        for df_name, df in [('Play Store', df_play_ready), ('App Store', df_app_ready)]:
-                            if df.empty:
-                                # Boş DataFrame oluştur ama doğru sütunlarla
-                                empty_df = pd.DataFrame(columns=required_cols)
-                                if df_name == 'Play Store':
-                                    df_play_ready = empty_df
-                                else:
-                                    df_app_ready = empty_df
-                    
-                        # Analiz verisini hazırla
-                        analysis_data = analyze_platform_data(df_play_ready, df_app_ready, max_versions=15)
-                        
-                        if analysis_data:
-                            st.session_state.analysis_data = analysis_data
-                            st.session_state.show_analysis = True
-                            
-                            # Analiz özeti göster
-                            total_analyzed = len(df_play_ready) + len(df_app_ready)
-                            st.success(f"✅ Analiz hazırlandı! ({total_analyzed:,} yorum analiz edildi)")
-                        else:
-                            st.warning("⚠ Analiz için uygun veri bulunamadı")
-                    else:
-                        st.warning("⚠ Analiz için hiç veri bulunamadı")
-                        
-                except Exception as e:
-                    st.error(f"❌ Analiz hatası: {e}")
-                    st.write("Debug: Scraped data columns:", scraped_df.columns.tolist() if not scraped_df.empty else "Empty DataFrame")
-        
-        progress_bar.progress(1.0)
-        status_text.success("✅ Scraping tamamlandı!")
-        
-        # Platform bazında özet göster
-        platform_summary = ""
-        if 'platform' in scraped_df.columns:
-            platform_counts = scraped_df['platform'].value_counts()
-            for platform, count in platform_counts.items():
-                platform_summary += f"{platform}: {count:,} yorum | "
-        
-        st.success(f"🎯 Toplam {metadata['total_count']:,} yorum başarıyla işlendi! ({platform_summary.rstrip(' | ')})")
-        
-        time.sleep(1)
-        st.rerun()
-    
-    else:
-        # Hiçbir platform seçilmemişse
-        if not enable_play_store and not enable_app_store:
-            st.error("❌ En az bir platform seçmelisiniz!")
+            st.success(f"🎯 Toplam {metadata['total_count']:,} yorum başarıyla işlendi! ({platform_summary.rstrip(' | ')})")
+            
+            time.sleep(1)
+            st.rerun()
+        
         else:
             # Platformlar seçilmiş ama veri çekilememiş
             st.warning("⚠ Belirtilen tarih aralığında hiç yorum bulunamadı. Tarih aralığını genişletmeyi deneyin.")
 
+# PORTFÖY ÇALIŞTIRMA
+if portfolio_submitted:
+    portfolio_apps, portfolio_errors = parse_portfolio(portfolio_text)
+    
+    if portfolio_errors:
+        for error in portfolio_errors:
+            st.error(f"❌ {error}")
+    elif not portfolio_apps:
+        st.error("❌ En az bir uygulama girin!")
+    elif portfolio_start >= portfolio_end:
+        st.error("⚠ Başlangıç tarihi bitiş tarihinden önce olmalıdır!")
+    else:
+        portfolio_config = {
+            'apps': portfolio_apps,
+            'start_date': portfolio_start,
+            'end_date': portfolio_end,
+            'max_workers': int(portfolio_workers),
+            'pipeline_options': {
+                'enable_version_fix': "🔧 Versiyon düzeltme" in portfolio_options,
+                'enable_translation': "🌍 Çeviri işlemi" in portfolio_options,
+            }
+        }
+        portfolio_label = f"🗂️ Portföy ({len(portfolio_apps)} uygulama)"
+        
+        if portfolio_background:
+            job_id = get_job_manager().submit(portfolio_config, label=portfolio_label, target=run_portfolio_config)
+            st.session_state.pending_job_ids.append(job_id)
+            st.success(f"🧵 Portföy işi kuyruğa alındı: `{job_id}`")
+        else:
+            st.markdown("---")
+            st.subheader(f"🗂️ {portfolio_label}")
+            
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            def update_portfolio_progress(progress, message):
+                progress_bar.progress(progress)
+                status_text.info(message)
+            
+            portfolio_result = run_portfolio_config(portfolio_config, progress_callback=update_portfolio_progress)
+            
+            # Worker thread'lerinden gelen mesajlar burada gösterilir
+            for level, message in portfolio_result['messages']:
+                if level in ('error', 'warning'):
+                    getattr(st, level)(message)
+            
+            if portfolio_result['scraped_data'] is not None:
+                st.session_state.scraped_data = portfolio_result['scraped_data']
+                st.session_state.scraping_metadata = portfolio_result['metadata']
+                st.session_state.analysis_data = None
+                st.session_state.show_analysis = False
+                st.session_state.portfolio_aggregates = portfolio_result['aggregates']
+                st.rerun()
+            else:
+                st.warning("⚠ Portföydeki uygulamalar için hiç yorum bulunamadı.")
+
+# PORTFÖY KARŞILAŞTIRMASI - ÖNCEDEN HESAPLANMIŞ ÖZETLERDEN
+if st.session_state.portfolio_aggregates is not None and st.session_state.scraped_data is not None:
+    st.markdown("---")
+    try:
+        render_portfolio_comparison(st.session_state.portfolio_aggregates)
+    except Exception as e:
+        st.error(f"❌ Portföy görselleştirme hatası: {e}")
+
+# ARKA PLAN İŞLERİ - HER RERUN'DA DURUM DOSYALARINDAN OKUNUR
+job_manager = get_job_manager()
+recent_jobs = job_manager.list_jobs(limit=20)
+
+if recent_jobs:
+    # Bu oturumun bekleyen işlerinden biten olursa sonucu otomatik al
+    for job in recent_jobs:
+        if job['id'] in st.session_state.pending_job_ids and job['status'] not in ACTIVE_STATUSES:
+            st.session_state.pending_job_ids.remove(job['id'])
+            job_result = job_manager.load_result(job['id']) if job['status'] == STATUS_DONE else None
+            
+            if job_result and job_result['scraped_data'] is not None:
+                st.session_state.scraped_data = job_result['scraped_data']
+                st.session_state.scraping_metadata = job_result['metadata']
+                st.session_state.analysis_data = job_result['analysis_data']
+                st.session_state.show_analysis = job_result['analysis_data'] is not None
+                st.session_state.portfolio_aggregates = job_result.get('aggregates')
+                st.toast(f"✅ Arka plan işi tamamlandı: {job['label']}")
+                st.rerun()
+    
+    st.markdown("---")
+    st.subheader("🧵 Arka Plan İşleri")
+    
+    jobs_table = pd.DataFrame([{
+        'İş': job['id'],
+        'Uygulama': job['label'],
+        'Durum': job['status'],
+        'İlerleme': f"{job.get('progress', 0) * 100:.0f}%",
+        'Mesaj': job.get('message', ''),
+        'Oluşturma': job.get('created_at', '')
+    } for job in recent_jobs])
+    st.dataframe(jobs_table, use_container_width=True, hide_index=True)
+    
+    active_jobs = [job for job in recent_jobs if job['status'] in ACTIVE_STATUSES]
+    done_jobs = [job for job in recent_jobs if job['status'] == STATUS_DONE]
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        if st.button("🔄 Durumu Yenile", use_container_width=True):
+            st.rerun()
+        
+        auto_refresh = st.checkbox("⏱️ Otomatik yenile (3 sn)", value=bool(active_jobs), key="job_auto_refresh")
+    
+    with col2:
+        if done_jobs:
+            selected_job_id = st.selectbox(
+                "Tamamlanan iş:",
+                [job['id'] for job in done_jobs],
+                format_func=lambda job_id: next(f"{j['label']} ({j['id']})" for j in done_jobs if j['id'] == job_id)
+            )
+    
+    with col3:
+        if done_jobs and st.button("📥 Sonucu Yükle", type="primary", use_container_width=True):
+            job_result = job_manager.load_result(selected_job_id)
+            
+            if job_result and job_result['scraped_data'] is not None:
+                st.session_state.scraped_data = job_result['scraped_data']
+                st.session_state.scraping_metadata = job_result['metadata']
+                st.session_state.analysis_data = job_result['analysis_data']
+                st.session_state.show_analysis = job_result['analysis_data'] is not None
+                st.session_state.portfolio_aggregates = job_result.get('aggregates')
+                st.rerun()
+            else:
+                st.warning("⚠ Bu işte yüklenecek veri yok")
+
 # ANALİZ GÖRSELLEŞTİRMELERİ - KARLI DURUM
 if st.session_state.show_analysis and st.session_state.analysis_data is not None:
     st.markdown("---")
     st.subheader("🎛️ Analiz Görselleştirmeleri")
     
     try:
+        # Grafik modülü sadece analiz gösterilirken yüklenir - açılış süresine eklenmez
+        from streamlit_z_analiz import (
+            create_platform_rating_pie_charts,
+            create_version_rating_analysis,
+            create_rating_trend_analysis,
+            create_heatmap_analysis,
+            create_platform_comparison_summary,
+        )
+        
         analysis_data = st.session_state.analysis_data
         
         # Görselleştirmeler - HERHANGİ BİR BUTON ETKİLEŞİMİNDE KAYBOLMAZ
@@ -540,77 +616,42 @@ if st.session_state.scraped_data is not None:
             st.session_state.download_columns = all_columns
             st.rerun()
     
-    # Filtrelenmiş veri hazırla - TARIH FORMATLAMA EKLENDİ
+    # İndirme dosyaları sadece istendiğinde üretilir - diğer rerun'larda iş yapılmaz
     if selected_columns:
-        filtered_df = scraped_df[selected_columns].copy()
-        
-        # Tarih formatını değiştir - Gün/Ay/Yıl
-        if 'date' in filtered_df.columns:
-            filtered_df['date'] = pd.to_datetime(filtered_df['date'], errors='coerce')
-            filtered_df['date'] = filtered_df['date'].dt.strftime('%d/%m/%Y')
-        
-        # Dosya hazırlığı
         timestamp = metadata.get('timestamp', datetime.now().strftime('%Y%m%d_%H%M%S'))
+        data_version = data_version_token(scraped_df, metadata)
         
-        # CSV
-        csv_data = filtered_df.to_csv(index=False, encoding='utf-8').encode('utf-8')
+        st.success(f"✅ {len(selected_columns)} sütun, {len(scraped_df)} yorum hazır")
         
-        # JSON - Tarih formatı için özel işlem
-        json_ready_df = filtered_df.copy()
-        json_data = json_ready_df.to_json(orient='records', force_ascii=False, indent=2).encode('utf-8')
+        export_columns = st.columns(len(EXPORT_FORMATS))
         
-        # TXT
-        txt_content = f"Scraping Verileri - {timestamp}\n"
-        txt_content += f"Tarih Aralığı: {metadata.get('date_range', 'Bilinmiyor')}\n"
-        txt_content += f"Toplam Yorum: {len(filtered_df)}\n"
-        txt_content += f"Seçilen Sütunlar: {', '.join(selected_columns)}\n"
-        txt_content += "=" * 50 + "\n\n"
-        
-        for idx, row in filtered_df.head(5000).iterrows():
-            txt_content += f"#{idx + 1}\n"
-            for col in selected_columns:
-                txt_content += f"{col}: {row.get(col, 'N/A')}\n"
-            txt_content += "-" * 30 + "\n"
-        
-        txt_data = txt_content.encode('utf-8')
-        
-        # İndirme butonları
-        st.success(f"✅ {len(selected_columns)} sütun, {len(filtered_df)} yorum hazır")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.download_button(
-                "📥 CSV İndir",
-                data=csv_data,
-                file_name=f"scraping_{timestamp}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        
-        with col2:
-            st.download_button(
-                "📥 JSON İndir",
-                data=json_data,
-                file_name=f"scraping_{timestamp}.json",
-                mime="application/json",
-                use_container_width=True
-            )
-        
-        with col3:
-            st.download_button(
-                "📥 TXT İndir",
-                data=txt_data,
-                file_name=f"scraping_{timestamp}.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+        for export_col, (fmt, fmt_info) in zip(export_columns, EXPORT_FORMATS.items()):
+            with export_col:
+                export_data = get_cached_export(data_version, selected_columns, fmt)
+                
+                if export_data is None and st.button(
+                    f"📦 {fmt_info['label']} Hazırla",
+                    key=f"prepare_{fmt}",
+                    use_container_width=True
+                ):
+                    with st.spinner(f"{fmt_info['label']} hazırlanıyor..."):
+                        export_data = get_or_build_export(scraped_df, selected_columns, fmt, data_version, metadata)
+                
+                if export_data is not None:
+                    st.download_button(
+                        f"📥 {fmt_info['label']} İndir",
+                        data=export_data,
+                        file_name=f"scraping_{timestamp}.{fmt_info['extension']}",
+                        mime=fmt_info['mime'],
+                        key=f"download_{fmt}",
+                        use_container_width=True
+                    )
         
         # Özet bilgiler
         st.info(f"""
         **📊 İndirme Özeti:**
         - 📋 Seçilen sütun: {len(selected_columns)}
-        - 📊 Toplam satır: {len(filtered_df):,}
+        - 📊 Toplam satır: {len(scraped_df):,}
         - 📱 Play Store: {metadata.get('play_count', 0):,}
         - 🍎 App Store: {metadata.get('app_count', 0):,}
         - 📅 Tarih: {metadata.get('date_range', 'Bilinmiyor')}
@@ -654,4 +695,8 @@ if st.session_state.scraped_data is None and not submitted:
         - **🥧 Rating Dağılım Grafikleri**
         - **📈 Versiyon Bazında Analiz**
         - **🔄 Platform Karşılaştırması**
-        """)
\ No newline at end of file
+        """)
+# ARKA PLAN İŞLERİ OTOMATİK YENİLEME - sayfanın tamamı çizildikten sonra
+if recent_jobs and active_jobs and st.session_state.get("job_auto_refresh"):
+    time.sleep(3)
+    st.rerun()
@@ -1,34 +1,36 @@
-import streamlit as st
+import numpy as np
 import pandas as pd
+from bisect import bisect_left, bisect_right
+from pandas.api.types import is_datetime64_any_dtype
 from collections import Counter
-from datetime import datetime
-from packaging import version
-import plotly.express as px
-import plotly.graph_objects as go
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 import io
 import os
 import json
 import re
 import logging
+import multiprocessing
+import threading
+import uuid
+
+from streamlit_compat import st
+from export_utils import export_to_bytes, render_binary_downloads, write_json_records, write_txt_records
+from review_io import DEFAULT_CHUNK_ROWS, UPLOAD_TYPES, is_data_file, iter_reviews_file, read_reviews_file
+from review_store import get_review_store, select_stored_reviews
+from version_fix_cache import get_version_fix_cache, version_fix_fingerprint
+from version_utils import compare_versions, is_version_higher, version_key, version_timeline
 
 # Logging ayarları
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def compare_versions(v1, v2):
-    """İki versiyonu karşılaştır - v1 <= v2 ise True"""
-    try:
-        return version.parse(str(v1)) <= version.parse(str(v2))
-    except:
-        # Version parsing başarısız olursa string karşılaştırması
-        return str(v1) <= str(v2)
-
-def is_version_higher(v1, v2):
-    """v1 > v2 ise True döndür"""
-    try:
-        return version.parse(str(v1)) > version.parse(str(v2))
-    except:
-        return str(v1) > str(v2)
+# Birleşik veride uygulamayı belirleyen sütunlar (ilk bulunan kullanılır)
+APP_PARTITION_COLUMNS = ['app', 'source_package', 'package_name']
+# Bu satır sayısının altında uygulamalar aynı süreçte sırayla düzeltilir - süreç başlatma maliyeti kazançtan büyük
+PARALLEL_MIN_ROWS = 200_000
+# Önbellek anahtarına girer - doldurma mantığı değişirse artırılmalı ki eski sonuçlar kullanılmasın
+VERSION_FIX_ALGORITHM = 'progression-v1'
 
 def format_date(date_str):
     """
@@ -42,18 +44,186 @@ def format_date(date_str):
     return date_match.group(1) if date_match else str(date_str)
 
 def scan_csv_files():
-    """Mevcut CSV dosyalarını tara"""
+    """Mevcut veri dosyalarını (CSV/Parquet/Arrow) tara"""
     csv_files = []
     
-    # Mevcut dizindeki CSV dosyları
+    # Mevcut dizindeki veri dosyaları
     for file in os.listdir('.'):
-        if file.endswith('.csv'):
+        if is_data_file(file):
             csv_files.append(file)
     
     return csv_files
 
-def process_version_fixing(df, show_progress=True):
-    """Versiyon düzenleme işlemini yap - YENİ MANTIK"""
+def is_missing_version(series):
+    """Boş versiyon maskesi (NaN, '' veya 'nan')"""
+    return series.isna() | (series == '') | (series == 'nan')
+
+def split_version_progression(sorted_versions):
+    """İlk görülme tarihine göre sıralı versiyonları geçerli progression ve kullanıcı hatası olarak ayır"""
+    valid_versions = []  # Mantıklı progression
+    user_error_versions = []  # Kullanıcı hataları (atlanacak ama etkisiz)
+    last_valid_key = None  # Son geçerli versiyonun sayısal anahtarı - her versiyon bir kez ayrıştırılır
+    
+    for i, (current_version, current_date) in enumerate(sorted_versions):
+        current_key = version_key(current_version)
+        if i == 0:
+            # İlk versiyon her zaman geçerli
+            valid_versions.append((current_version, current_date))
+            last_valid_key = current_key
+        else:
+            # Son geçerli versiyonla karşılaştır
+            if current_key > last_valid_key:
+                # Versiyon numarası büyükse geçerli
+                valid_versions.append((current_version, current_date))
+                last_valid_key = current_key
+            else:
+                # Versiyon numarası küçük/eşitse kullanıcı hatası
+                user_error_versions.append((current_version, current_date))
+    
+    return valid_versions, user_error_versions
+
+def build_version_ranges(valid_versions, data_end_date):
+    """Geçerli versiyonlar için tarih aralıklarını oluştur - son aralık veri sonuna kadar"""
+    version_ranges = []
+    
+    for i in range(len(valid_versions)):
+        current_version, current_date = valid_versions[i]
+        
+        if i == len(valid_versions) - 1:
+            # Son geçerli versiyon - veri sonuna kadar
+            end_date = data_end_date
+        else:
+            # Sonraki geçerli versiyonun tarihine kadar
+            next_version, next_date = valid_versions[i + 1]
+            end_date = next_date
+        
+        version_ranges.append({
+            'version': current_version,
+            'start_date': current_date,
+            'end_date': end_date
+        })
+    
+    return version_ranges
+
+def fill_version_smart(row, version_ranges):
+    """Sadece boş versiyonları doldur, kullanıcı hatalarına dokunma"""
+    
+    # Eğer versiyon dolu ise (kullanıcı hatası dahil), dokunma
+    if not (pd.isna(row['app_version']) or row['app_version'] == '' or row['app_version'] == 'nan'):
+        return row['app_version']
+    
+    # Boş versiyon - hangi aralığa düşüyor?
+    row_date = row['date']
+    
+    # row_date'i date formatına çevir
+    if isinstance(row_date, pd.Timestamp):
+        row_date = row_date.date()
+    elif isinstance(row_date, str):
+        try:
+            row_date = pd.to_datetime(row_date).date()
+        except:
+            row_date = datetime.now().date()
+    
+    # Geçerli versiyon aralıklarında ara
+    for version_info in version_ranges:
+        version_name = version_info['version']
+        start_date = version_info['start_date']
+        end_date = version_info['end_date']
+        
+        # Tarih tiplerini kontrol et
+        if isinstance(start_date, str):
+            try:
+                start_date = pd.to_datetime(start_date).date()
+            except:
+                continue
+        
+        if isinstance(end_date, str):
+            try:
+                end_date = pd.to_datetime(end_date).date()
+            except:
+                continue
+        
+        # Bu tarih aralığında mı?
+        if start_date <= row_date < end_date:
+            return version_name
+    
+    # Hiçbir aralığa uymuyorsa en yakın geçerli versiyonu ver
+    if version_ranges:
+        # En yakın versiyonu bul
+        closest_version = version_ranges[0]['version']  # Fallback
+        min_distance = float('inf')
+        
+        for version_info in version_ranges:
+            version_name = version_info['version']
+            start_date = version_info['start_date']
+            
+            if isinstance(start_date, str):
+                try:
+                    start_date = pd.to_datetime(start_date).date()
+                except:
+                    continue
+            
+            distance = abs((row_date - start_date).days)
+            if distance < min_distance:
+                min_distance = distance
+                closest_version = version_name
+        
+        return closest_version
+    else:
+        return 'Unknown'
+
+def _row_days(dates):
+    """Satır tarihlerini gün hassasiyetinde datetime64[D] dizisine çevir (fill_version_smart'taki .date() karşılığı)"""
+    if is_datetime64_any_dtype(dates):
+        if getattr(dates.dt, 'tz', None) is not None:
+            dates = dates.dt.tz_localize(None)
+        return dates.to_numpy().astype('datetime64[D]')
+    # Metin tarihler tek tek ayrıştırılır gibi okunur, okunamayanlar bugüne düşer
+    parsed = pd.to_datetime(dates, errors='coerce', format='mixed')
+    return parsed.fillna(pd.Timestamp.now().normalize()).to_numpy().astype('datetime64[D]')
+
+def fill_missing_versions(df, version_ranges):
+    """
+    Boş versiyonları geçerli aralıklara göre doldurulmuş app_version serisini döndür.
+    fill_version_smart ile aynı sonucu verir: aralıklar build_version_ranges çıktısı gibi başlangıca göre sıralı
+    ve bitişik olduğundan satırın aralığı başlangıç tarihleri üzerinde searchsorted ile bulunur.
+    """
+    versions = df['app_version'].astype(object)
+    missing = is_missing_version(df['app_version']).to_numpy()
+    if not missing.any():
+        return versions
+    if not version_ranges:
+        return versions.mask(missing, 'Unknown')
+    
+    names = np.array([version_info['version'] for version_info in version_ranges], dtype=object)
+    starts = np.array([pd.Timestamp(version_info['start_date']).to_datetime64() for version_info in version_ranges],
+                      dtype='datetime64[D]')
+    data_end = np.datetime64(pd.Timestamp(version_ranges[-1]['end_date']).date(), 'D')
+    last = len(starts) - 1
+    
+    row_days = _row_days(df['date'][missing])
+    
+    # start_i <= gün < start_i+1 (son aralıkta gün < veri sonu) - eşit başlangıçlı aralıkların boş olanı atlanır
+    index = np.searchsorted(starts, row_days, side='right') - 1
+    in_range = (index >= 0) & ((index < last) | (row_days < data_end))
+    
+    # Aralık dışı: en yakın başlangıç - veri sonundan sonrası en geç başlayan ilk aralık, öncesi ilk aralık
+    latest_first = np.searchsorted(starts, starts[last], side='left')
+    fallback = np.where(row_days >= data_end, latest_first, 0)
+    
+    # Tarihi olmayan satırlar bir aralığa yerleştirilemez - boş bırakılır
+    has_date = ~np.isnat(row_days)
+    fill_positions = np.flatnonzero(missing)[has_date]
+    
+    filled = versions.to_numpy(copy=True)
+    filled[fill_positions] = names[np.where(in_range, index, fallback)[has_date]]
+    return pd.Series(filled, index=df.index, name='app_version')
+
+def process_version_fixing(df, show_progress=True, use_cache=True):
+    """
+    Versiyon düzenleme işlemini yap - YENİ MANTIK
+    use_cache: aynı app_version/date (ve uygulama) verisinin sonucu oturumlar arası önbellekten döner
+    """
     
     if df is None or df.empty:
         return df, {"error": "Boş DataFrame"}
@@ -65,6 +235,30 @@ def process_version_fixing(df, show_progress=True):
     if 'date' not in df.columns:
         return df, {"error": "date sütunu bulunamadı"}
     
+    app_column = find_app_column(df)
+    
+    if use_cache:
+        cache = get_version_fix_cache()
+        cache_key = version_fix_fingerprint(df, ['app_version', 'date', app_column],
+                                            {'algorithm': VERSION_FIX_ALGORITHM})
+        cached = cache.get(cache_key, df)
+        if cached is not None:
+            df_fixed, results = cached
+            results['from_cache'] = True
+            if show_progress:
+                st.success(f"⚡ Sonuç önbellekten alındı! {results['updated_count']} versiyon güncellendi.")
+                st.info(f"📊 Kalan boş versiyon: {results['final_missing_count']}")
+            return df_fixed, results
+        
+        df_fixed, results = process_version_fixing(df, show_progress=show_progress, use_cache=False)
+        if 'error' not in results:
+            cache.put(cache_key, df, df_fixed, results)
+        return df_fixed, results
+    
+    # Birden fazla uygulamanın yorumları tek versiyon geçmişi sayılmaz - her uygulama ayrı düzeltilir
+    if app_column is not None and df[app_column].nunique(dropna=False) > 1:
+        return process_version_fixing_by_app(df, app_column, show_progress=show_progress)
+    
     if show_progress:
         progress_bar = st.progress(0)
         status_text = st.empty()
@@ -81,7 +275,7 @@ def process_version_fixing(df, show_progress=True):
     
     # app_version sütununu string'e çevir ve boş değerleri tespit et
     df['app_version'] = df['app_version'].astype(str)
-    missing_versions = (df['app_version'].isna()) | (df['app_version'] == '') | (df['app_version'] == 'nan')
+    missing_versions = is_missing_version(df['app_version'])
     
     results['total_records'] = len(df)
     results['missing_versions_count'] = missing_versions.sum()
@@ -108,14 +302,9 @@ def process_version_fixing(df, show_progress=True):
         status_text.text("📅 Versiyon tarihleri analiz ediliyor...")
         progress_bar.progress(30)
     
-    # Her versiyonun ilk görüldüğü tarihi bul
-    version_first_dates = {}
-    non_empty_data = df[df['app_version'].notna() & (df['app_version'] != '') & (df['app_version'] != 'nan')]
-    
-    for version_name in non_empty_data['app_version'].unique():
-        version_data = non_empty_data[non_empty_data['app_version'] == version_name]
-        first_date = version_data['date'].min().date()
-        version_first_dates[version_name] = first_date
+    # Her versiyonun ilk görüldüğü tarihi bul - tek groupby geçişi
+    first_seen = version_timeline(df[~missing_versions])['first_seen'].dropna()
+    version_first_dates = {version_name: first_date.date() for version_name, first_date in first_seen.items()}
     
     # Versiyonları ilk görülme tarihine göre sırala
     sorted_versions = sorted(version_first_dates.items(), key=lambda x: x[1])
@@ -126,23 +315,7 @@ def process_version_fixing(df, show_progress=True):
         progress_bar.progress(50)
     
     # YENİ MANTIK: Geçerli ve kullanıcı hatası versiyonları ayır
-    valid_versions = []  # Mantıklı progression
-    user_error_versions = []  # Kullanıcı hataları (atlanacak ama etkisiz)
-    
-    for i, (current_version, current_date) in enumerate(sorted_versions):
-        if i == 0:
-            # İlk versiyon her zaman geçerli
-            valid_versions.append((current_version, current_date))
-        else:
-            # Son geçerli versiyonla karşılaştır
-            last_valid_version = valid_versions[-1][0]
-            
-            if is_version_higher(current_version, last_valid_version):
-                # Versiyon numarası büyükse geçerli
-                valid_versions.append((current_version, current_date))
-            else:
-                # Versiyon numarası küçük/eşitse kullanıcı hatası
-                user_error_versions.append((current_version, current_date))
+    valid_versions, user_error_versions = split_version_progression(sorted_versions)
     
     results['valid_versions'] = valid_versions
     results['user_error_versions'] = user_error_versions
@@ -152,24 +325,7 @@ def process_version_fixing(df, show_progress=True):
         progress_bar.progress(70)
     
     # YENİ MANTIK: Sadece geçerli versiyonlar için aralık belirleme
-    version_ranges = []
-    
-    for i in range(len(valid_versions)):
-        current_version, current_date = valid_versions[i]
-        
-        if i == len(valid_versions) - 1:
-            # Son geçerli versiyon - veri sonuna kadar
-            end_date = df['date'].max().date()
-        else:
-            # Sonraki geçerli versiyonun tarihine kadar
-            next_version, next_date = valid_versions[i + 1]
-            end_date = next_date
-        
-        version_ranges.append({
-            'version': current_version,
-            'start_date': current_date,
-            'end_date': end_date
-        })
+    version_ranges = build_version_ranges(valid_versions, df['date'].max().date())
     
     results['version_ranges'] = version_ranges
     
@@ -177,87 +333,19 @@ def process_version_fixing(df, show_progress=True):
         status_text.text("🔄 Akıllı versiyon doldurma başlıyor...")
         progress_bar.progress(90)
     
-    # YENİ MANTIK: Akıllı versiyon doldurma
-    def fill_version_smart(row):
-        """Sadece boş versiyonları doldur, kullanıcı hatalarına dokunma"""
-        
-        # Eğer versiyon dolu ise (kullanıcı hatası dahil), dokunma
-        if not (pd.isna(row['app_version']) or row['app_version'] == '' or row['app_version'] == 'nan'):
-            return row['app_version']
-        
-        # Boş versiyon - hangi aralığa düşüyor?
-        row_date = row['date']
-        
-        # row_date'i date formatına çevir
-        if isinstance(row_date, pd.Timestamp):
-            row_date = row_date.date()
-        elif isinstance(row_date, str):
-            try:
-                row_date = pd.to_datetime(row_date).date()
-            except:
-                row_date = datetime.now().date()
-        
-        # Geçerli versiyon aralıklarında ara
-        for version_info in version_ranges:
-            version_name = version_info['version']
-            start_date = version_info['start_date']
-            end_date = version_info['end_date']
-            
-            # Tarih tiplerini kontrol et
-            if isinstance(start_date, str):
-                try:
-                    start_date = pd.to_datetime(start_date).date()
-                except:
-                    continue
-            
-            if isinstance(end_date, str):
-                try:
-                    end_date = pd.to_datetime(end_date).date()
-                except:
-                    continue
-            
-            # Bu tarih aralığında mı?
-            if start_date <= row_date < end_date:
-                return version_name
-        
-        # Hiçbir aralığa uymuyorsa en yakın geçerli versiyonu ver
-        if version_ranges:
-            # En yakın versiyonu bul
-            closest_version = version_ranges[0]['version']  # Fallback
-            min_distance = float('inf')
-            
-            for version_info in version_ranges:
-                version_name = version_info['version']
-                start_date = version_info['start_date']
-                
-                if isinstance(start_date, str):
-                    try:
-                        start_date = pd.to_datetime(start_date).date()
-                    except:
-                        continue
-                
-                distance = abs((row_date - start_date).days)
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_version = version_name
-            
-            return closest_version
-        else:
-            return 'Unknown'
-    
     # Versiyonları doldur
     if show_progress:
         st.info("🔄 Akıllı versiyon doldurma uygulanıyor...")
     
     try:
-        df['app_version'] = df.apply(fill_version_smart, axis=1)
+        df['app_version'] = fill_missing_versions(df, version_ranges)
     except Exception as e:
         if show_progress:
             st.error(f"❌ Versiyon doldurma hatası: {e}")
         return df, {"error": f"Versiyon doldurma hatası: {e}"}
     
     # Final sonuçları hesapla
-    final_missing_count = (df['app_version'].isna()) | (df['app_version'] == '') | (df['app_version'] == 'nan')
+    final_missing_count = is_missing_version(df['app_version'])
     results['final_missing_count'] = final_missing_count.sum()
     results['updated_count'] = results['missing_versions_count'] - results['final_missing_count']
     
@@ -268,6 +356,468 @@ def process_version_fixing(df, show_progress=True):
     
     return df, results
 
+def find_app_column(df):
+    """Birleşik veride uygulama sütunu (yoksa None)"""
+    return next((col for col in APP_PARTITION_COLUMNS if col in df.columns), None)
+
+_process_pool = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+def get_process_pool(workers):
+    """
+    Süreç genelinde paylaşılan süreç havuzu - süreç başlatma (spawn + pandas importu) sadece ilk çağrıda ödenir.
+    Daha fazla süreç istenirse havuz büyütülerek yeniden kurulur.
+    """
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None or workers > _process_pool_workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            # spawn: Streamlit sunucusunun thread'leri fork ile kopyalanmaz
+            _process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _process_pool_workers = workers
+        return _process_pool
+
+def shutdown_process_pool():
+    """Paylaşılan havuzu kapat - bozulan havuz bir sonraki çağrıda yeniden kurulur"""
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_workers = 0
+
+def _fix_app_partition(partition, compact=False):
+    """
+    Süreç havuzu işçisi - tek uygulamanın app_version/date verisini düzelt, doldurulmuş versiyon sütununu döndür.
+    compact: sütun category döner - süreçler arası kopyalama küçük kalır
+    """
+    fixed, results = process_version_fixing(partition, show_progress=False, use_cache=False)
+    versions = fixed['app_version']
+    return (versions.astype('category') if compact else versions), results
+
+def process_version_fixing_by_app(df, app_column, show_progress=True, max_workers=None):
+    """
+    Çok uygulamalı veride her uygulamanın versiyon progression'ı ve doldurması ayrı hesaplanır.
+    Büyük veride uygulamalar süreç havuzunda paralel işlenir; sonuçlar orijinal satır sırasıyla birleştirilir.
+    Dönen sonuçta toplamlar ve uygulama başına ayrıntılar ('apps') bulunur.
+    """
+    work = df.reset_index(drop=True)
+    work['app_version'] = work['app_version'].astype(str)
+    # Tarih bir kez çevrilir - boş versiyonu olmayan uygulamalar da aynı tipte birleşsin
+    try:
+        work['date'] = pd.to_datetime(work['date'])
+    except Exception as e:
+        return df, {"error": f"Tarih sütunu çevrilemedi: {e}"}
+    
+    workers = min(work[app_column].nunique(dropna=False), max_workers or os.cpu_count() or 1)
+    parallel = workers > 1 and len(work) >= PARALLEL_MIN_ROWS
+    
+    # İşçilere sadece düzeltmenin kullandığı sütunlar gider; paralelde versiyonlar category olarak (küçük pickle)
+    fix_columns = work[['app_version', 'date']]
+    if parallel:
+        fix_columns = fix_columns.assign(app_version=fix_columns['app_version'].astype('category'))
+    groups = fix_columns.groupby(work[app_column], sort=False, dropna=False, observed=True)
+    # Büyük uygulamalar önce - havuzda son kalan iş kısa olsun
+    grouped = sorted(groups, key=lambda item: len(item[1]), reverse=True)
+    apps = [app for app, _ in grouped]
+    partitions = [partition for _, partition in grouped]
+    
+    if show_progress:
+        status_text = st.empty()
+        status_text.text(f"📱 {len(partitions)} uygulama {'paralel (' + str(workers) + ' süreç)' if parallel else 'sırayla'} düzeltiliyor...")
+    
+    outputs = None
+    if parallel:
+        try:
+            outputs = list(get_process_pool(workers).map(_fix_app_partition, partitions, [True] * len(partitions)))
+        except Exception as e:
+            logger.warning(f"Süreç havuzu kullanılamadı, uygulamalar sırayla düzeltiliyor: {e}")
+            shutdown_process_pool()
+            parallel = False
+    if outputs is None:
+        outputs = [_fix_app_partition(partition) for partition in partitions]
+    
+    results = {
+        'total_records': 0, 'missing_versions_count': 0, 'final_missing_count': 0, 'updated_count': 0,
+        'valid_versions': [], 'user_error_versions': [], 'version_ranges': [],
+        'apps': {}, 'app_column': app_column, 'workers': workers if parallel else 1,
+    }
+    for app, (_, app_results) in zip(apps, outputs):
+        if 'error' in app_results:
+            return df, {"error": f"{app}: {app_results['error']}"}
+        results['apps'][app] = app_results
+        for key in ('total_records', 'missing_versions_count', 'final_missing_count', 'updated_count'):
+            results[key] += app_results[key]
+        # Uygulamalar arası listelerde versiyon adı uygulamayla etiketlenir
+        for key in ('valid_versions', 'user_error_versions'):
+            results[key].extend((f"{app} · {version_name}", first_date) for version_name, first_date in app_results[key])
+        results['version_ranges'].extend(dict(version_info, app=app) for version_info in app_results['version_ranges'])
+    
+    fixed_df = work
+    fixed_df['app_version'] = pd.concat([versions.astype(object) for versions, _ in outputs]).sort_index()
+    fixed_df.index = df.index
+    
+    if show_progress:
+        status_text.empty()
+        st.success(f"✅ İşlem tamamlandı! {len(partitions)} uygulamada {results['updated_count']} versiyon güncellendi.")
+        st.info(f"📊 Kalan boş versiyon: {results['final_missing_count']}")
+    
+    return fixed_df, results
+
+class StreamingVersionFixer:
+    """
+    Parça parça gelen veride versiyon düzeltme - versiyon geçmişi parçalar arasında korunur.
+    Geçerli versiyon progression'ı sadece yeni versiyon veya daha erken ilk görülme tarihi gelince güncellenir;
+    geçmiş state() ile kaydedilip from_state() ile yüklenerek sonraki çalıştırmalarda sadece yeni satırlar doldurulur.
+    """
+    
+    def __init__(self):
+        self.version_first_dates = {}
+        self.max_date = None
+        self.valid_versions = []
+        # Progression'a henüz işlenmemiş versiyonlar; None ise tüm progression yeniden hesaplanır
+        self._pending_versions = []
+        # hold_records ile bekletilen (kayıt, gün) çiftleri - flush_records ile doldurulur
+        self._held_records = []
+    
+    def _merge_first_date(self, version_name, first_date):
+        known_date = self.version_first_dates.get(version_name)
+        if known_date is None:
+            # Yeni versiyon en geç ilk görülme tarihinden önce değilse progression'ın sonuna eklenebilir
+            if self._pending_versions is not None and (
+                    not self.valid_versions or first_date >= max(self.version_first_dates.values())):
+                self._pending_versions.append(version_name)
+            else:
+                self._pending_versions = None
+            self.version_first_dates[version_name] = first_date
+        elif first_date < known_date:
+            # Bilinen versiyonun ilk tarihi geriye kaydı - sıralama değişebilir
+            self.version_first_dates[version_name] = first_date
+            self._pending_versions = None
+    
+    def seed(self, version_first_dates, max_date=None):
+        """Daha önce işlenmiş geçmişi (ör. depodaki versiyon özetleri) yükle - yeni parçalar bunun üzerine düzeltilir"""
+        for version_name, first_date in version_first_dates.items():
+            if pd.isna(first_date):
+                continue
+            self._merge_first_date(version_name, pd.Timestamp(first_date).date())
+        if max_date is not None and not pd.isna(max_date):
+            max_date = pd.Timestamp(max_date).date()
+            if self.max_date is None or max_date > self.max_date:
+                self.max_date = max_date
+    
+    def update(self, df):
+        """Parçadaki dolu versiyonlarla ilk görülme tarihlerini ve veri sonunu güncelle"""
+        dates = df['date'].dropna()
+        if dates.empty:
+            return
+        
+        batch_max = dates.max().date()
+        if self.max_date is None or batch_max > self.max_date:
+            self.max_date = batch_max
+        
+        first_seen = version_timeline(df[~is_missing_version(df['app_version'])])['first_seen'].dropna()
+        for version_name, first_date in first_seen.items():
+            self._merge_first_date(version_name, first_date.date())
+    
+    def _update_progression(self):
+        if self._pending_versions is None:
+            sorted_versions = sorted(self.version_first_dates.items(), key=lambda x: x[1])
+            self.valid_versions, _ = split_version_progression(sorted_versions)
+        elif self._pending_versions:
+            # Sadece yeni versiyonlar son geçerli versiyonla karşılaştırılır - tam hesapla aynı sonuç
+            new_versions = sorted(((version_name, self.version_first_dates[version_name])
+                                   for version_name in self._pending_versions), key=lambda x: x[1])
+            if self.valid_versions:
+                last_valid = self.valid_versions[-1]
+                extended, _ = split_version_progression([last_valid] + new_versions)
+                self.valid_versions = self.valid_versions + extended[1:]
+            else:
+                self.valid_versions, _ = split_version_progression(new_versions)
+        self._pending_versions = []
+    
+    def version_ranges(self):
+        """Şu ana kadar görülen geçmişten geçerli versiyon aralıklarını hesapla"""
+        if not self.version_first_dates:
+            return []
+        self._update_progression()
+        return build_version_ranges(self.valid_versions, self.max_date)
+    
+    def state(self):
+        """Kaydedilebilir (JSON) geçmiş: ham ilk görülme tarihleri, geçerli versiyonlar ve veri sonu"""
+        self._update_progression()
+        return {
+            'version_first_dates': {version_name: first_date.isoformat()
+                                    for version_name, first_date in self.version_first_dates.items()},
+            'valid_versions': [version_name for version_name, _ in self.valid_versions],
+            'data_end_date': self.max_date.isoformat() if self.max_date else None,
+        }
+    
+    @classmethod
+    def from_state(cls, state):
+        """state() çıktısından düzelticiyi kur - progression yeniden hesaplanmaz"""
+        fixer = cls()
+        fixer.version_first_dates = {version_name: pd.Timestamp(first_date).date()
+                                     for version_name, first_date in state.get('version_first_dates', {}).items()}
+        fixer.valid_versions = [(version_name, fixer.version_first_dates[version_name])
+                                for version_name in state.get('valid_versions', [])
+                                if version_name in fixer.version_first_dates]
+        if state.get('data_end_date'):
+            fixer.max_date = pd.Timestamp(state['data_end_date']).date()
+        return fixer
+    
+    def fix(self, df):
+        """Parçayı geçmişe ekle ve parçadaki boş versiyonları doldur"""
+        if df is None or df.empty or 'app_version' not in df.columns or 'date' not in df.columns:
+            return df
+        
+        df = df.copy()
+        df['app_version'] = df['app_version'].astype(str)
+        
+        try:
+            df['date'] = pd.to_datetime(df['date'])
+        except Exception as e:
+            logger.warning(f"Parça tarihleri çevrilemedi, versiyon düzeltme atlandı: {e}")
+            return df
+        
+        self.update(df)
+        
+        if is_missing_version(df['app_version']).any():
+            df['app_version'] = fill_missing_versions(df, self.version_ranges())
+        
+        return df
+
+    def fix_records(self, records):
+        """
+        Scraper kayıtlarını (sözlük listesi) DataFrame'e çevirmeden düzelt - tek parça çekimde process_version_fixing
+        ile aynı sonuç. Parça parça çağrılırsa boşlar o ana kadarki geçmişten doldurulur (fix() gibi); sonradan gelen
+        daha eski sayfalar progression'ı değiştirebileceğinden sayfalı çekimde hold_records / flush_records kullanılır.
+        Girdi kayıtları değiştirilmez (önbellekteki kayıtlar paylaşılıyor olabilir); doldurulanlar kopyalanır.
+        """
+        if not records:
+            return records
+        
+        days, missing = self._merge_records(records)
+        if not any(missing):
+            return records
+        
+        missing_days = [day for day, is_missing in zip(days, missing) if is_missing]
+        inferred = iter(infer_versions_for_days(self.version_ranges(), missing_days))
+        fixed = []
+        for record, is_missing in zip(records, missing):
+            if is_missing:
+                version_name = next(inferred)
+                if version_name is not None:
+                    record = dict(record, app_version=version_name)
+            fixed.append(record)
+        return fixed
+    
+    def _merge_records(self, records):
+        """Kayıtların dolu versiyonlarını geçmişe ekle - (günler, boş mu) listeleri"""
+        days = [_record_day(record.get('date')) for record in records]
+        missing = [_is_missing_record_version(record.get('app_version')) for record in records]
+        
+        for record, day, is_missing in zip(records, days, missing):
+            if day is None:
+                continue
+            if self.max_date is None or day > self.max_date:
+                self.max_date = day
+            if not is_missing:
+                self._merge_first_date(str(record['app_version']), day)
+        return days, missing
+    
+    def hold_records(self, records):
+        """
+        Sayfa sayfa (en yeniden eskiye) çekimde kullanılır: dolu versiyonlar geçmişe eklenir ve hazır kayıtlar
+        döndürülür, tarihli boş versiyonlu kayıtlar bekletilir. Daha eski bir sayfadaki versiyon (ör. erken görülen
+        bir '-beta') progression'daki sonraki tüm versiyonları kullanıcı hatasına çevirebildiğinden boşlar ancak
+        çekim bitince flush_records() ile doldurulur - sonuç tek parça process_version_fixing ile aynıdır.
+        """
+        if not records:
+            return records
+        
+        days, missing = self._merge_records(records)
+        ready = []
+        for record, day, is_missing in zip(records, days, missing):
+            if is_missing and day is not None:
+                self._held_records.append((record, day))
+            else:
+                # Tarihi olmayan boş kayıt hiçbir aralığa yerleştirilemez - beklemeden boş geçer
+                ready.append(record)
+        return ready
+    
+    def flush_records(self):
+        """Bekletilen boş versiyonlu kayıtları tüm geçmişin aralıklarıyla doldurup döndür"""
+        held, self._held_records = self._held_records, []
+        if not held:
+            return []
+        inferred = infer_versions_for_days(self.version_ranges(), [day for _, day in held])
+        return [dict(record, app_version=version_name) for (record, _), version_name in zip(held, inferred)]
+
+def _is_missing_record_version(value):
+    return value is None or (isinstance(value, float) and np.isnan(value)) or str(value) in ('', 'nan')
+
+def _record_day(value):
+    """Kayıt tarihini gün olarak oku (datetime veya '2025-08-06 11:35:41' metni) - okunamazsa None"""
+    if isinstance(value, datetime):
+        return None if pd.isna(value) else value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        # process_play_review biçimi: gün kısmı ilk 10 karakter
+        return date.fromisoformat(value[:10] if isinstance(value, str) else str(value))
+    except ValueError:
+        try:
+            return datetime.fromisoformat(str(value)).date()
+        except ValueError:
+            return None
+
+def infer_versions_for_days(version_ranges, days):
+    """
+    Boş versiyonlu kayıtların versiyonları - fill_missing_versions'daki aralık / en yakın başlangıç kuralının
+    kayıt bazlı karşılığı. Aralık yoksa 'Unknown', tarihi olmayan (None) kayıt için None (boş kalır).
+    """
+    if not version_ranges:
+        return ['Unknown'] * len(days)
+    
+    names = [version_info['version'] for version_info in version_ranges]
+    starts = [version_info['start_date'] for version_info in version_ranges]
+    data_end = version_ranges[-1]['end_date']
+    last = len(starts) - 1
+    # Aralık dışı: veri sonundan sonrası en geç başlayan ilk aralık, öncesi ilk aralık
+    latest_first = bisect_left(starts, starts[last])
+    
+    inferred = []
+    for day in days:
+        if day is None:
+            inferred.append(None)
+            continue
+        index = bisect_right(starts, day) - 1
+        if index >= 0 and (index < last or day < data_end):
+            inferred.append(names[index])
+        else:
+            inferred.append(names[latest_first if day >= data_end else 0])
+    return inferred
+
+# CSV parçalarında versiyon metin olarak okunur - parça başına tip tahmini '1.10' → 1.1 yapmasın
+CHUNKED_CSV_DTYPE = {'app_version': str}
+# Büyük dosya modu çıktıları - her çalıştırma benzersiz dosyaya yazılır, oturumlar birbirinin çıktısını ezmez
+CHUNKED_OUTPUT_DIR = os.environ.get("VERSION_FIX_OUTPUT_DIR", os.path.join("data", "version_fix_runs"))
+
+def _chunk_app_keys(chunk, app_column):
+    """Parçadaki satırların uygulama anahtarı - iki geçişte aynı (boş uygulama 'nan')"""
+    if app_column is None:
+        return pd.Series('', index=chunk.index)
+    return chunk[app_column].astype(str)
+
+def process_version_fixing_chunked(source, output_path, chunk_size=DEFAULT_CHUNK_ROWS, progress_callback=None):
+    """
+    Bellekten büyük dosyalar için iki geçişli versiyon düzeltme - process_version_fixing ile aynı sonuç.
+
+    1. geçiş sadece app_version/date (ve varsa uygulama) sütunlarını okuyarak versiyon aralıklarını çıkarır,
+    2. geçiş dosyayı yeniden okuyup boş versiyonları doldurur ve CSV çıktısını parça parça yazar.
+    Çok uygulamalı dosyalarda her uygulamanın geçmişi ayrı tutulur.
+    Bellekte aynı anda en fazla bir parça tutulur. progress_callback(oran, mesaj) ile ilerleme bildirilir.
+    """
+    def report(progress, message):
+        if progress_callback:
+            try:
+                progress_callback(progress, message)
+            except Exception as e:
+                logger.warning(f"İlerleme bildirimi hatası: {e}")
+    
+    fixers = {}
+    missing_by_app = Counter()
+    app_column = None
+    results = {'total_records': 0, 'missing_versions_count': 0, 'chunks': 0}
+    
+    # 1. GEÇİŞ: versiyon zaman çizelgesi
+    try:
+        for chunk in iter_reviews_file(source, columns=['app_version', 'date'] + APP_PARTITION_COLUMNS,
+                                       chunk_size=chunk_size, dtype=CHUNKED_CSV_DTYPE):
+            for column in ('app_version', 'date'):
+                if column not in chunk.columns:
+                    return {"error": f"{column} sütunu bulunamadı"}
+            if results['chunks'] == 0:
+                app_column = find_app_column(chunk)
+            
+            chunk['app_version'] = chunk['app_version'].astype(str)
+            try:
+                chunk['date'] = pd.to_datetime(chunk['date'])
+            except Exception as e:
+                return {"error": f"Tarih sütunu çevrilemedi: {e}"}
+            
+            results['total_records'] += len(chunk)
+            results['missing_versions_count'] += int(is_missing_version(chunk['app_version']).sum())
+            results['chunks'] += 1
+            for app, app_chunk in chunk.groupby(_chunk_app_keys(chunk, app_column), sort=False):
+                fixers.setdefault(app, StreamingVersionFixer()).update(app_chunk)
+                missing_by_app[app] += int(is_missing_version(app_chunk['app_version']).sum())
+            report(0.0, f"📅 1. geçiş: {results['total_records']:,} satır tarandı")
+    except Exception as e:
+        return {"error": f"Dosya okunamadı: {e}"}
+    
+    if results['total_records'] == 0:
+        return {"error": "Boş dosya"}
+    
+    ranges_by_app = {}
+    results.update({'valid_versions': [], 'user_error_versions': [], 'version_ranges': [], 'original_versions': []})
+    if results['missing_versions_count'] > 0:
+        for app, fixer in fixers.items():
+            # Boş versiyonu olmayan uygulamanın aralığı gerekmez (process_version_fixing ile aynı)
+            if missing_by_app[app] == 0:
+                continue
+            sorted_versions = sorted(fixer.version_first_dates.items(), key=lambda x: x[1])
+            valid_versions, user_error_versions = split_version_progression(sorted_versions)
+            ranges_by_app[app] = build_version_ranges(valid_versions, fixer.max_date)
+            
+            if len(fixers) == 1:
+                results['original_versions'] = sorted_versions
+                results['valid_versions'] = valid_versions
+                results['user_error_versions'] = user_error_versions
+                results['version_ranges'] = ranges_by_app[app]
+            else:
+                # process_version_fixing_by_app ile aynı etiketleme
+                for key, versions in (('valid_versions', valid_versions), ('user_error_versions', user_error_versions)):
+                    results[key].extend((f"{app} · {version_name}", first_date) for version_name, first_date in versions)
+                results['version_ranges'].extend(dict(version_info, app=app) for version_info in ranges_by_app[app])
+    if len(fixers) > 1:
+        results['app_column'] = app_column
+    report(0.5, f"🔍 {len(results['valid_versions'])} geçerli versiyon, {len(results['version_ranges'])} aralık")
+    
+    # 2. GEÇİŞ: doldur ve yaz - yarım kalan çıktı hedef dosyanın üzerine yazılmaz
+    temp_path = f"{output_path}.part"
+    final_missing_count = 0
+    written = 0
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='') as out:
+            for chunk in iter_reviews_file(source, chunk_size=chunk_size, dtype=CHUNKED_CSV_DTYPE):
+                chunk['app_version'] = chunk['app_version'].astype(str)
+                if results['missing_versions_count'] > 0:
+                    chunk['date'] = pd.to_datetime(chunk['date'])
+                    filled = chunk['app_version'].astype(object)
+                    for app, app_chunk in chunk.groupby(_chunk_app_keys(chunk, app_column), sort=False):
+                        filled[app_chunk.index] = fill_missing_versions(app_chunk, ranges_by_app.get(app, []))
+                    chunk['app_version'] = filled
+                
+                final_missing_count += int(is_missing_version(chunk['app_version']).sum())
+                chunk.to_csv(out, index=False, header=written == 0)
+                written += len(chunk)
+                report(0.5 + 0.5 * written / results['total_records'],
+                       f"🔄 2. geçiş: {written:,}/{results['total_records']:,} satır yazıldı")
+        os.replace(temp_path, output_path)
+    except Exception as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return {"error": f"Versiyon doldurma hatası: {e}"}
+    
+    results['final_missing_count'] = final_missing_count
+    results['updated_count'] = results['missing_versions_count'] - final_missing_count
+    results['output_path'] = output_path
+    return results
+
 def process_data(df, selected_columns):
     """
     DataFrame'i işle ve istenen sütunları seç
@@ -294,17 +844,129 @@ def process_data(df, selected_columns):
 
 def create_txt_content(df):
     """
-    DataFrame'den TXT içeriği oluştur
+    DataFrame'den TXT içeriği oluştur - parça parça, vektörel
     """
-    txt_content = ""
-    for _, row in df.iterrows():
-        txt_content += f"Yorum: {row.get('translated_text', row.get('content', 'N/A'))}\n"
-        txt_content += f"Puan: {row.get('rating', 'N/A')}\n"
-        txt_content += f"Versiyon: {row.get('app_version', 'N/A')}\n"
-        txt_content += f"Yararlı: {row.get('helpful_count', 'N/A')}\n"
-        txt_content += f"Tarih: {row.get('date', 'N/A')}\n"
-        txt_content += "---\n"
-    return txt_content
+    txt_fields = [
+        ("Yorum", ['translated_text', 'content']),
+        ("Puan", ['rating']),
+        ("Versiyon", ['app_version']),
+        ("Yararlı", ['helpful_count']),
+        ("Tarih", ['date']),
+    ]
+    return export_to_bytes(write_txt_records, df, fields=txt_fields).decode('utf-8')
+
+def prepare_output_columns(df_fixed):
+    """Versiyonu düzeltilmiş veride temel sütunları garanti et, seç ve tarihi formatla"""
+    
+    # Temel sütunları garanti et
+    if 'rating' not in df_fixed.columns:
+        df_fixed['rating'] = 0
+    
+    if 'app_version' not in df_fixed.columns and 'version' in df_fixed.columns:
+        df_fixed['app_version'] = df_fixed['version']
+    elif 'app_version' not in df_fixed.columns:
+        df_fixed['app_version'] = 'Unknown'
+    
+    if 'date' not in df_fixed.columns:
+        df_fixed['date'] = ''
+    
+    # Content sütununu garanti et
+    if 'content' not in df_fixed.columns:
+        if 'translated_text' in df_fixed.columns:
+            df_fixed['content'] = df_fixed['translated_text']
+        else:
+            df_fixed['content'] = ''
+    
+    # Gerekli sütunları seç
+    essential_columns = []
+    possible_columns = ['review_id', 'content', 'translated_text', 'rating', 'app_version', 'helpful_count', 'date', 'author_name', 'version', 'platform']
+    
+    for col in possible_columns:
+        if col in df_fixed.columns:
+            essential_columns.append(col)
+    
+    if essential_columns:
+        df_result = df_fixed[essential_columns].copy()
+    else:
+        df_result = df_fixed.copy()
+    
+    # Tarih formatlaması
+    if 'date' in df_result.columns:
+        df_result['date'] = df_result['date'].apply(format_date)
+    
+    return df_result
+
+def chunked_output_path(source_name):
+    """Çalıştırmaya özel çıktı yolu (CHUNKED_OUTPUT_DIR altında) ve kullanıcıya verilecek dosya adı"""
+    file_name = f"{os.path.splitext(os.path.basename(source_name))[0]}_version_fixed.csv"
+    os.makedirs(CHUNKED_OUTPUT_DIR, exist_ok=True)
+    run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:12]}"
+    return os.path.join(CHUNKED_OUTPUT_DIR, f"{run_id}_{file_name}"), file_name
+
+def _render_file_download(path, file_name, key):
+    """Diskteki çıktıyı indirme butonu olarak sun - destekleyen Streamlit'te dosya sadece tıklanınca okunur"""
+    def read_output():
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    options = dict(label=f"📥 {file_name} İndir", file_name=file_name, mime="text/csv", key=key,
+                   use_container_width=True)
+    try:
+        st.download_button(data=read_output, **options)
+    except Exception:
+        # Eski Streamlit sürümleri callable kabul etmez - dosya nesnesinden okunur
+        with open(path, 'rb') as f:
+            st.download_button(data=f, **options)
+
+def render_chunked_fixing(source, chunk_size=DEFAULT_CHUNK_ROWS):
+    """Büyük dosya modu: dosya belleğe alınmadan iki geçişte düzeltilir, sonuç diske CSV olarak yazılır"""
+    source_name = str(getattr(source, 'name', source))
+    
+    st.subheader("🧩 Büyük Dosya Modu")
+    st.info(f"📄 **{source_name}** {chunk_size:,} satırlık parçalarla işlenecek, sonuç indirilebilir CSV olarak hazırlanacak")
+    
+    if st.button("🚀 Parça Parça Versiyon Düzenlemeyi Başlat", type="primary", use_container_width=True):
+        output_path, file_name = chunked_output_path(source_name)
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        
+        def on_progress(progress, message):
+            progress_bar.progress(min(progress, 1.0))
+            status_text.text(message)
+        
+        results = process_version_fixing_chunked(source, output_path, chunk_size=chunk_size, progress_callback=on_progress)
+        if 'error' in results:
+            st.error(f"❌ İşlem hatası: {results['error']}")
+            return
+        
+        progress_bar.progress(100)
+        # Sonuç rerun'larda da indirilebilsin diye oturumda tutulur
+        st.session_state.chunked_fix_result = {
+            'source_name': source_name,
+            'output_path': output_path,
+            'file_name': file_name,
+            'results': results
+        }
+    
+    run = st.session_state.get('chunked_fix_result')
+    if not run or run['source_name'] != source_name or not os.path.exists(run['output_path']):
+        return
+    results = run['results']
+    
+    st.success(f"✅ İşlem tamamlandı! {results['updated_count']:,} versiyon güncellendi.")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Toplam Kayıt", f"{results['total_records']:,}")
+    with col2:
+        st.metric("Güncellenen Kayıt", f"{results['updated_count']:,}")
+    with col3:
+        st.metric("Kalan Boş Versiyon", f"{results['final_missing_count']:,}")
+    with col4:
+        st.metric("Geçerli Versiyon", len(results['valid_versions']))
+    
+    st.caption(f"💾 {os.path.getsize(run['output_path']) / 1024 / 1024:.1f} MB, {results['chunks']} parça")
+    _render_file_download(run['output_path'], run['file_name'], key="chunked_fix_download")
 
 def process_and_save_data(df):
     """Ana koordinasyon uygulaması için versiyon düzeltme + sütun seçimi - İYİLEŞTİRİLMİŞ"""
@@ -321,67 +983,30 @@ def process_and_save_data(df):
                 
                 if 'error' in results:
                     try:
-                        import streamlit as st
                         st.warning(f"⚠️ Versiyon düzeltme atlandı: {results['error']}")
                     except:
                         pass
                     df_fixed = df.copy()
             except Exception as e:
                 try:
-                    import streamlit as st
                     st.warning(f"⚠️ Versiyon düzeltme hatası: {e}")
                 except:
                     pass
                 df_fixed = df.copy()
         
         # 2. Sütun standardizasyonu - daha esnek
-        # Temel sütunları garanti et
-        if 'rating' not in df_fixed.columns:
-            df_fixed['rating'] = 0
-        
-        if 'app_version' not in df_fixed.columns and 'version' in df_fixed.columns:
-            df_fixed['app_version'] = df_fixed['version']
-        elif 'app_version' not in df_fixed.columns:
-            df_fixed['app_version'] = 'Unknown'
-        
-        if 'date' not in df_fixed.columns:
-            df_fixed['date'] = ''
-        
-        # Content sütununu garanti et
-        if 'content' not in df_fixed.columns:
-            if 'translated_text' in df_fixed.columns:
-                df_fixed['content'] = df_fixed['translated_text']
-            else:
-                df_fixed['content'] = ''
-        
-        # Gerekli sütunları seç
-        essential_columns = []
-        possible_columns = ['content', 'translated_text', 'rating', 'app_version', 'helpful_count', 'date', 'author_name', 'version', 'platform']
-        
-        for col in possible_columns:
-            if col in df_fixed.columns:
-                essential_columns.append(col)
-        
-        if essential_columns:
-            df_result = df_fixed[essential_columns].copy()
-        else:
-            df_result = df_fixed.copy()
-        
-        # Tarih formatlaması
-        if 'date' in df_result.columns:
-            df_result['date'] = df_result['date'].apply(format_date)
-        
-        return df_result
+        return prepare_output_columns(df_fixed)
         
     except Exception as e:
         try:
-            import streamlit as st
             st.error(f"❌ İşlem hatası: {e}")
         except:
             pass
         return df
 
 if __name__ == "__main__":
+    import plotly.express as px
+    
     # Sayfa konfigürasyonu
     st.set_page_config(
         page_title="Play Store Versiyon & Sütun İşleyici",
@@ -403,12 +1028,13 @@ if __name__ == "__main__":
         # Dosya seçim yöntemi
         file_source = st.radio(
             "Dosya kaynağını seçin:",
-            ["📂 Mevcut CSV dosyalarından seç", "📤 Dosya yükle"],
-            help="Mevcut dosyalardan seçin veya yeni dosya yükleyin"
+            ["📂 Mevcut CSV dosyalarından seç", "📤 Dosya yükle", "🗄️ Veritabanından seç"],
+            help="Mevcut dosyalardan seçin, yeni dosya yükleyin veya kayıtlı yorumları kullanın"
         )
         
         uploaded_file = None
         selected_file_path = None
+        stored_df = None
         
         if file_source == "📂 Mevcut CSV dosyalarından seç":
             csv_files = scan_csv_files()
@@ -445,11 +1071,14 @@ if __name__ == "__main__":
             else:
                 st.warning("❌ CSV dosyası bulunamadı!")
         
+        elif file_source == "🗄️ Veritabanından seç":
+            stored_df = select_stored_reviews(platform='Play Store', key="version_fixer")
+        
         else:
             uploaded_file = st.file_uploader(
-                "CSV dosyasını yükleyin:",
-                type=['csv'],
-                help="Play Store verisi içeren CSV dosyası"
+                "CSV / Parquet / Arrow dosyasını yükleyin:",
+                type=UPLOAD_TYPES,
+                help="Play Store verisi içeren CSV, Parquet veya Arrow dosyası"
             )
         
         st.markdown("---")
@@ -460,26 +1089,43 @@ if __name__ == "__main__":
         show_details = st.checkbox("🔍 Detaylı analiz göster", value=True)
         show_charts = st.checkbox("📈 Grafikleri göster", value=True)
         auto_download = st.checkbox("📥 Otomatik dosya indirme", value=False)
+        chunked_mode = st.checkbox(
+            "🧩 Büyük dosya modu (parça parça)", value=False,
+            help="Dosya belleğe tamamen yüklenmez: iki geçişte parça parça okunur, sonuç CSV olarak diske yazılır"
+        )
+        chunk_rows = DEFAULT_CHUNK_ROWS
+        if chunked_mode:
+            chunk_rows = int(st.number_input("Parça boyutu (satır)", min_value=10_000, max_value=1_000_000,
+                                             value=DEFAULT_CHUNK_ROWS, step=10_000))
 
     # Dosya yükleme/seçme işlemi
     df = None
+    chunked_source = None
 
-    if uploaded_file is not None:
+    if chunked_mode and (uploaded_file is not None or selected_file_path):
+        # Büyük dosya modunda dosya burada okunmaz
+        chunked_source = uploaded_file if uploaded_file is not None else selected_file_path
+    elif uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
+            df = read_reviews_file(uploaded_file)
             st.success(f"✅ Dosya yüklendi: {len(df)} satır, {len(df.columns)} sütun")
         except Exception as e:
             st.error(f"❌ Dosya yükleme hatası: {e}")
     elif selected_file_path:
         try:
-            df = pd.read_csv(selected_file_path)
+            df = read_reviews_file(selected_file_path)
             st.success(f"✅ Dosya seçildi: {selected_file_path} - {len(df)} satır, {len(df.columns)} sütun")
         except Exception as e:
             st.error(f"❌ Dosya okuma hatası: {e}")
+    elif stored_df is not None and not stored_df.empty:
+        # Depoda Play Store versiyonu 'version' sütunundadır
+        df = stored_df.rename(columns={'version': 'app_version'})
 
     # TAB 1: VERSİYON DÜZENLEYİCİ
     with tab1:
-        if df is not None:
+        if chunked_source is not None:
+            render_chunked_fixing(chunked_source, chunk_rows)
+        elif df is not None:
             # Gerekli sütunların varlığını kontrol et
             required_columns = ['app_version', 'date']
             missing_columns = [col for col in required_columns if col not in df.columns]
@@ -568,6 +1214,14 @@ if __name__ == "__main__":
                             # Session state'e kaydet
                             st.session_state.version_fixed_df = df_fixed
                             
+                            # Veritabanından geldiyse düzeltilmiş versiyonları geri yaz
+                            if file_source == "🗄️ Veritabanından seç":
+                                try:
+                                    stored_count = get_review_store().upsert_reviews(df_fixed)
+                                    st.info(f"🗄️ {stored_count:,} yorumun versiyonu veritabanında güncellendi")
+                                except Exception as e:
+                                    st.warning(f"⚠️ Veritabanı güncellenemedi: {e}")
+                            
                             # Sonuç metrikleri
                             col1, col2, col3, col4 = st.columns(4)
                             
@@ -599,6 +1253,16 @@ if __name__ == "__main__":
                             # Detaylı analiz (kısaltılmış)
                             if show_details:
                                 with st.expander("📈 Detaylı Versiyon Analizi"):
+                                    if results.get('apps'):
+                                        st.write(f"**📱 Uygulama Bazında ({results['app_column']}):**")
+                                        st.dataframe(pd.DataFrame([{
+                                            'Uygulama': app,
+                                            'Kayıt': app_results['total_records'],
+                                            'Güncellenen': app_results['updated_count'],
+                                            'Geçerli Versiyon': len(app_results['valid_versions']),
+                                            'Kullanıcı Hatası': len(app_results['user_error_versions']),
+                                        } for app, app_results in results['apps'].items()]), use_container_width=True)
+                                    
                                     col1, col2 = st.columns(2)
                                     
                                     with col1:
@@ -647,6 +1311,8 @@ if __name__ == "__main__":
                                 if st.button("➡️ Sütun Seçimine Geç", use_container_width=True):
                                     st.session_state.active_tab = 1  # 2. tab'ı aktif yap
                                     st.rerun()
+                            
+                            render_binary_downloads(df_fixed, f"version_fixed_{timestamp}", key="fixer_quick")
                     
                     except Exception as e:
                         st.error(f"❌ Versiyon düzenleme işlemi başarısız: {e}")
@@ -824,7 +1490,7 @@ if __name__ == "__main__":
                         
                         # JSON İndir
                         with col2:
-                            json_data = processed_df.to_json(orient='records', force_ascii=False, indent=2)
+                            json_data = export_to_bytes(write_json_records, processed_df)
                             
                             st.download_button(
                                 label="📋 JSON İndir",
@@ -846,6 +1512,9 @@ if __name__ == "__main__":
                                 use_container_width=True
                             )
                         
+                        # Parquet / Arrow İndir
+                        render_binary_downloads(processed_df, f"play_edited_{timestamp}", key="fixer_edited")
+                        
                         # Özet bilgiler
                         st.markdown("---")
                         st.subheader("📋 İşlem Özeti")
@@ -1,17 +1,16 @@
-import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from collections import Counter
-from packaging import version
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import io
 import os
 
+from streamlit_compat import st
+from review_store import get_review_store
+from review_schema import ANALYSIS_COLUMNS, compact_reviews, schema_source_columns, standardize_reviews
+from review_io import UPLOAD_TYPES, is_data_file, read_reviews_file
+from version_utils import sort_versions, version_timeline
+
 # Sayfa konfigürasyonu
 # st.set_page_config(
 #     page_title="Platform Bazında Versiyon Analizi",
@@ -19,49 +18,30 @@ import os
 #     layout="wide"
 # )
 
-# Font ayarları
-plt.rcParams['font.family'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
-
 def natural_version_sort(version_list):
     """Versiyonları doğal sıralama ile sıralar (1.0.0 < 1.0.1 < 1.1.0 < 2.0.0)"""
-    try:
-        sorted_versions = sorted(version_list, key=lambda v: version.parse(str(v)))
-        return sorted_versions
-    except:
-        return sorted(version_list)
+    return sort_versions(version_list)
 
 def get_version_dates(df, versions):
-    """Versiyonlar için en erken tarih bilgisini al"""
-    version_dates = {}
+    """Versiyonlar için en erken tarih bilgisini al - tüm versiyonlar tek groupby geçişinde"""
+    date_column = None
+    for col in ['date', 'review_date', 'timestamp', 'created_at', 'published_at']:
+        if col in df.columns:
+            date_column = col
+            break
     
+    if date_column is None or df.empty:
+        return {version_name: "N/A" for version_name in versions}
+    
+    try:
+        first_seen = version_timeline(df, version_column='version', date_column=date_column)['first_seen']
+    except Exception:
+        return {version_name: "N/A" for version_name in versions}
+    
+    version_dates = {}
     for version_name in versions:
-        version_data = df[df['version'] == version_name]
-        
-        if len(version_data) > 0:
-            date_column = None
-            for col in ['date', 'review_date', 'timestamp', 'created_at', 'published_at']:
-                if col in version_data.columns:
-                    date_column = col
-                    break
-            
-            if date_column:
-                try:
-                    dates = pd.to_datetime(version_data[date_column], errors='coerce')
-                    valid_dates = dates.dropna()
-                    
-                    if len(valid_dates) > 0:
-                        earliest_date = valid_dates.min()
-                        formatted_date = earliest_date.strftime('%m.%y')
-                        version_dates[version_name] = formatted_date
-                    else:
-                        version_dates[version_name] = "N/A"
-                except:
-                    version_dates[version_name] = "N/A"
-            else:
-                version_dates[version_name] = "N/A"
-        else:
-            version_dates[version_name] = "N/A"
+        earliest_date = first_seen.get(version_name)
+        version_dates[version_name] = earliest_date.strftime('%m.%y') if pd.notna(earliest_date) else "N/A"
     
     return version_dates
 
@@ -73,95 +53,72 @@ def format_version_with_date(version, date_str):
         return version
 
 def scan_csv_files():
-    """Mevcut dizindeki CSV dosyalarını tara"""
+    """Mevcut dizindeki veri dosyalarını (CSV/Parquet/Arrow) tara"""
     csv_files = []
     
-    # Mevcut dizindeki CSV dosyalar
+    # Mevcut dizindeki veri dosyaları
     for file in os.listdir('.'):
-        if file.endswith('.csv'):
+        if is_data_file(file):
             csv_files.append(file)
     
     return csv_files
 
+def read_platform_file(source, platform):
+    """Dosyadan sadece analizin kullandığı sütunları oku (Parquet/Arrow'da diğer sütunlar diskten okunmaz)"""
+    return read_reviews_file(source, columns=schema_source_columns(ANALYSIS_COLUMNS[platform]))
+
+def prepare_platform_frame(df, platform):
+    """Yüklenen veriyi ortak yorum şemasına getir - eksik sütunlar takma adlardan veya varsayılandan"""
+    df['platform'] = platform
+    # Analizde boş tarih/puan uydurulmaz: eksikler NaT/NaN kalır ve analizde elenir
+    df = standardize_reviews(df, columns=ANALYSIS_COLUMNS[platform], defaults={'date': None, 'rating': None})
+    df, _ = compact_reviews(df)
+    return df
+
 @st.cache_data
-def load_and_prepare_data(play_file=None, app_file=None, uploaded_play=None, uploaded_app=None):
+def load_and_prepare_data(play_file=None, app_file=None, uploaded_play=None, uploaded_app=None,
+                          stored_play_app=None, stored_app_app=None):
     """Hem Play Store hem App Store verilerini yükle ve hazırla - CACHED"""
     
     df_play = pd.DataFrame()
     df_app = pd.DataFrame()
     
     # Play Store verisi yükle
-    if uploaded_play is not None:
+    if stored_play_app:
         try:
-            df_play = pd.read_csv(uploaded_play)
-            df_play['platform'] = 'Play Store'
-            
-            if 'app_version' in df_play.columns and 'version' not in df_play.columns:
-                df_play['version'] = df_play['app_version']
-            elif 'version' not in df_play.columns:
-                df_play['version'] = 'Unknown'
-                
+            df_play = prepare_platform_frame(get_review_store().load_reviews(platform='Play Store', app=stored_play_app), 'Play Store')
+            st.success(f"✅ Play Store verisi veritabanından yüklendi: {len(df_play)} kayıt ({stored_play_app})")
+        except Exception as e:
+            st.error(f"❌ Play Store veritabanı okuma hatası: {e}")
+    elif uploaded_play is not None:
+        try:
+            df_play = prepare_platform_frame(read_platform_file(uploaded_play, 'Play Store'), 'Play Store')
             st.success(f"✅ Play Store dosyası yüklendi: {len(df_play)} kayıt")
         except Exception as e:
             st.error(f"❌ Play Store dosyası okuma hatası: {e}")
     elif play_file:
         try:
-            df_play = pd.read_csv(play_file)
-            df_play['platform'] = 'Play Store'
-            
-            if 'app_version' in df_play.columns and 'version' not in df_play.columns:
-                df_play['version'] = df_play['app_version']
-            elif 'version' not in df_play.columns:
-                df_play['version'] = 'Unknown'
-                
+            df_play = prepare_platform_frame(read_platform_file(play_file, 'Play Store'), 'Play Store')
             st.success(f"✅ Play Store verisi yüklendi: {len(df_play)} kayıt ({os.path.basename(play_file)})")
         except Exception as e:
             st.error(f"❌ Play Store dosyası okuma hatası: {e}")
     
     # App Store verisi yükle
-    if uploaded_app is not None:
+    if stored_app_app:
         try:
-            df_app = pd.read_csv(uploaded_app)
-            df_app['platform'] = 'App Store'
-            
-            # Gerekli sütunları kontrol et ve oluştur
-            required_columns = ['title', 'content', 'rating', 'version', 'date']
-            for col in required_columns:
-                if col not in df_app.columns:
-                    if col == 'title':
-                        df_app['title'] = ''
-                    elif col == 'content':
-                        df_app['content'] = ''
-                    elif col == 'rating':
-                        df_app['rating'] = 0
-                    elif col == 'version':
-                        df_app['version'] = 'Unknown'
-                    elif col == 'date':
-                        df_app['date'] = ''
-            
+            df_app = prepare_platform_frame(get_review_store().load_reviews(platform='App Store', app=stored_app_app), 'App Store')
+            st.success(f"✅ App Store verisi veritabanından yüklendi: {len(df_app)} kayıt ({stored_app_app})")
+        except Exception as e:
+            st.error(f"❌ App Store veritabanı okuma hatası: {e}")
+    elif uploaded_app is not None:
+        try:
+            df_app = prepare_platform_frame(read_platform_file(uploaded_app, 'App Store'), 'App Store')
             st.success(f"✅ App Store dosyası yüklendi: {len(df_app)} kayıt")
         except Exception as e:
             st.error(f"❌ App Store dosyası okuma hatası: {e}")
     elif app_file:
         try:
-            df_app = pd.read_csv(app_file)
-            df_app['platform'] = 'App Store'
-            
-            # Gerekli sütunları kontrol et ve oluştur
-            required_columns = ['title', 'content', 'rating', 'version', 'date']
-            for col in required_columns:
-                if col not in df_app.columns:
-                    if col == 'title':
-                        df_app['title'] = ''
-                    elif col == 'content':
-                        df_app['content'] = ''
-                    elif col == 'rating':
-                        df_app['rating'] = 0
-                    elif col == 'version':
-                        df_app['version'] = 'Unknown'
-                    elif col == 'date':
-                        df_app['date'] = ''
-            
+            df_app = prepare_platform_frame(read_platform_file(app_file, 'App Store'), 'App Store')
             st.success(f"✅ App Store verisi yüklendi: {len(df_app)} kayıt ({os.path.basename(app_file)})")
         except Exception as e:
             st.error(f"❌ App Store dosyası okuma hatası: {e}")
@@ -191,7 +148,9 @@ def analyze_platform_data(df_play, df_app, max_versions=15):
         df_clean = df_clean.dropna(subset=['rating'])
         
         # En popüler versiyonları al
-        version_counts = df_clean['version'].value_counts().head(max_versions)
+        # category sütunlarda elenmiş versiyonlar 0 sayıyla döner - sadece gözlenenler
+        version_counts = df_clean['version'].value_counts()
+        version_counts = version_counts[version_counts > 0].head(max_versions)
         top_versions_unsorted = version_counts.index.tolist()
         
         # Versiyonları doğal sıralama ile sırala
@@ -243,6 +202,7 @@ def analyze_platform_data(df_play, df_app, max_versions=15):
 
 def create_platform_rating_pie_charts(platform_data):
     """Her platform için genel rating dağılımı pie chart'ı"""
+    import plotly.graph_objects as go
     
     platforms = list(platform_data.keys())
     
@@ -302,6 +262,7 @@ def create_platform_rating_pie_charts(platform_data):
 
 def create_version_rating_analysis(platform_data):
     """Versiyon bazında rating analizi"""
+    import plotly.graph_objects as go
     
     platforms = list(platform_data.keys())
     
@@ -411,6 +372,7 @@ def create_version_rating_analysis(platform_data):
 
 def create_rating_trend_analysis(platform_data):
     """Rating trend analizi"""
+    import plotly.graph_objects as go
     
     platforms = list(platform_data.keys())
     
@@ -499,6 +461,7 @@ def create_rating_trend_analysis(platform_data):
 
 def create_heatmap_analysis(platform_data):
     """Heatmap analizi"""
+    import plotly.graph_objects as go
     
     platforms = list(platform_data.keys())
     
@@ -656,14 +619,16 @@ def main():
         # Dosya seçim yöntemi
         file_source = st.radio(
             "📂 Veri kaynağını seçin:",
-            ["📂 Mevcut dosyalardan seç", "📤 Dosya yükle"],
-            help="Mevcut dosyalardan seçin veya yeni dosya yükleyin"
+            ["📂 Mevcut dosyalardan seç", "📤 Dosya yükle", "🗄️ Veritabanından seç"],
+            help="Mevcut dosyalardan seçin, yeni dosya yükleyin veya kayıtlı yorumları kullanın"
         )
         
         play_file = None
         app_file = None
         uploaded_play = None
         uploaded_app = None
+        stored_play_app = None
+        stored_app_app = None
         
         if file_source == "📂 Mevcut dosyalardan seç":
             # Mevcut CSV dosyalarını tara
@@ -692,21 +657,37 @@ def main():
                 else:
                     st.info("App Store dosyası bulunamadı")
             else:
-                st.warning("❌ CSV dosyası bulunamadı!")
+                st.warning("❌ CSV / Parquet / Arrow dosyası bulunamadı!")
+        
+        elif file_source == "🗄️ Veritabanından seç":
+            try:
+                stored_apps = get_review_store().list_apps()
+            except Exception as e:
+                st.error(f"❌ Veritabanı okunamadı: {e}")
+                stored_apps = pd.DataFrame(columns=['platform', 'app'])
+            
+            play_apps = stored_apps.loc[stored_apps['platform'] == 'Play Store', 'app'].tolist()
+            app_apps = stored_apps.loc[stored_apps['platform'] == 'App Store', 'app'].tolist()
+            
+            if play_apps or app_apps:
+                stored_play_app = st.selectbox("📱 Play Store uygulaması:", [None] + play_apps)
+                stored_app_app = st.selectbox("🍎 App Store uygulaması:", [None] + app_apps)
+            else:
+                st.warning("❌ Veritabanında kayıtlı yorum yok - önce scraping yapın")
         
         else:  # Dosya yükleme
             st.subheader("📤 Dosya Yükleme")
             
             uploaded_play = st.file_uploader(
-                "📱 Play Store CSV dosyası:",
-                type=['csv'],
+                "📱 Play Store dosyası (CSV / Parquet / Arrow):",
+                type=UPLOAD_TYPES,
                 help="rating, version/app_version sütunları gerekli",
                 key="play_upload"
             )
             
             uploaded_app = st.file_uploader(
-                "🍎 App Store CSV dosyası:",
-                type=['csv'],
+                "🍎 App Store dosyası (CSV / Parquet / Arrow):",
+                type=UPLOAD_TYPES,
                 help="rating, version sütunları gerekli",
                 key="app_upload"
             )
@@ -755,7 +736,9 @@ def main():
                 play_file=play_file, 
                 app_file=app_file,
                 uploaded_play=uploaded_play,
-                uploaded_app=uploaded_app
+                uploaded_app=uploaded_app,
+                stored_play_app=stored_play_app,
+                stored_app_app=stored_app_app
             )
         
         if len(df_play) == 0 and len(df_app) == 0:
@@ -921,10 +904,10 @@ PLATFORM BAZINDA VERSİYON ANALİZİ RAPORU
     except Exception as e:
         st.error(f"❌ Analiz sırasında hata oluştu: {str(e)}")
         st.exception(e)
-
-# Footer'u buraya taşıyoruz
-st.markdown("---")
-st.markdown("*📊 Platform Bazında Versiyon Analizi - Interactive Dashboard*")
+    
+    # Footer - import sırasında değil, sadece sayfa çizilirken
+    st.markdown("---")
+    st.markdown("*📊 Platform Bazında Versiyon Analizi - Interactive Dashboard*")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Kalıcı Çeviri Önbelleği (SQLite)
+Çeviriler (normalize edilmiş metin özeti, kaynak dil, hedef dil) anahtarıyla diskte saklanır; çakışan tarih
+aralıklarıyla yeniden çalıştırılan pipeline aynı yorumlar için tekrar Google'a gitmez.
+Toplam boyut bütçeyi aşınca en uzun süredir kullanılmayan çeviriler silinir (LRU).
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.environ.get("TRANSLATION_CACHE_PATH", os.path.join("data", "translation_cache.sqlite3"))
+# Önbellekteki çevirilerin toplam boyutu (UTF-8 bayt) - aşılınca en eski kullanılanlar silinir
+DEFAULT_MAX_BYTES = int(os.environ.get("TRANSLATION_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# Silme, bütçenin bu oranına inene kadar yapılır - her yazımda tekrar silme olmasın
+EVICTION_TARGET_RATIO = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text_hash TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (text_hash, source, target)
+);
+CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used);
+"""
+
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_text(text):
+    """Önbellek için metin normalizasyonu: Unicode NFC, baş/son boşluk ve ardışık boşluklar tek boşluk"""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', str(text))).strip()
+
+def translation_cache_key(text, source, target):
+    """(normalize metin özeti, kaynak dil, hedef dil) - dil belirtilmemişse 'auto'"""
+    text_hash = hashlib.blake2b(normalize_text(text).encode('utf-8'), digest_size=16).hexdigest()
+    return text_hash, str(source or 'auto').lower().strip(), str(target or 'tr').lower().strip()
+
+class TranslationCache:
+    """SQLite tabanlı, boyutla sınırlı LRU çeviri önbelleği - tek bağlantı, kilitle thread güvenli"""
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM translations").fetchone()[0]
+
+    def get(self, text, source, target):
+        """Önbellekteki çeviri - yoksa None"""
+        return self.get_many([text], source, target)[0]
+
+    def _select(self, keys, column):
+        """{anahtar: sütun değeri} - SQLite parametre sınırı için parça parça sorgulanır"""
+        found = {}
+        for start in range(0, len(keys), 300):
+            chunk = keys[start:start + 300]
+            conditions = " OR ".join("(text_hash = ? AND source = ? AND target = ?)" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT text_hash, source, target, {column} FROM translations WHERE {conditions}",
+                [value for key in chunk for value in key]
+            ).fetchall()
+            found.update({(text_hash, src, dest): value for text_hash, src, dest, value in rows})
+        return found
+
+    def get_many(self, texts, source, target):
+        """Metin listesinin çevirileri (yoksa None) - tek kilit turu, kullanılanların zamanı güncellenir"""
+        keys = [translation_cache_key(text, source, target) for text in texts]
+        with self.lock:
+            found = self._select(list(dict.fromkeys(keys)), 'translated')
+            if found:
+                now = time.time()
+                self.conn.executemany(
+                    "UPDATE translations SET last_used = ? WHERE text_hash = ? AND source = ? AND target = ?",
+                    [(now, *key) for key in found]
+                )
+                self.conn.commit()
+            results = [found.get(key) for key in keys]
+            hits = sum(result is not None for result in results)
+            self.stats['hits'] += hits
+            self.stats['misses'] += len(results) - hits
+        return results
+
+    def put(self, text, source, target, translated):
+        """Başarılı çeviriyi yaz - bütçe aşılırsa en eski kullanılanlar silinir"""
+        self.put_many([(text, translated)], source, target)
+
+    def put_many(self, pairs, source, target):
+        """[(metin, çeviri)] listesini yaz"""
+        rows = {}
+        for text, translated in pairs:
+            if translated is None:
+                continue
+            translated = str(translated)
+            rows[translation_cache_key(text, source, target)] = (translated, len(translated.encode('utf-8')))
+        if not rows:
+            return
+
+        with self.lock:
+            replaced = self._select(list(rows), 'size')
+            now = time.time()
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations (text_hash, source, target, translated, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(*key, translated, size, now) for key, (translated, size) in rows.items()]
+            )
+            self.total_bytes += sum(size - replaced.get(key, 0) for key, (_, size) in rows.items())
+            self.stats['writes'] += len(rows)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """En uzun süredir kullanılmayanları bütçenin EVICTION_TARGET_RATIO oranına inene kadar sil"""
+        target_bytes = self.max_bytes * EVICTION_TARGET_RATIO
+        cursor = self.conn.execute("SELECT rowid, size FROM translations ORDER BY last_used")
+        evicted_rows = []
+        freed = 0
+        for rowid, size in cursor:
+            if self.total_bytes - freed <= target_bytes:
+                break
+            evicted_rows.append((rowid,))
+            freed += size
+        cursor.close()
+        self.conn.executemany("DELETE FROM translations WHERE rowid = ?", evicted_rows)
+        self.total_bytes -= freed
+        self.stats['evictions'] += len(evicted_rows)
+        logger.info(f"Çeviri önbelleğinden {len(evicted_rows)} kayıt silindi ({freed / 1024:.0f} KB)")
+
+    def summary(self):
+        """Kayıt sayısı, boyut ve bu süreçteki isabet oranı"""
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(self.stats, entries=entries, total_bytes=self.total_bytes, max_bytes=self.max_bytes,
+                        hit_rate=self.stats['hits'] / lookups if lookups else 0.0)
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM translations")
+            self.conn.commit()
+            self.total_bytes = 0
+
+_translation_cache = None
+_translation_cache_lock = threading.Lock()
+
+def get_translation_cache():
+    """Süreç genelindeki çeviri önbelleğini döndür (ilk çağrıda oluşturulur)"""
+    global _translation_cache
+    with _translation_cache_lock:
+        if _translation_cache is None:
+            _translation_cache = TranslationCache()
+        return _translation_cache
@@ -1,19 +1,34 @@
-import streamlit as st
 import pandas as pd
 from datetime import datetime
 from io import StringIO
+import logging
+import sqlite3
 import time
 
+from streamlit_compat import st
+from export_utils import export_to_bytes, render_binary_downloads, write_json_records
+from review_io import UPLOAD_TYPES, read_reviews_file
+from review_store import get_review_store, select_stored_reviews
+from translation_cache import get_translation_cache, normalize_text
 
-TRANSLATOR_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+
+# googletrans (ve httpx) ilk çeviride yüklenir - uygulama açılışını yavaşlatmaz
+TRANSLATOR_AVAILABLE = None
 Translator = None
 
-try:
-    from googletrans import Translator
-    TRANSLATOR_AVAILABLE = True
-except ImportError:
-    TRANSLATOR_AVAILABLE = False
-    Translator = None
+def translator_available():
+    """googletrans'ı gerekirse yükle, kullanılabilir mi döndür"""
+    global Translator, TRANSLATOR_AVAILABLE
+    if TRANSLATOR_AVAILABLE is None:
+        try:
+            from googletrans import Translator
+            TRANSLATOR_AVAILABLE = True
+        except ImportError:
+            TRANSLATOR_AVAILABLE = False
+            Translator = None
+    return TRANSLATOR_AVAILABLE
 
 def detect_text_columns(df):
     """CSV'deki metin sütunlarını otomatik tespit et"""
@@ -66,9 +81,67 @@ def is_turkish_text(text, lang_code=None):
     turkish_ratio = turkish_char_count / total_chars
     return turkish_ratio > 0.05  # %5'ten fazla Türkçe karakter varsa Türkçe kabul et
 
+def open_translation_cache():
+    """Kalıcı çeviri önbelleği - açılamazsa None (çeviri önbelleksiz devam eder)"""
+    try:
+        return get_translation_cache()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Çeviri önbelleği açılamadı, önbelleksiz devam ediliyor: {e}")
+        return None
+
+def lookup_cached_translations(texts, source_lang, target_lang):
+    """Metinlerin önbellekteki çevirileri (yoksa None) - önbellek açılamazsa hepsi None"""
+    cache = open_translation_cache()
+    if cache is None or not texts:
+        return [None] * len(texts)
+    try:
+        return cache.get_many(texts, source_lang, target_lang)
+    except sqlite3.Error as e:
+        logger.warning(f"Çeviri önbelleği okunamadı: {e}")
+        return [None] * len(texts)
+
+def translate_with_cache(text, source_lang, target_lang, translator=None):
+    """
+    Önbellekte varsa oradan, yoksa Google'dan çevir ve önbelleğe yaz.
+    Dönüş: (çeviri, önbellekten mi)
+    """
+    cached = lookup_cached_translations([text], source_lang, target_lang)[0]
+    if cached is not None:
+        return cached, True
+    translator = translator or Translator()
+    result = translator.translate(str(text), src=source_lang or 'auto', dest=target_lang)
+    store_translations([(text, result.text)], source_lang, target_lang)
+    return result.text, False
+
+def store_translations(pairs, source_lang, target_lang):
+    """Başarılı çevirileri [(metin, çeviri)] önbelleğe yaz - önbellek hatası çeviriyi durdurmaz"""
+    cache = open_translation_cache()
+    if cache is None:
+        return
+    try:
+        cache.put_many(pairs, source_lang, target_lang)
+    except sqlite3.Error as e:
+        logger.warning(f"Çeviri önbelleğe yazılamadı: {e}")
+
 def translate_text_batch(texts, source_lang, target_lang='tr', batch_size=10):
-    """Metinleri toplu olarak çevir - İyileştirilmiş hata yönetimi"""
-    if not TRANSLATOR_AVAILABLE:
+    """Metinleri toplu olarak çevir - İyileştirilmiş hata yönetimi, önce kalıcı önbelleğe bakılır"""
+    texts = list(texts)
+    needs_translation = [not pd.isna(text) and bool(str(text).strip()) and source_lang.lower() != target_lang.lower()
+                         for text in texts]
+    cached = lookup_cached_translations([str(text) for text, needed in zip(texts, needs_translation) if needed],
+                                        source_lang, target_lang)
+    cached_iter = iter(cached)
+    cached = [next(cached_iter) if needed else None for needed in needs_translation]
+    
+    def fallback():
+        # Çevrilemeyen metinler orijinal kalır, önbellekte olanlar kullanılır
+        return [cached_text if cached_text is not None else (str(t) if not pd.isna(t) else "")
+                for t, cached_text in zip(texts, cached)]
+    
+    if all(cached_text is not None for cached_text, needed in zip(cached, needs_translation) if needed):
+        return fallback()
+    
+    if not translator_available():
         try:
             st.error("❌ googletrans kütüphanesi kullanılamıyor!")
             st.info("📦 Manuel kurulum deneyin:")
@@ -80,7 +153,7 @@ pip install googletrans==4.0.0rc1
             st.code("pip install googletrans==3.1.0a0")
         except:
             pass
-        return [str(t) if not pd.isna(t) else "" for t in texts]
+        return fallback()
     
     # Translator instance oluşturmayı dene
     try:
@@ -91,27 +164,32 @@ pip install googletrans==4.0.0rc1
             st.info("Çeviri atlanıyor, orijinal metinler korunuyor")
         except:
             pass
-        return [str(t) if not pd.isna(t) else "" for t in texts]
+        return fallback()
     
     translated_texts = []
     
     for i in range(0, len(texts), batch_size):
         batch = texts[i:i+batch_size]
         batch_translated = []
+        network_calls = 0
         
-        for text in batch:
+        for text, cached_text in zip(batch, cached[i:i+batch_size]):
             try:
                 if pd.isna(text) or not str(text).strip():
                     batch_translated.append("")
                 elif source_lang.lower() == target_lang.lower():
                     batch_translated.append(str(text))
+                elif cached_text is not None:
+                    batch_translated.append(cached_text)
                 else:
                     # Retry mekanizması
                     max_retries = 3
+                    network_calls += 1
                     for attempt in range(max_retries):
                         try:
                             result = translator.translate(str(text), src=source_lang, dest=target_lang)
                             batch_translated.append(result.text)
+                            store_translations([(str(text), result.text)], source_lang, target_lang)
                             break
                         except Exception as translate_error:
                             if attempt == max_retries - 1:
@@ -127,7 +205,8 @@ pip install googletrans==4.0.0rc1
                 batch_translated.append(str(text))  # Hata durumunda orijinal metni koru
         
         translated_texts.extend(batch_translated)
-        time.sleep(0.5)  # Rate limiting için kısa bekleme
+        if network_calls:
+            time.sleep(0.5)  # Rate limiting için kısa bekleme
     
     return translated_texts
 
@@ -171,7 +250,7 @@ def translate_reviews(df):
 
         df_result = df.copy()
 
-        if not TRANSLATOR_AVAILABLE:
+        if not translator_available():
             # Kütüphane yoksa orijinal metni koru
             df_result['translated_text'] = df_result[text_column].astype(str).fillna("")
             
@@ -187,66 +266,99 @@ def translate_reviews(df):
             return df_result
 
         # googletrans mevcutsa normal akış
-        translated_texts = []
         skipped_count = 0
         translated_count = 0
         error_count = 0
+        cache_hits = 0
 
-        # Translator test et
-        try:
-            test_translator = Translator()
-            # Basit test çevirisi
-            test_result = test_translator.translate("test", src='en', dest='tr')
-            if not test_result or not hasattr(test_result, 'text'):
-                raise Exception("Translator test başarısız")
-        except Exception as e:
-            df_result['translated_text'] = df_result[text_column].astype(str).fillna("")
-            return df_result
-
-        # Başarılı test sonrası çeviri işlemi
-        for idx, row in df_result.iterrows():
-            text = row[text_column]
-            lang_code = row[lang_column] if lang_column else None
-            
+        # Satırları sınıflandır; çevrilecekler normalize metne göre tekilleştirilir - aynı metin bir kez çevrilir
+        texts = df_result[text_column].tolist()
+        lang_codes = df_result[lang_column].tolist() if lang_column else [None] * len(texts)
+        row_keys = []  # satır başına (tür, normalize metin): 'empty' / 'turkish' / 'error' / 'translate'
+        unique_texts = {}  # normalize metin → ilk görülen orijinal metin
+        for text, lang_code in zip(texts, lang_codes):
             try:
                 if pd.isna(text) or not str(text).strip():
-                    translated_texts.append("")
+                    row_keys.append(('empty', None))
                 elif is_turkish_text(text, lang_code):
-                    translated_texts.append(str(text))
-                    skipped_count += 1
+                    row_keys.append(('turkish', None))
                 else:
-                    # Çeviri işlemi - retry ile
-                    max_retries = 2
-                    success = False
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            translator = Translator()
-                            result = translator.translate(str(text), src='auto', dest='tr')
-                            translated_texts.append(result.text)
-                            translated_count += 1
-                            success = True
-                            break
-                        except Exception as translate_error:
-                            if attempt == max_retries - 1:
-                                # Son deneme başarısız
-                                translated_texts.append(str(text))
-                                error_count += 1
-                            else:
-                                time.sleep(1)
-                    
-                # Progress göster (her 50 öğede bir)
-                if idx % 50 == 0 and idx > 0:
-                    try:
-                        st.info(f"📊 İşlenen: {idx}/{len(df_result)} - Çevrilen: {translated_count}, Türkçe: {skipped_count}, Hata: {error_count}")
-                    except:
-                        pass
-                    time.sleep(0.2)
-                    
-            except Exception as e:
+                    key = normalize_text(text)
+                    row_keys.append(('translate', key))
+                    unique_texts.setdefault(key, str(text))
+            except Exception:
+                row_keys.append(('error', None))
+
+        # Tekil metinler önce kalıcı önbellekte aranır - tek sorgu turu
+        unique_keys = list(unique_texts)
+        cached_keys = set()
+        translations = {}
+        for key, cached_text in zip(unique_keys, lookup_cached_translations(
+                [unique_texts[key] for key in unique_keys], 'auto', 'tr')):
+            if cached_text is not None:
+                translations[key] = cached_text
+                cached_keys.add(key)
+
+        # Translator sadece önbellekte olmayan ilk metinde test edilir - tamamı önbellekteyse ağa çıkılmaz
+        translator_ready = None
+
+        def translator_works():
+            try:
+                test_translator = Translator()
+                # Basit test çevirisi
+                test_result = test_translator.translate("test", src='en', dest='tr')
+                return bool(test_result and hasattr(test_result, 'text'))
+            except Exception:
+                return False
+
+        pending_keys = [key for key in unique_keys if key not in translations]
+        for position, key in enumerate(pending_keys, start=1):
+            if translator_ready is None:
+                translator_ready = translator_works()
+            if not translator_ready:
+                break
+
+            # Çeviri işlemi - retry ile
+            max_retries = 2
+            
+            for attempt in range(max_retries):
+                try:
+                    translator = Translator()
+                    result = translator.translate(unique_texts[key], src='auto', dest='tr')
+                    translations[key] = result.text
+                    store_translations([(unique_texts[key], result.text)], 'auto', 'tr')
+                    break
+                except Exception as translate_error:
+                    if attempt < max_retries - 1:
+                        time.sleep(1)
+            
+            # Progress göster (her 50 çeviride bir)
+            if position % 50 == 0:
+                try:
+                    st.info(f"📊 Çevrilen tekil metin: {position}/{len(pending_keys)}")
+                except:
+                    pass
+                time.sleep(0.2)
+
+        # Çeviriler satırlara dağıtılır - çevrilemeyen satırlar orijinal kalır
+        translated_texts = []
+        for (kind, key), text in zip(row_keys, texts):
+            if kind == 'empty':
+                translated_texts.append("")
+            elif kind == 'turkish':
+                translated_texts.append(str(text))
+                skipped_count += 1
+            elif key in translations:
+                translated_texts.append(translations[key])
+                translated_count += 1
+                cache_hits += key in cached_keys
+            else:
                 translated_texts.append(str(text))
                 error_count += 1
 
+        candidate_rows = sum(kind == 'translate' for kind, _ in row_keys)
+        saved_calls = candidate_rows - len(unique_keys)
+
         df_result['translated_text'] = translated_texts
         
         # İstatistikleri session state'e kaydet
@@ -255,7 +367,10 @@ def translate_reviews(df):
                 'total': len(df_result),
                 'translated': translated_count,
                 'skipped_turkish': skipped_count,
-                'empty_or_error': error_count
+                'empty_or_error': error_count,
+                'from_cache': cache_hits,
+                'unique_texts': len(unique_keys),
+                'saved_calls': saved_calls
             }
             
             # Sonuç özeti göster
@@ -263,6 +378,8 @@ def translate_reviews(df):
                 st.success(f"""
                 ✅ **Çeviri tamamlandı!**
                 - 🌍 Çevrilen: {translated_count}
+                - ♻️ Önbellekten: {cache_hits}
+                - 🔁 Tekrarlanan metin: {saved_calls} çağrı tasarrufu ({len(unique_keys)} tekil metin)
                 - 🇹🇷 Türkçe atlanan: {skipped_count}
                 - ❌ Hata/Boş: {error_count}
                 - 📊 Toplam: {len(df_result)}
@@ -340,22 +457,52 @@ def main():
             index=0,
             help="Türkçe metinleri nasıl tespit edilsin?"
         )
+        
+        st.markdown("---")
+        
+        # Kalıcı çeviri önbelleği
+        st.subheader("♻️ Çeviri Önbelleği")
+        cache = open_translation_cache()
+        if cache is None:
+            st.caption("Önbellek açılamadı - çeviriler önbelleksiz yapılıyor")
+        else:
+            cache_summary = cache.summary()
+            st.caption(f"{cache_summary['entries']:,} çeviri · {cache_summary['total_bytes'] / 1024 / 1024:.1f} / "
+                       f"{cache_summary['max_bytes'] / 1024 / 1024:.0f} MB")
+            if cache_summary['hits'] + cache_summary['misses']:
+                st.caption(f"İsabet oranı: %{cache_summary['hit_rate'] * 100:.0f} "
+                           f"({cache_summary['hits']:,} isabet, {cache_summary['misses']:,} ıska)")
+            if st.button("🗑️ Önbelleği Temizle", key="clear_translation_cache"):
+                cache.clear()
+                st.success("✅ Çeviri önbelleği temizlendi")
     
     # Ana içerik
     tab1, tab2, tab3 = st.tabs(["📁 Dosya Yükleme", "🔧 Gelişmiş Ayarlar", "📊 İstatistikler"])
     
     with tab1:
-        # Dosya yükleme
-        uploaded_file = st.file_uploader(
-            "📁 CSV Dosyası Yükleyin",
-            type=['csv'],
-            help="Çevrilecek metinleri içeren CSV dosyasını yükleyin"
+        data_source = st.radio(
+            "Veri kaynağı:",
+            ["📤 Dosya yükle", "🗄️ Veritabanından seç"],
+            horizontal=True
         )
         
-        if uploaded_file is not None:
+        uploaded_file = None
+        stored_df = None
+        
+        if data_source == "📤 Dosya yükle":
+            # Dosya yükleme
+            uploaded_file = st.file_uploader(
+                "📁 CSV / Parquet / Arrow Dosyası Yükleyin",
+                type=UPLOAD_TYPES,
+                help="Çevrilecek metinleri içeren CSV, Parquet veya Arrow dosyasını yükleyin"
+            )
+        else:
+            stored_df = select_stored_reviews(key="translator")
+        
+        if uploaded_file is not None or stored_df is not None:
             try:
                 # Dosyayı oku
-                df = pd.read_csv(uploaded_file)
+                df = read_reviews_file(uploaded_file) if uploaded_file is not None else stored_df
                 
                 st.success(f"✅ Dosya yüklendi: {len(df)} satır, {len(df.columns)} sütun")
                 
@@ -520,7 +667,7 @@ def main():
                 st.markdown("---")
                 
                 if st.button("🚀 Akıllı Çeviriyi Başlat", type="primary"):
-                    if Translator is None: 
+                    if not translator_available():
                         st.warning("googletrans yok, orijinal metin korunacak")
                     
                     # Boş olmayan metinleri filtrele
@@ -549,56 +696,79 @@ def main():
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    translated_texts = []
                     total_texts = len(df_to_process)
                     turkish_skipped = 0
                     actually_translated = 0
+                    cache_hits = 0
+                    network_calls = 0
                     errors = 0
                     
-                    for idx, (_, row) in enumerate(df_to_process.iterrows()):
-                        text_to_process = str(row[text_column])
-                        
-                        # Dil kodunu belirle
-                        if language_column and language_column in df.columns:
-                            source_lang = str(row[language_column]).strip()
+                    texts = [str(text) for text in df_to_process[text_column]]
+                    if language_column and language_column in df.columns:
+                        source_langs = [str(lang).strip() for lang in df_to_process[language_column]]
+                    else:
+                        source_langs = [source_language] * total_texts
+                    
+                    # 1. geçiş: satırları sınıflandır, çevrilecekleri (normalize metin, kaynak dil) ile tekilleştir
+                    row_keys = []  # satır başına (tür, anahtar): 'turkish' / 'same_language' / 'translate'
+                    unique_requests = {}  # (normalize metin, kaynak dil) → ilk görülen orijinal metin
+                    for text_to_process, source_lang in zip(texts, source_langs):
+                        if skip_turkish and is_turkish_text(text_to_process, source_lang):
+                            row_keys.append(('turkish', None))
+                        elif source_lang.lower() == target_language.lower():
+                            row_keys.append(('same_language', None))
                         else:
-                            source_lang = source_language
-                        
+                            # Dil, translation_cache_key'deki gibi küçük harfe çevrilir - 'EN' ve 'en' aynı istek
+                            key = (normalize_text(text_to_process), str(source_lang or 'auto').lower().strip())
+                            row_keys.append(('translate', key))
+                            unique_requests.setdefault(key, text_to_process)
+                    
+                    # 2. geçiş: her tekil metin bir kez çevrilir (önce kalıcı önbelleğe bakılır)
+                    translations = {}
+                    cached_keys = set()
+                    for idx, (key, text_to_process) in enumerate(unique_requests.items()):
                         try:
-                            # Türkçe kontrolü
-                            if skip_turkish and is_turkish_text(text_to_process, source_lang):
-                                # Türkçe ise atla
-                                translated_texts.append(text_to_process)
-                                turkish_skipped += 1
-                                status_text.text(f"🇹🇷 Türkçe atlandı: {idx + 1}/{total_texts}")
+                            translated_text, from_cache = translate_with_cache(
+                                text_to_process, key[1], target_language)
+                            translations[key] = translated_text
+                            if from_cache:
+                                cached_keys.add(key)
                             else:
-                                # Türkçe değilse çevir
-                                if source_lang.lower() == target_language.lower():
-                                    translated_text = text_to_process
-                                else:
-                                    translator = Translator()
-                                    result = translator.translate(text_to_process, 
-                                                                src=source_lang if source_lang != 'auto' else None, 
-                                                                dest=target_language)
-                                    translated_text = result.text
-                                
-                                translated_texts.append(translated_text)
-                                actually_translated += 1
-                                status_text.text(f"🌍 Çevriliyor: {idx + 1}/{total_texts}")
-                            
-                            # Progress güncelle
-                            progress = (idx + 1) / total_texts
-                            progress_bar.progress(progress)
-                            
-                            # Rate limiting
-                            if idx % batch_size == 0 and idx > 0:
-                                time.sleep(1)
-                            
+                                network_calls += 1
+                            status_text.text(f"{'♻️ Önbellekten' if from_cache else '🌍 Çevriliyor'}: "
+                                             f"{idx + 1}/{len(unique_requests)} tekil metin")
                         except Exception as e:
-                            st.warning(f"⚠️ Satır {idx+1} çeviri hatası: {e}")
+                            st.warning(f"⚠️ Metin {idx+1} çeviri hatası: {e}")
+                        
+                        # Progress güncelle
+                        progress_bar.progress((idx + 1) / len(unique_requests))
+                        
+                        # Rate limiting - önbellekten gelen metinler beklemeye sayılmaz
+                        if network_calls >= batch_size:
+                            time.sleep(1)
+                            network_calls = 0
+                    progress_bar.progress(1.0)
+                    
+                    # 3. geçiş: çeviriler satırlara dağıtılır - çevrilemeyen satırlar orijinal kalır
+                    translated_texts = []
+                    for (kind, key), text_to_process in zip(row_keys, texts):
+                        if kind == 'turkish':
+                            translated_texts.append(text_to_process)
+                            turkish_skipped += 1
+                        elif kind == 'same_language':
+                            translated_texts.append(text_to_process)
+                            actually_translated += 1
+                        elif key in translations:
+                            translated_texts.append(translations[key])
+                            actually_translated += 1
+                            cache_hits += key in cached_keys
+                        else:
                             translated_texts.append(text_to_process)
                             errors += 1
                     
+                    translate_rows = sum(kind == 'translate' for kind, _ in row_keys)
+                    saved_calls = translate_rows - len(unique_requests)
+                    
                     # Çevrilmiş metinleri DataFrame'e ekle
                     df_result = df.copy()
                     df_result['translated_text'] = None
@@ -609,10 +779,21 @@ def main():
                     # Session state'e kaydet
                     st.session_state.translated_df = df_result
                     st.session_state.translation_complete = True
+                    
+                    # Veritabanından geldiyse çevirileri geri yaz (çevrilmeyen satırlar korunur)
+                    if stored_df is not None:
+                        try:
+                            stored_count = get_review_store().upsert_reviews(df_result.loc[df_to_process.index])
+                            st.info(f"🗄️ {stored_count:,} yorumun çevirisi veritabanına kaydedildi")
+                        except Exception as e:
+                            st.warning(f"⚠️ Veritabanı güncellenemedi: {e}")
                     st.session_state.translation_stats = {
                         'total_processed': len(df_to_process),
                         'turkish_skipped': turkish_skipped,
                         'actually_translated': actually_translated,
+                        'from_cache': cache_hits,
+                        'unique_texts': len(unique_requests),
+                        'saved_calls': saved_calls,
                         'errors': errors,
                         'success_rate': (actually_translated / len(df_to_process)) * 100 if len(df_to_process) > 0 else 0
                     }
@@ -620,7 +801,8 @@ def main():
                     st.success(f"""
                     ✅ **Akıllı çeviri tamamlandı!**
                     - 🇹🇷 Türkçe atlandı: {turkish_skipped}
-                    - 🌍 Çevrildi: {actually_translated}
+                    - 🌍 Çevrildi: {actually_translated} (♻️ önbellekten: {cache_hits})
+                    - 🔁 Tekrarlanan metin: {saved_calls} çağrı tasarrufu ({len(unique_requests)} tekil metin)
                     - ❌ Hata: {errors}
                     """)
                 
@@ -711,6 +893,7 @@ def main():
             with col3:
                 error_rate = (stats['errors'] / stats['total_processed']) * 100 if stats['total_processed'] > 0 else 0
                 st.metric("❌ Hata Oranı", f"%{error_rate:.1f}")
+                st.metric("🔁 Tasarruf Edilen Çağrı", stats.get('saved_calls', 0))
             
             # Görselleştirme
             try:
@@ -774,7 +957,7 @@ def main():
             final_df.to_csv(csv_buffer, index=False, encoding='utf-8-sig')
             
             # JSON hazırla
-            json_data = final_df.to_json(orient='records', force_ascii=False, indent=2)
+            json_data = export_to_bytes(write_json_records, final_df)
             
             # Tam CSV hazırla
             full_csv_buffer = StringIO()
@@ -914,7 +1097,7 @@ def main():
                     final_df.to_csv(csv_buffer, index=False, encoding='utf-8-sig')
                     
                     # JSON hazırla
-                    json_data = final_df.to_json(orient='records', force_ascii=False, indent=2)
+                    json_data = export_to_bytes(write_json_records, final_df)
                     
                     # Session state'i güncelle
                     st.session_state.translation_download_files.update({
@@ -984,6 +1167,9 @@ def main():
                     help=f"Tüm {len(df_result.columns)} sütun dahil",
                     key="dl_full_csv"
                 )
+            
+            # Tam veri Parquet / Arrow - diğer modüllere tipleri koruyarak aktarılır
+            render_binary_downloads(df_result, f"translated_full_{download_files['timestamp']}", key="dl_full")
         
         # İndirme sonrası bilgilendirme
         st.markdown("---")
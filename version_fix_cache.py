@@ -0,0 +1,114 @@
+"""
+Versiyon Düzeltme Önbelleği
+process_version_fixing sonucu; girdinin app_version/date (ve varsa uygulama) sütunlarının parmak izi ve algoritma
+parametreleriyle anahtarlanır, süreç genelinde tüm oturumların paylaştığı bayt bütçeli LRU önbellekte tutulur.
+Sadece doldurulmuş versiyon sütunu ve çevrildiyse tarih sütunu saklanır - diğer sütunlar girdiden alınır.
+Önbellek isabetinde girdi kopyalanmaz: diğer sütunlar girdiyle copy-on-write ile paylaşılır, önbellekten dönen
+DataFrame değiştirilirse pandas kendi kopyasını oluşturur (pandas 3'te hep açık, 2.x'te bu modül açar).
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+logger = logging.getLogger(__name__)
+
+# pandas 2.x'te copy-on-write isteğe bağlı - kapalıyken paylaşılan sütunlara yerinde yazmak girdiyi de değiştirirdi
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+DEFAULT_MAX_BYTES = int(os.environ.get("VERSION_FIX_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+def _update_with_column(hasher, series):
+    """Sütunu değerleri kopyalamadan özetle - metin sütunları factorize kodları + benzersiz değerler olarak"""
+    hasher.update(f"{series.name}|{series.dtype}|".encode('utf-8'))
+    if is_datetime64_any_dtype(series):
+        hasher.update(pd.DatetimeIndex(series).asi8.tobytes())
+    elif is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+        hasher.update(np.ascontiguousarray(series.to_numpy()).tobytes())
+    else:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        hasher.update(codes.tobytes())
+        hasher.update('\x1f'.join(map(str, uniques)).encode('utf-8'))
+
+def version_fix_fingerprint(df, columns, params=None):
+    """Girdinin düzeltmeyi etkileyen sütunları ve parametrelerinden anahtar - 1M satırda ~0.1 sn"""
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(json.dumps([len(df), sorted((params or {}).items())], default=str).encode('utf-8'))
+    for column in columns:
+        if column in df.columns:
+            _update_with_column(hasher, df[column])
+    return hasher.hexdigest()
+
+class VersionFixCache:
+    """Bayt bütçeli LRU önbellek - süreç genelinde tüm oturumlar paylaşır"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key, df):
+        """Önbellekte varsa girdiye uygulanmış (düzeltilmiş DataFrame, sonuçlar) döndür, yoksa None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+
+        # Sığ kopya - sadece değişen sütunlar yenilenir, diğerleri girdiyle paylaşılır
+        fixed = df.copy(deep=False)
+        fixed['app_version'] = entry['versions'].set_axis(df.index)
+        if entry['dates'] is not None:
+            fixed['date'] = entry['dates'].set_axis(df.index)
+        return fixed, copy.deepcopy(entry['results'])
+
+    def put(self, key, df, fixed, results):
+        """Düzeltme sonucunu sakla - girdiden farklı olan sütunlar (versiyon, çevrildiyse tarih)"""
+        versions = fixed['app_version'].reset_index(drop=True)
+        dates = fixed['date'].reset_index(drop=True) if fixed['date'].dtype != df['date'].dtype else None
+        size = int(versions.memory_usage(deep=True, index=False))
+        if dates is not None:
+            size += int(dates.memory_usage(deep=True, index=False))
+        if size > self.max_bytes:
+            # Bütçeden büyük sonuç önbelleğe alınmaz
+            return
+
+        entry = {'versions': versions, 'dates': dates, 'results': copy.deepcopy(results), 'bytes': size}
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)['bytes']
+            self.entries[key] = entry
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted['bytes']
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+_version_fix_cache = None
+_version_fix_cache_lock = threading.Lock()
+
+def get_version_fix_cache():
+    """Süreç genelindeki versiyon düzeltme önbelleğini döndür (ilk çağrıda oluşturulur)"""
+    global _version_fix_cache
+    with _version_fix_cache_lock:
+        if _version_fix_cache is None:
+            _version_fix_cache = VersionFixCache()
+        return _version_fix_cache
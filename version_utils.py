@@ -0,0 +1,96 @@
+"""
+Versiyon Yardımcıları
+Versiyon zaman çizelgesi (ilk/son görülme tarihi ve yorum sayısı) tek groupby geçişinde hesaplanır;
+versiyon karşılaştırma ve sıralama, her farklı versiyon metni için bir kez üretilen sayısal anahtarlarla yapılır.
+Versiyon düzeltici ve analiz modülü aynı rutinleri kullanır.
+"""
+
+import logging
+import re
+from functools import lru_cache
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+logger = logging.getLogger(__name__)
+
+# Baştaki sayısal kısım (ör. 'v3.2.1 (build 45)' → '3.2.1') ve ardından gelen ön sürüm etiketi.
+# Etiket harf dışı bir karakterle bitmeli: '-arm64', '-amazon', '-build5' gibi ekler ön sürüm değil, normal sürümdür
+_RELEASE_PATTERN = re.compile(r'^\s*v?(\d+(?:\.\d+)*)(.*)$', re.IGNORECASE)
+_PRE_RELEASE_PATTERN = re.compile(r'^[-._ ]?(dev|alpha|a|beta|b|rc|c|pre|preview)(?![a-z])[-._ ]?(\d*)', re.IGNORECASE)
+
+# Ön sürüm sırası: dev < alpha < beta < rc < normal sürüm
+_PRE_RELEASE_RANK = {'dev': 0, 'alpha': 1, 'a': 1, 'beta': 2, 'b': 2, 'rc': 3, 'c': 3, 'pre': 3, 'preview': 3}
+_FINAL_RANK = 4
+
+@lru_cache(maxsize=65536)
+def _parse_version_key(text):
+    match = _RELEASE_PATTERN.match(text)
+    if not match:
+        # Sayı içermeyen versiyonlar ('Varies with device' vb.) tüm sayısal versiyonlardan önce, kendi aralarında metne göre
+        return (0, (), 0, 0, text)
+
+    release = [int(part) for part in match.group(1).split('.')]
+    # 1.0 ile 1.0.0 aynı versiyon
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    pre_release = _PRE_RELEASE_PATTERN.match(match.group(2))
+    if pre_release:
+        return (1, tuple(release), _PRE_RELEASE_RANK[pre_release.group(1).lower()], int(pre_release.group(2) or 0), '')
+    # Diğer ekli normal sürümler ('4.2.0-amazon', '3.1.0-arm64') aynı sürümün eksiz halinden sonra, eke göre sıralanır;
+    # parantezli build numarası ('3.2.1 (45)') sadece açıklamadır
+    suffix = match.group(2).strip()
+    if suffix.startswith('('):
+        suffix = ''
+    return (1, tuple(release), _FINAL_RANK, 0, suffix.lower())
+
+def version_key(value):
+    """
+    Versiyon metni için sıralanabilir anahtar - her farklı metin bir kez ayrıştırılır (önbellekli).
+    PEP 440 dışı uygulama versiyonları da ('3.2.1 (45)', 'v2.0-beta', '2024.03.01') sayısal olarak sıralanır.
+    """
+    return _parse_version_key(str(value).strip())
+
+def is_version_higher(v1, v2):
+    """v1 > v2 ise True döndür"""
+    return version_key(v1) > version_key(v2)
+
+def compare_versions(v1, v2):
+    """İki versiyonu karşılaştır - v1 <= v2 ise True"""
+    return version_key(v1) <= version_key(v2)
+
+def sort_versions(versions):
+    """Versiyonları doğal sıraya diz (1.0.0 < 1.0.1 < 1.1.0 < 2.0.0) - eşit anahtarlar ilk sıralarını korur"""
+    return sorted(versions, key=version_key)
+
+def version_key_column(series):
+    """
+    Versiyon sütununun sıralama anahtarı olarak yoğun sıra numarası (int32) - her farklı değer bir kez ayrıştırılır.
+    Sütunda sıralama / filtreleme / karşılaştırma bu sayılarla vektörel yapılabilir; boş değerler -1.
+    """
+    codes, uniques = pd.factorize(series.astype(object), use_na_sentinel=True)
+    keys = [version_key(value) for value in uniques]
+    ranks = {key: rank for rank, key in enumerate(sorted(set(keys)))}
+    unique_ranks = pd.array([ranks[key] for key in keys] + [-1], dtype='int32')
+    return pd.Series(unique_ranks[codes].to_numpy(), index=series.index, name=series.name)
+
+def version_timeline(df, version_column='app_version', date_column='date'):
+    """
+    Her versiyon için first_seen, last_seen ve count (satır sayısı) - versiyon başına filtreleme yok.
+
+    Sıra versiyonların veride ilk göründüğü sıradır (unique() ile aynı); NaN versiyonlar atlanır.
+    Tarih sütunu datetime değilse bir kez çevrilir, okunamayan tarihler ilk/son görülmeye katılmaz.
+    """
+    dates = df[date_column]
+    if not is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+
+    frame = pd.DataFrame({'version': df[version_column], 'date': dates})
+    timeline = frame.groupby('version', sort=False, observed=True)['date'].agg(
+        first_seen='min',
+        last_seen='max',
+        count='size',
+    )
+    timeline.index.name = version_column
+    return timeline